@@ -0,0 +1,141 @@
+import datetime
+
+
+class Calendar:
+
+    """
+    Represents the working calendar of a Project. The schedule of the Project is computed in working days :
+    a task starting at the day 3 starts on the 4th working day of the Project. The Calendar converts these days
+    to real dates, skipping the days that are not worked (the weekends and the holidays).
+    The conversions use lookup tables, computed once and extended when later dates are needed,
+    so converting a day or a date is done in constant time.
+
+    These are the fields of the class :
+    - DATE_FORMAT : The format used to display the dates.
+
+    These are the fields of a Calendar :
+    - start_date : The date at which the Project starts. If it is not a working day, the Project starts
+                   at the next working day.
+    - working_days : The days of the week that are worked, as a tuple of numbers (0 is Monday and 6 is Sunday).
+    - holidays : The set of the dates that are not worked even if they are working days.
+    - dates : The lookup table of the dates. dates[i] is the date of the working day i.
+    - days : The cumulative lookup table of the working days. days[i] is the number of working days
+             between the start_date (included) and the i-th day after it (excluded).
+    """
+
+    DATE_FORMAT = "%d/%m/%Y"
+
+    def __init__(self, start_date, working_days=(0, 1, 2, 3, 4), holidays=()):
+        """
+        Creates a new Calendar
+        :param start_date: The date at which the Project starts
+        :param working_days: The days of the week that are worked (0 is Monday and 6 is Sunday).
+                             By default, they are the days from Monday to Friday
+        :param holidays: The dates that are not worked even if they are working days. By default, there are none
+        :raise ValueError: If no day of the week is worked, if a working day is not a number from 0 to 6,
+                           or if a holiday is not a date
+        """
+        # Without a working day, the lookup tables would be extended forever looking for the next one
+        if len(working_days) == 0:
+            raise ValueError("At least one day of the week must be worked")
+        if any(type(week_day) is not int or not 0 <= week_day <= 6 for week_day in working_days):
+            raise ValueError(f"The working days {working_days} must be numbers from 0 (Monday) to 6 (Sunday)")
+        if any(not isinstance(holiday, datetime.date) or isinstance(holiday, datetime.datetime)
+               for holiday in holidays):
+            raise ValueError("The holidays must be dates")
+        self.start_date = start_date
+        self.working_days = tuple(sorted(set(working_days)))
+        self.holidays = set(holidays)
+        self.dates = []
+        self.days = [0]
+        # A year is enough for most projects, the tables are extended when it is not
+        self.extend(366)
+
+    @staticmethod
+    def from_data(data):
+        """
+        Creates a Calendar from its representation in the JSON file of a Project
+        :param data: A dictionary containing the start_date, the working_days and the holidays of the Calendar.
+                     Dates are strings in the ISO format (YYYY-MM-DD)
+        :return: The Calendar
+        """
+        return Calendar(datetime.date.fromisoformat(data["start_date"]),
+                        data.get("working_days", (0, 1, 2, 3, 4)),
+                        [datetime.date.fromisoformat(holiday) for holiday in data.get("holidays", [])])
+
+    def to_data(self):
+        """
+        Gives the representation of the Calendar in the JSON file of a Project
+        :return: A dictionary that can be given to Calendar.from_data
+        """
+        return {"start_date": self.start_date.isoformat(),
+                "working_days": list(self.working_days),
+                "holidays": sorted(holiday.isoformat() for holiday in self.holidays)}
+
+    def is_working_date(self, date):
+        """
+        Tells whether a date is worked
+        :param date: The date
+        :return: True if the date is a working day and not a holiday, False otherwise
+        """
+        return date.weekday() in self.working_days and date not in self.holidays
+
+    def extend(self, count):
+        """
+        Extends the lookup tables with the given number of calendar days
+        :param count: The number of calendar days to add
+        :return: None
+        """
+        date = self.start_date + datetime.timedelta(days=len(self.days) - 1)
+        for _ in range(count):
+            if self.is_working_date(date):
+                self.dates.append(date)
+            self.days.append(len(self.dates))
+            date += datetime.timedelta(days=1)
+
+    def get_date(self, day):
+        """
+        Gives the date of a working day of the Project
+        :param day: The number of working days since the beginning of the Project
+        :return: The date at which this working day is worked
+        """
+        if day >= len(self.dates):
+            # Every week has at least one working day, and each holiday not reached yet removes at most one,
+            # so the tables are extended once, by enough days. We at least double their size,
+            # so that extending them takes a constant time on average
+            end_date = self.start_date + datetime.timedelta(days=len(self.days) - 1)
+            later_holidays = sum(holiday >= end_date for holiday in self.holidays)
+            missing = day + 1 - len(self.dates) + later_holidays
+            self.extend(max(-(-missing // len(self.working_days)) * 7, len(self.days)))
+        return self.dates[day]
+
+    def get_finish_date(self, day):
+        """
+        Gives the date at which a task finishing at a given working day is finished.
+        A task finishing at the day 5 is worked until the end of the day 4
+        :param day: The number of working days since the beginning of the Project at which the task finishes
+        :return: The date of the last day worked on the task
+        """
+        return self.get_date(max(day - 1, 0))
+
+    def get_day(self, date):
+        """
+        Gives the working day of the Project corresponding to a date. If the date is not worked,
+        it is the next working day
+        :param date: The date. It must not be before the start_date
+        :return: The number of working days between the start_date and the date
+        """
+        offset = (date - self.start_date).days
+        if offset < 0:
+            raise ValueError(f"The date {date} is before the start of the project")
+        if offset >= len(self.days):
+            self.extend(max(offset + 1 - len(self.days), len(self.days)))
+        return self.days[offset]
+
+    def format_date(self, day):
+        """
+        Gives the date of a working day of the Project as a string
+        :param day: The number of working days since the beginning of the Project
+        :return: The date, formatted with DATE_FORMAT
+        """
+        return self.get_date(day).strftime(self.DATE_FORMAT)
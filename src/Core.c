@@ -11,172 +11,796 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <stdbool.h>
+#include <stdint.h>
+#include <math.h>
+#include <pthread.h>
 
 // struct for tasks
+// the tasks are stored as a struct of arrays : the values of the task with the id i are at the position i of each array
+// successors and ancestors use a compressed sparse row layout : the successors of the task i are
+// successors[successorOffsets[i]], ..., successors[successorOffsets[i] + successorCounts[i] - 1]
+// there may be some unused room after the successors of a task, this is why the counts are stored with the offsets
+// the type and the lag of each dependency are stored at the same position as the dependency, on both sides
 typedef struct Tasks {
-    char* name;
-    struct Tasks **successors;
-    struct Tasks **ancestors;
-    int id;
-    int successorCount;
-    int ancestorCount;
-    int index;
-    int duration;
-    int earlier;
-    int later;
-    bool isCritical;
+    int idCount;
+    int* successorOffsets;
+    int* successorCounts;
+    int* successors;
+    int* successorTypes;
+    int* successorLags;
+    int* ancestorOffsets;
+    int* ancestorCounts;
+    int* ancestors;
+    int* ancestorTypes;
+    int* ancestorLags;
+    int* duration;
+    int* index;
+    int* earlier;
+    int* later;
+    int* isCritical;
+    int* earlierFinish;
+    int* laterFinish;
+    int* totalFloat;
+    int* freeFloat;
+    int* projectEnd;
+    double* position;
 } Tasks;
 /*
 * @brief Gantt pert application allows you to perform the calculations needed to create Gantt and PERT charts
- * @param |X|Count: Numbre of X (Example: successorCount: Number of successors ).
+ * @param idCount: Number of ids. Every array of values has this length, but some ids may not be used.
+ * @param |X|Offsets: Position of the first X of each task in the X array (Example: successorOffsets).
+ * @param |X|Counts: Number of X of each task (Example: successorCounts: Number of successors ).
  * @param Tasks: type of task variables.
- * @param seccesors: list of successors.
- * @param ancestors: list of predecessors
- * @param id: id of task.
- * @param index: index of task.
- * @param duration: duration of task.
- * @param earlier: earlier of task.
- * @param later: later of task.
- * @param isCritical: isCritical of task.
+ * @param seccesors: ids of the successors.
+ * @param ancestors: ids of the predecessors
+ * @param |X|Types: type of each dependency (FINISH_TO_START, START_TO_START, FINISH_TO_FINISH or START_TO_FINISH).
+ * @param |X|Lags: lag of each dependency, the number of days to wait after it is satisfied (it may be negative).
+ * @param index: index of each task.
+ * @param duration: duration of each task.
+ * @param earlier: earlier of each task.
+ * @param later: later of each task.
+ * @param isCritical: isCritical of each task.
+ * @param earlierFinish: earlier finish of each task (earlier + duration).
+ * @param laterFinish: later finish of each task (later + duration).
+ * @param totalFloat: total float of each task, the number of days it can be delayed without delaying the project.
+ * @param freeFloat: free float of each task, the number of days it can be delayed without delaying any successor.
+ * @param projectEnd: a single value, the number of days needed to complete the project.
+ * @param position: position of each task in the last topological order (it is only used to compare tasks).
  * @return Return in python the diagramme de gantt and PERT.
 */
 
+// function to get the i-th successor of a task
+int successor(Tasks* tasks, int task, int i) {
+    return tasks->successors[tasks->successorOffsets[task] + i];
+}
+
+// function to get the i-th predecessor of a task
+int ancestor(Tasks* tasks, int task, int i) {
+    return tasks->ancestors[tasks->ancestorOffsets[task] + i];
+}
+
+// types of the dependencies between a predecessor and a successor
+#define FINISH_TO_START 0
+#define START_TO_START 1
+#define FINISH_TO_FINISH 2
+#define START_TO_FINISH 3
+
+// function to compute the minimum number of days between the start of a predecessor and the start of its successor
+// every type of dependency is a constraint between these two starts, this is why the passes stay linear
+int dependency_delay(int type, int lag, int ancestorDuration, int successorDuration) {
+    int delay = lag;
+    // the dependency starts at the finish of the predecessor
+    if (type == FINISH_TO_START || type == FINISH_TO_FINISH) {
+        delay += ancestorDuration;
+    }
+    // the dependency constrains the finish of the successor
+    if (type == FINISH_TO_FINISH || type == START_TO_FINISH) {
+        delay -= successorDuration;
+    }
+    return delay;
+}
+
+// same as dependency_delay, with the durations drawn in a sample of a simulation
+double sample_delay(int type, int lag, double ancestorDuration, double successorDuration) {
+    double delay = lag;
+    if (type == FINISH_TO_START || type == FINISH_TO_FINISH) {
+        delay += ancestorDuration;
+    }
+    if (type == FINISH_TO_FINISH || type == START_TO_FINISH) {
+        delay -= successorDuration;
+    }
+    return delay;
+}
+
+// function to get the delay of the i-th predecessor of a task
+int ancestor_delay(Tasks* tasks, int task, int i) {
+    int position = tasks->ancestorOffsets[task] + i;
+    return dependency_delay(tasks->ancestorTypes[position], tasks->ancestorLags[position],
+                            tasks->duration[tasks->ancestors[position]], tasks->duration[task]);
+}
+
+// function to get the delay of the i-th successor of a task
+int successor_delay(Tasks* tasks, int task, int i) {
+    int position = tasks->successorOffsets[task] + i;
+    return dependency_delay(tasks->successorTypes[position], tasks->successorLags[position],
+                            tasks->duration[task], tasks->duration[tasks->successors[position]]);
+}
+
 // function to add an index to a task
-void fill_indice(Tasks *firstTask,Tasks *lastTask, int *firstTaskIndex, int* lastTaskIndex)
+void fill_indice(Tasks* tasks, int firstTask, int lastTask, int *firstTaskIndex, int* lastTaskIndex)
 {
     // we add the index to the first task
-    firstTask->index = *firstTaskIndex;
+    tasks->index[firstTask] = *firstTaskIndex;
     (*firstTaskIndex)++;
     // we check if the first task is the same as the last task
-    while (firstTask->successorCount == 1 && lastTask->id != firstTask->id)
+    while (tasks->successorCounts[firstTask] == 1 && lastTask != firstTask)
     {
-        firstTask = firstTask->successors[0];
-        firstTask->index = *firstTaskIndex;
+        firstTask = successor(tasks, firstTask, 0);
+        tasks->index[firstTask] = *firstTaskIndex;
         (*firstTaskIndex)++;
     }
     // we check if the last task is the same as the first task
-    if (lastTask->id == firstTask->id) {
+    if (lastTask == firstTask) {
         return;
     }
-    lastTask->index = *lastTaskIndex;
+    tasks->index[lastTask] = *lastTaskIndex;
     (*lastTaskIndex)--;
-    while(lastTask->ancestorCount == 1)
+    while(tasks->ancestorCounts[lastTask] == 1)
     {
-        lastTask = lastTask->ancestors[0];
-        lastTask->index = *lastTaskIndex;
+        lastTask = ancestor(tasks, lastTask, 0);
+        tasks->index[lastTask] = *lastTaskIndex;
         (*lastTaskIndex)--;
     }
     // we call the function recursively for the successors
-    for (int i = 0; i < firstTask->successorCount; i++) {
-        fill_indice(firstTask->successors[i], lastTask->ancestors[i], firstTaskIndex, lastTaskIndex);
+    for (int i = 0; i < tasks->successorCounts[firstTask]; i++) {
+        fill_indice(tasks, successor(tasks, firstTask, i), ancestor(tasks, lastTask, i), firstTaskIndex, lastTaskIndex);
     }
 
 }
 
-// function to add a successor to a task
-void add_successor(Tasks* taskAnc, Tasks* taskSucc) {
+// function to add a successor to a task (there must be enough room after the successors and ancestors of the tasks)
+void add_successor(Tasks* tasks, int taskAnc, int taskSucc, int type, int lag) {
     // we add the successor to the list of successors of the task
-    taskAnc->successors[(taskAnc->successorCount)++] = taskSucc;
-    taskSucc->ancestors[(taskSucc->ancestorCount)++] = taskAnc;
+    int position = tasks->successorOffsets[taskAnc] + (tasks->successorCounts[taskAnc])++;
+    tasks->successors[position] = taskSucc;
+    tasks->successorTypes[position] = type;
+    tasks->successorLags[position] = lag;
+    position = tasks->ancestorOffsets[taskSucc] + (tasks->ancestorCounts[taskSucc])++;
+    tasks->ancestors[position] = taskAnc;
+    tasks->ancestorTypes[position] = type;
+    tasks->ancestorLags[position] = lag;
 }
 
-// function to calculate early-Start to each task
-void task_earlier(Tasks* task) {
-    task->earlier = 0;
-    for (int i = 0; i < task->ancestorCount; i++) {
-        //  we calculate the earliest start of the task by adding the duration of the predecessors to the earliest start of the predecessors
-        if (task->earlier < task->ancestors[i]->earlier + task->ancestors[i]->duration) {
-        task->earlier = task->ancestors[i]->earlier + task->ancestors[i]->duration;
+// function to compute a topological order of the tasks reachable from the first task (Kahn's algorithm)
+// order must be able to hold idCount tasks
+// it returns the number of tasks that were put in order
+int topological_order(Tasks* tasks, int firstTask, int* order) {
+    // remaining[id] is the number of ancestors of the task that are not in order yet (-1 if not reached yet)
+    int* remaining = malloc(tasks->idCount * sizeof(int));
+    for (int i = 0; i < tasks->idCount; i++) {
+        remaining[i] = -1;
+    }
+    int count = 0;
+    order[count++] = firstTask;
+    // order is also used as the queue of the algorithm
+    for (int i = 0; i < count; i++) {
+        int task = order[i];
+        for (int j = 0; j < tasks->successorCounts[task]; j++) {
+            int succ = successor(tasks, task, j);
+            if (remaining[succ] < 0) {
+                remaining[succ] = tasks->ancestorCounts[succ];
+            }
+            // every ancestor of the successor is in order, so the successor can be added
+            if (--remaining[succ] == 0) {
+                order[count++] = succ;
+            }
         }
     }
-    // we call the function recursively for the successors
-    for (int i = 0; i < task->successorCount; i++) {
-        task_earlier(task->successors[i]);
+    free(remaining);
+    return count;
+}
+
+// function to check that the tasks of a project that is not created yet have no cycle (Kahn's algorithm)
+// the ancestors of each task are given one task after the other : the ancestors of the task 0 come first,
+// then the ones of the task 1, and so on
+// remaining receives the number of ancestors of each task that could not be put in order :
+// the tasks that still have some are in a cycle, or after one
+// it returns the number of tasks that were put in order, or -1 if an ancestor is not the id of a task
+int check_structure(int taskCount, int* ancestorCounts, int* ancestors, int* remaining) {
+    int edgeCount = 0;
+    for (int i = 0; i < taskCount; i++) {
+        edgeCount += ancestorCounts[i];
+    }
+    for (int i = 0; i < edgeCount; i++) {
+        if (ancestors[i] < 0 || ancestors[i] >= taskCount) {
+            return -1;
+        }
+    }
+    // we need the successors of each task, so we build them in a compressed sparse row layout
+    // the successors of the task i are successors[successorOffsets[i]], ..., successors[successorOffsets[i + 1] - 1]
+    int* successorOffsets = calloc(taskCount + 1, sizeof(int));
+    int* successors = malloc((edgeCount + 1) * sizeof(int));
+    int* order = malloc((taskCount + 1) * sizeof(int));
+    for (int i = 0; i < edgeCount; i++) {
+        successorOffsets[ancestors[i] + 1]++;
+    }
+    for (int i = 0; i < taskCount; i++) {
+        successorOffsets[i + 1] += successorOffsets[i];
+    }
+    // order is used as the position of the next successor of each task while they are added
+    for (int i = 0; i < taskCount; i++) {
+        order[i] = successorOffsets[i];
+    }
+    int position = 0;
+    for (int task = 0; task < taskCount; task++) {
+        for (int j = 0; j < ancestorCounts[task]; j++) {
+            successors[order[ancestors[position++]]++] = task;
+        }
+    }
+    int count = 0;
+    for (int task = 0; task < taskCount; task++) {
+        remaining[task] = ancestorCounts[task];
+        if (remaining[task] == 0) {
+            order[count++] = task;
+        }
+    }
+    // order is also used as the queue of the algorithm
+    for (int i = 0; i < count; i++) {
+        int task = order[i];
+        for (int j = successorOffsets[task]; j < successorOffsets[task + 1]; j++) {
+            if (--remaining[successors[j]] == 0) {
+                order[count++] = successors[j];
+            }
+        }
+    }
+    free(successorOffsets);
+    free(successors);
+    free(order);
+    return count;
+}
+
+// function to compute the earliest start of a task from the earliest starts of its predecessors
+// no task starts before the project, so it is at least 0
+int compute_earlier(Tasks* tasks, int task) {
+    int earlier = 0;
+    for (int j = 0; j < tasks->ancestorCounts[task]; j++) {
+        int start = tasks->earlier[ancestor(tasks, task, j)] + ancestor_delay(tasks, task, j);
+        if (earlier < start) {
+            earlier = start;
+        }
+    }
+    return earlier;
+}
+
+// function to compute the latest start of a task from the latest starts of its successors
+// no task finishes after the project, so it is at most the project end minus the duration of the task
+int compute_later(Tasks* tasks, int task) {
+    int later = *tasks->projectEnd - tasks->duration[task];
+    for (int j = 0; j < tasks->successorCounts[task]; j++) {
+        int start = tasks->later[successor(tasks, task, j)] - successor_delay(tasks, task, j);
+        if (later > start) {
+            later = start;
+        }
+    }
+    return later;
+}
+
+// function to calculate early-Start to each task, the tasks being in topological order
+void forward_pass(Tasks* tasks, int* order, int count) {
+    for (int i = 0; i < count; i++) {
+        tasks->earlier[order[i]] = compute_earlier(tasks, order[i]);
+    }
+}
+
+// function to calculate late-Start to each task, the tasks being in topological order
+// the project end must be up-to-date
+void backward_pass(Tasks* tasks, int* order, int count) {
+    // we go through the tasks in reverse order, so that every successor is computed before the task
+    for (int i = count - 1; i >= 0; i--) {
+        tasks->later[order[i]] = compute_later(tasks, order[i]);
+    }
+}
+
+// function to compute the values of a task that are derived from its earliest and latest starts
+// the earliest starts of its successors and the project end must be up-to-date
+void compute_times(Tasks* tasks, int task) {
+    tasks->earlierFinish[task] = tasks->earlier[task] + tasks->duration[task];
+    tasks->laterFinish[task] = tasks->later[task] + tasks->duration[task];
+    tasks->totalFloat[task] = tasks->later[task] - tasks->earlier[task];
+    tasks->isCritical[task] = tasks->totalFloat[task] == 0;
+    // the last tasks can be delayed until the end of the project
+    int freeFloat = *tasks->projectEnd - tasks->earlierFinish[task];
+    for (int j = 0; j < tasks->successorCounts[task]; j++) {
+        int slack = tasks->earlier[successor(tasks, task, j)] - successor_delay(tasks, task, j) - tasks->earlier[task];
+        if (freeFloat > slack) {
+            freeFloat = slack;
+        }
+    }
+    tasks->freeFloat[task] = freeFloat;
+}
+
+// function to compute the number of days needed to complete the project, it is the latest earliest finish of the tasks
+// it is not always the one of a last task : a task with only start to start successors may finish after them
+// tasks without any predecessor nor successor are not used tasks, they are ignored
+void compute_project_end(Tasks* tasks) {
+    *tasks->projectEnd = 0;
+    for (int i = 0; i < tasks->idCount; i++) {
+        if ((tasks->successorCounts[i] != 0 || tasks->ancestorCounts[i] != 0)
+            && *tasks->projectEnd < tasks->earlier[i] + tasks->duration[i]) {
+            *tasks->projectEnd = tasks->earlier[i] + tasks->duration[i];
+        }
+    }
+}
+
+// function to compute the earliest start, the latest start and the criticality of each task in O(V+E)
+// the topological order is computed once, then a single forward and backward pass are done on it
+// it returns the number of tasks that were scheduled (some tasks are not scheduled if the graph has a cycle)
+int compute_schedule(Tasks* tasks, int firstTask) {
+    int* order = malloc(tasks->idCount * sizeof(int));
+    int count = topological_order(tasks, firstTask, order);
+    forward_pass(tasks, order, count);
+    // the backward pass starts from the project end
+    *tasks->projectEnd = 0;
+    for (int i = 0; i < count; i++) {
+        if (*tasks->projectEnd < tasks->earlier[order[i]] + tasks->duration[order[i]]) {
+            *tasks->projectEnd = tasks->earlier[order[i]] + tasks->duration[order[i]];
+        }
+    }
+    backward_pass(tasks, order, count);
+    for (int i = 0; i < count; i++) {
+        // we compute the finishes, the floats and whether the task is critical (its total float is 0)
+        compute_times(tasks, order[i]);
+        // we keep the order, so that the schedule can be updated later without sorting the tasks again
+        tasks->position[order[i]] = i;
+    }
+    free(order);
+    return count;
+}
+
+// binary heap of tasks, used to visit tasks in topological order
+// the task with the smallest position is at the top, or the task with the biggest one if sign is -1
+typedef struct Heap {
+    int* tasks;
+    int count;
+    double* position;
+    int sign;
+} Heap;
+
+// function to compare two tasks of a heap, it returns true if the first one should be closer to the top
+bool heap_before(Heap* heap, int first, int second) {
+    return heap->sign * heap->position[first] < heap->sign * heap->position[second];
+}
+
+// function to add a task to a heap
+void heap_push(Heap* heap, int task) {
+    int i = heap->count++;
+    // we move the task up while it should be before its parent
+    while (i > 0 && heap_before(heap, task, heap->tasks[(i - 1) / 2])) {
+        heap->tasks[i] = heap->tasks[(i - 1) / 2];
+        i = (i - 1) / 2;
     }
+    heap->tasks[i] = task;
+}
 
+// function to remove the task at the top of a heap, it returns this task
+int heap_pop(Heap* heap) {
+    int top = heap->tasks[0];
+    int last = heap->tasks[--heap->count];
+    int i = 0;
+    // we move the last task down from the top while one of its children should be before it
+    while (2 * i + 1 < heap->count) {
+        int child = 2 * i + 1;
+        if (child + 1 < heap->count && heap_before(heap, heap->tasks[child + 1], heap->tasks[child])) {
+            child++;
+        }
+        if (!heap_before(heap, heap->tasks[child], last)) {
+            break;
+        }
+        heap->tasks[i] = heap->tasks[child];
+        i = child;
+    }
+    heap->tasks[i] = last;
+    return top;
 }
 
-// function to calculate late-Start to each task
-void task_later(Tasks* task) {
-    // we check if the task is the last task
-    if (task->successorCount == 0) {
-        task->later = task->earlier;
+// flags used by update_schedule
+#define IN_FORWARD_HEAP 1
+#define IN_BACKWARD_HEAP 2
+#define VISITED 4
+
+// function to update the schedule after some tasks were modified, without computing it all over again
+// earlierSeeds are the tasks whose earliest start may have changed, laterSeeds the ones whose latest start may have changed
+// changes are propagated in topological order, and only to the tasks whose values really change
+// the positions of the tasks must be a valid topological order
+// endMayDecrease tells that a task finishing at the end of the project was removed
+// it returns the number of tasks that were visited
+int update_schedule(Tasks* tasks, int* earlierSeeds, int earlierSeedCount, int* laterSeeds, int laterSeedCount, bool endMayDecrease) {
+    char* flags = calloc(tasks->idCount, sizeof(char));
+    int* visited = malloc(tasks->idCount * sizeof(int));
+    int visitedCount = 0;
+    Heap heap = {.tasks=malloc(tasks->idCount * sizeof(int)), .count=0, .position=tasks->position, .sign=1};
+    // forward propagation of the earliest starts
+    for (int i = 0; i < earlierSeedCount; i++) {
+        if (!(flags[earlierSeeds[i]] & IN_FORWARD_HEAP)) {
+            flags[earlierSeeds[i]] |= IN_FORWARD_HEAP;
+            heap_push(&heap, earlierSeeds[i]);
+        }
+    }
+    while (heap.count > 0) {
+        int task = heap_pop(&heap);
+        if (!(flags[task] & VISITED)) {
+            flags[task] |= VISITED;
+            visited[visitedCount++] = task;
+        }
+        int earlier = compute_earlier(tasks, task);
+        if (earlier == tasks->earlier[task]) {
+            continue;
+        }
+        tasks->earlier[task] = earlier;
+        for (int j = 0; j < tasks->successorCounts[task]; j++) {
+            int succ = successor(tasks, task, j);
+            if (!(flags[succ] & IN_FORWARD_HEAP)) {
+                flags[succ] |= IN_FORWARD_HEAP;
+                heap_push(&heap, succ);
+            }
+        }
+    }
+    // the project end can only change if the earliest finish of a visited task changed
+    // earlierFinish still contains the old earliest finishes, it is computed again at the end
+    int projectEnd = *tasks->projectEnd;
+    for (int i = 0; i < visitedCount; i++) {
+        int task = visited[i];
+        if (tasks->successorCounts[task] == 0 && tasks->ancestorCounts[task] == 0) {
+            continue;
+        }
+        if (*tasks->projectEnd < tasks->earlier[task] + tasks->duration[task]) {
+            *tasks->projectEnd = tasks->earlier[task] + tasks->duration[task];
+        }
+        if (tasks->earlierFinish[task] == projectEnd && tasks->earlier[task] + tasks->duration[task] < projectEnd) {
+            endMayDecrease = true;
+        }
+    }
+    // a task that finished at the end of the project may finish earlier now, so we look for the new last one
+    if (endMayDecrease && *tasks->projectEnd == projectEnd) {
+        compute_project_end(tasks);
+    }
+    // backward propagation of the latest starts, the task with the biggest position being visited first
+    heap.sign = -1;
+    for (int i = 0; i < laterSeedCount; i++) {
+        if (!(flags[laterSeeds[i]] & IN_BACKWARD_HEAP)) {
+            flags[laterSeeds[i]] |= IN_BACKWARD_HEAP;
+            heap_push(&heap, laterSeeds[i]);
+        }
     }
-    // we calculate the latest start of the task by subtracting the duration of the task to the earliest start of the successors
-    else {
-        task->later = task->successors[0]->later - task->duration;
-        // we check if the latest start of the task is greater than the latest start of the successors
-        for (int i = 1; i < task->successorCount; i++) {
-            if (task->later > task->successors[i]->later - task->duration) {
-                task->later = task->successors[i]->later - task->duration;
+    // no task finishes after the project : the latest start of a task changes with the project end
+    // if it was limited by the old one, or if it finishes after the new one (laterFinish still has the old values)
+    if (projectEnd != *tasks->projectEnd) {
+        for (int i = 0; i < tasks->idCount; i++) {
+            if ((tasks->successorCounts[i] != 0 || tasks->ancestorCounts[i] != 0) && !(flags[i] & IN_BACKWARD_HEAP)
+                && (tasks->laterFinish[i] == projectEnd || tasks->laterFinish[i] > *tasks->projectEnd)) {
+                flags[i] |= IN_BACKWARD_HEAP;
+                heap_push(&heap, i);
             }
         }
     }
-    // we call the function recursively for the predecessors
-    for (int i = 0; i < task->ancestorCount; i++) {
-        task_later(task->ancestors[i]);
+    while (heap.count > 0) {
+        int task = heap_pop(&heap);
+        if (!(flags[task] & VISITED)) {
+            flags[task] |= VISITED;
+            visited[visitedCount++] = task;
+        }
+        int later = compute_later(tasks, task);
+        if (later == tasks->later[task]) {
+            continue;
+        }
+        tasks->later[task] = later;
+        for (int j = 0; j < tasks->ancestorCounts[task]; j++) {
+            int anc = ancestor(tasks, task, j);
+            if (!(flags[anc] & IN_BACKWARD_HEAP)) {
+                flags[anc] |= IN_BACKWARD_HEAP;
+                heap_push(&heap, anc);
+            }
+        }
     }
+    // the free float of the other tasks changes with the project end if it was limited by the old one,
+    // or if it goes beyond the new one
+    if (projectEnd != *tasks->projectEnd) {
+        for (int i = 0; i < tasks->idCount; i++) {
+            if ((tasks->successorCounts[i] != 0 || tasks->ancestorCounts[i] != 0) && !(flags[i] & VISITED)
+                && (tasks->freeFloat[i] == projectEnd - tasks->earlierFinish[i]
+                    || tasks->freeFloat[i] > *tasks->projectEnd - tasks->earlierFinish[i])) {
+                compute_times(tasks, i);
+            }
+        }
+    }
+    // only the visited tasks may have changed their values, and the free float of their predecessors too
+    for (int i = 0; i < visitedCount; i++) {
+        compute_times(tasks, visited[i]);
+        for (int j = 0; j < tasks->ancestorCounts[visited[i]]; j++) {
+            compute_times(tasks, ancestor(tasks, visited[i], j));
+        }
+    }
+    free(flags);
+    free(visited);
+    free(heap.tasks);
+    return visitedCount;
 }
 
-// function to identify critical tasks
-void identify_critical(Tasks* task) {
-    // we check if the earliest start of the task is equal to the latest start of the task
-    task->isCritical = task->earlier == task->later;
-    // we call the function recursively for the successors
-    for (int i = 0; i < task->successorCount; i++) {
-        identify_critical(task->successors[i]);
+// function to compute everything needed to display a project in a single call :
+// the indices of the tasks, their earliest start, their latest start and their criticality
+// it returns the number of tasks that were scheduled
+int schedule(Tasks* tasks, int firstTask, int lastTask, int taskCount) {
+    int firstTaskIndex = 1, lastTaskIndex = taskCount;
+    fill_indice(tasks, firstTask, lastTask, &firstTaskIndex, &lastTaskIndex);
+    return compute_schedule(tasks, firstTask);
+}
+
+// distributions used by simulate
+#define BETA_DISTRIBUTION 0
+#define TRIANGULAR_DISTRIBUTION 1
+// the biggest difference between the earliest and the latest start of a critical task in a simulation
+// durations are not integers, so both values may differ a little because of rounding errors
+#define CRITICAL_TOLERANCE 1e-6
+
+// struct for a Monte Carlo simulation, shared by python and the threads of the simulation
+// the estimates are given for each id, the results are written in projectEnd (one value per sample)
+// and criticalCounts (the number of samples in which each id is critical)
+// progress is the number of samples done, python can read it while the simulation runs
+// python can set cancelled to a non-zero value to stop the simulation
+typedef struct Simulation {
+    int sampleCount;
+    int threadCount;
+    int distribution;
+    unsigned long long seed;
+    double* optimistic;
+    double* mostLikely;
+    double* pessimistic;
+    double* projectEnd;
+    int* criticalCounts;
+    volatile int progress;
+    volatile int cancelled;
+} Simulation;
+
+// random number generator (xoshiro256**), each thread has its own
+// the normal distribution gives values two by two, the second one is kept for the next call
+typedef struct Random {
+    uint64_t state[4];
+    bool hasNormal;
+    double normal;
+} Random;
+
+// function to initialize a random number generator, the state is filled with splitmix64
+void random_init(Random* random, uint64_t seed) {
+    for (int i = 0; i < 4; i++) {
+        seed += 0x9e3779b97f4a7c15ULL;
+        uint64_t z = seed;
+        z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+        z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+        random->state[i] = z ^ (z >> 31);
+    }
+    random->hasNormal = false;
+}
+
+uint64_t rotate_left(uint64_t x, int k) {
+    return (x << k) | (x >> (64 - k));
+}
+
+// function to get a random double in [0, 1)
+double random_double(Random* random) {
+    uint64_t* s = random->state;
+    uint64_t result = rotate_left(s[1] * 5, 7) * 9;
+    uint64_t t = s[1] << 17;
+    s[2] ^= s[0];
+    s[3] ^= s[1];
+    s[1] ^= s[2];
+    s[0] ^= s[3];
+    s[2] ^= t;
+    s[3] = rotate_left(s[3], 45);
+    return (result >> 11) * 0x1.0p-53;
+}
+
+// function to get a random number following the standard normal distribution (Marsaglia polar method)
+double random_normal(Random* random) {
+    if (random->hasNormal) {
+        random->hasNormal = false;
+        return random->normal;
+    }
+    double u, v, s;
+    do {
+        u = 2 * random_double(random) - 1;
+        v = 2 * random_double(random) - 1;
+        s = u * u + v * v;
+    } while (s >= 1 || s == 0);
+    double factor = sqrt(-2 * log(s) / s);
+    random->hasNormal = true;
+    random->normal = v * factor;
+    return u * factor;
+}
+
+// function to get a random number following a gamma distribution with a shape of at least 1 (Marsaglia and Tsang)
+double random_gamma(Random* random, double shape) {
+    double d = shape - 1.0 / 3;
+    double c = 1 / sqrt(9 * d);
+    while (true) {
+        double x, v;
+        do {
+            x = random_normal(random);
+            v = 1 + c * x;
+        } while (v <= 0);
+        v = v * v * v;
+        double u = random_double(random);
+        // this cheaper test accepts most values without computing any logarithm
+        if (u < 1 - 0.0331 * x * x * x * x || log(u) < 0.5 * x * x + d - d * v + d * log(v)) {
+            return d * v;
+        }
+    }
+}
+
+// function to draw the duration of a task from its estimates
+double random_duration(Random* random, int distribution, double optimistic, double mostLikely, double pessimistic) {
+    double width = pessimistic - optimistic;
+    // the duration of the task is certain
+    if (width <= 0) {
+        return mostLikely;
+    }
+    if (distribution == BETA_DISTRIBUTION) {
+        // this is the PERT distribution, both shapes are between 1 and 5
+        double x = random_gamma(random, 1 + 4 * (mostLikely - optimistic) / width);
+        double y = random_gamma(random, 1 + 4 * (pessimistic - mostLikely) / width);
+        return optimistic + width * x / (x + y);
+    }
+    // we invert the cumulative distribution function of the triangular distribution
+    double u = random_double(random);
+    if (u < (mostLikely - optimistic) / width) {
+        return optimistic + sqrt(u * width * (mostLikely - optimistic));
+    }
+    return pessimistic - sqrt((1 - u) * width * (pessimistic - mostLikely));
+}
+
+// struct for a thread of a simulation
+// the thread computes the samples firstSample, firstSample + simulation->threadCount, ...
+typedef struct SimulationThread {
+    Tasks* tasks;
+    Simulation* simulation;
+    int* order;
+    int count;
+    int firstSample;
+    int* criticalCounts;
+} SimulationThread;
+
+// function run by each thread of a simulation
+void* simulate_samples(void* argument) {
+    SimulationThread* thread = argument;
+    Tasks* tasks = thread->tasks;
+    Simulation* simulation = thread->simulation;
+    double* duration = malloc(tasks->idCount * sizeof(double));
+    double* earlier = malloc(tasks->idCount * sizeof(double));
+    double* later = malloc(tasks->idCount * sizeof(double));
+    Random random;
+    for (int sample = thread->firstSample; sample < simulation->sampleCount; sample += simulation->threadCount) {
+        if (simulation->cancelled) {
+            break;
+        }
+        // each sample has its own seed, so the results do not depend on the number of threads
+        random_init(&random, simulation->seed ^ ((uint64_t) sample * 0xd1342543de82ef95ULL));
+        double projectEnd = 0;
+        // forward pass
+        for (int i = 0; i < thread->count; i++) {
+            int task = thread->order[i];
+            duration[task] = random_duration(&random, simulation->distribution, simulation->optimistic[task],
+                                             simulation->mostLikely[task], simulation->pessimistic[task]);
+            earlier[task] = 0;
+            for (int j = 0; j < tasks->ancestorCounts[task]; j++) {
+                int position = tasks->ancestorOffsets[task] + j;
+                int anc = tasks->ancestors[position];
+                double delay = sample_delay(tasks->ancestorTypes[position], tasks->ancestorLags[position],
+                                            duration[anc], duration[task]);
+                if (earlier[task] < earlier[anc] + delay) {
+                    earlier[task] = earlier[anc] + delay;
+                }
+            }
+            if (projectEnd < earlier[task] + duration[task]) {
+                projectEnd = earlier[task] + duration[task];
+            }
+        }
+        // backward pass
+        for (int i = thread->count - 1; i >= 0; i--) {
+            int task = thread->order[i];
+            // no task can finish after the project
+            later[task] = projectEnd - duration[task];
+            for (int j = 0; j < tasks->successorCounts[task]; j++) {
+                int position = tasks->successorOffsets[task] + j;
+                int succ = tasks->successors[position];
+                double delay = sample_delay(tasks->successorTypes[position], tasks->successorLags[position],
+                                            duration[task], duration[succ]);
+                if (later[task] > later[succ] - delay) {
+                    later[task] = later[succ] - delay;
+                }
+            }
+            if (later[task] - earlier[task] < CRITICAL_TOLERANCE) {
+                thread->criticalCounts[task]++;
+            }
+        }
+        simulation->projectEnd[sample] = projectEnd;
+        __atomic_add_fetch(&simulation->progress, 1, __ATOMIC_RELAXED);
     }
+    free(duration);
+    free(earlier);
+    free(later);
+    return NULL;
+}
+
+// function to run a Monte Carlo simulation of the tasks reachable from the first task, on several threads
+// the graph is only read, so all the threads share it, and each thread has its own buffers and random generator
+// it returns the number of samples that were computed (less than sampleCount if the simulation was cancelled),
+// or -1 if a thread could not be created
+int simulate(Tasks* tasks, int firstTask, Simulation* simulation) {
+    int* order = malloc(tasks->idCount * sizeof(int));
+    int count = topological_order(tasks, firstTask, order);
+    int threadCount = simulation->threadCount;
+    pthread_t* threadIds = malloc(threadCount * sizeof(pthread_t));
+    SimulationThread* threads = malloc(threadCount * sizeof(SimulationThread));
+    int startedCount = 0;
+    for (int i = 0; i < threadCount; i++) {
+        threads[i] = (SimulationThread) {.tasks=tasks, .simulation=simulation, .order=order, .count=count,
+                                         .firstSample=i, .criticalCounts=calloc(tasks->idCount, sizeof(int))};
+        if (pthread_create(&threadIds[i], NULL, simulate_samples, &threads[i]) != 0) {
+            // the samples of this thread would never be computed, so we stop the threads already started
+            free(threads[i].criticalCounts);
+            simulation->cancelled = 1;
+            break;
+        }
+        startedCount++;
+    }
+    // we add the counts of every thread started once they are all done
+    for (int i = 0; i < startedCount; i++) {
+        pthread_join(threadIds[i], NULL);
+        for (int j = 0; j < tasks->idCount; j++) {
+            simulation->criticalCounts[j] += threads[i].criticalCounts[j];
+        }
+        free(threads[i].criticalCounts);
+    }
+    free(order);
+    free(threadIds);
+    free(threads);
+    return startedCount == threadCount ? simulation->progress : -1;
 }
 
 // Test
 int main()
 {
-    Tasks* taskSucc1[1];
-    Tasks* taskSucc2[2];
-    Tasks* taskSucc3[2];
-    Tasks* taskSucc4[1];
-    Tasks* taskSucc5[1];
-    Tasks* taskSucc6[1];
-    Tasks* taskSucc7[1];
-    Tasks* taskSucc8[0];
-    Tasks* taskSucc9[1];
-    Tasks* taskSucc10[1];
-    Tasks* taskAnc1[0];
-    Tasks* taskAnc2[1];
-    Tasks* taskAnc3[1];
-    Tasks* taskAnc4[1];
-    Tasks* taskAnc5[1];
-    Tasks* taskAnc6[2];
-    Tasks* taskAnc7[2];
-    Tasks* taskAnc8[1];
-    Tasks* taskAnc9[1];
-    Tasks* taskAnc10[1];
-    Tasks task1 = {.id=1, .successors=taskSucc1, .ancestors=taskAnc1};
-    Tasks task2 = {.id=2, .successors=taskSucc2, .ancestors=taskAnc2};
-    Tasks task3 = {.id=3, .successors=taskSucc3, .ancestors=taskAnc3};
-    Tasks task4 = {.id=4, .successors=taskSucc4, .ancestors=taskAnc4};
-    Tasks task5 = {.id=5, .successors=taskSucc5, .ancestors=taskAnc5};
-    Tasks task6 = {.id=6, .successors=taskSucc6, .ancestors=taskAnc6};
-    Tasks task7 = {.id=7, .successors=taskSucc7, .ancestors=taskAnc7};
-    Tasks task8 = {.id=8, .successors=taskSucc8, .ancestors=taskAnc8};
-    Tasks task9 = {.id=9, .successors=taskSucc9, .ancestors=taskAnc9};
-    Tasks task10 = {.id=10, .successors=taskSucc10, .ancestors=taskAnc10};
-    
-    add_successor(&task1, &task2);
-    add_successor(&task2, &task3);
-    add_successor(&task3, &task4);
-    add_successor(&task4, &task6);
-    add_successor(&task3, &task5);
-    add_successor(&task5, &task6);
-    add_successor(&task6, &task7);
-    add_successor(&task7, &task8);
-    add_successor(&task2, &task10);
-    add_successor(&task10, &task9);
-    add_successor(&task9, &task7);
+    // every task has room for 2 successors and 2 ancestors
+    int successorOffsets[10] = {0, 2, 4, 6, 8, 10, 12, 14, 16, 18};
+    int ancestorOffsets[10] = {0, 2, 4, 6, 8, 10, 12, 14, 16, 18};
+    int successorCounts[10] = {0};
+    int ancestorCounts[10] = {0};
+    int successors[20], ancestors[20];
+    int successorTypes[20], successorLags[20], ancestorTypes[20], ancestorLags[20];
+    int duration[10] = {0}, index[10], earlier[10], later[10], isCritical[10];
+    int earlierFinish[10], laterFinish[10], totalFloat[10], freeFloat[10], projectEnd;
+    double position[10];
+    Tasks tasks = {.idCount=10, .successorOffsets=successorOffsets, .successorCounts=successorCounts,
+                   .successors=successors, .successorTypes=successorTypes, .successorLags=successorLags,
+                   .ancestorOffsets=ancestorOffsets, .ancestorCounts=ancestorCounts, .ancestors=ancestors,
+                   .ancestorTypes=ancestorTypes, .ancestorLags=ancestorLags, .duration=duration, .index=index, .earlier=earlier, .later=later,
+                   .isCritical=isCritical, .earlierFinish=earlierFinish, .laterFinish=laterFinish,
+                   .totalFloat=totalFloat, .freeFloat=freeFloat, .projectEnd=&projectEnd, .position=position};
+
+    add_successor(&tasks, 0, 1, FINISH_TO_START, 0);
+    add_successor(&tasks, 1, 2, FINISH_TO_START, 0);
+    add_successor(&tasks, 2, 3, FINISH_TO_START, 0);
+    add_successor(&tasks, 3, 5, FINISH_TO_START, 0);
+    add_successor(&tasks, 2, 4, FINISH_TO_START, 0);
+    add_successor(&tasks, 4, 5, FINISH_TO_START, 0);
+    add_successor(&tasks, 5, 6, FINISH_TO_START, 0);
+    add_successor(&tasks, 6, 7, FINISH_TO_START, 0);
+    add_successor(&tasks, 1, 9, FINISH_TO_START, 0);
+    add_successor(&tasks, 9, 8, FINISH_TO_START, 0);
+    add_successor(&tasks, 8, 6, FINISH_TO_START, 0);
     
     int firstTaskIndex = 0, lastTaskIndex = 9;
-    fill_indice(&task1, &task8, &firstTaskIndex, &lastTaskIndex);
-    printf("%d %d %d %d %d %d %d %d %d %d", task1.index, task2.index, task3.index, task4.index, task5.index, task6.index, task7.index, task8.index, task9.index, task10.index);
+    fill_indice(&tasks, 0, 7, &firstTaskIndex, &lastTaskIndex);
+    printf("%d %d %d %d %d %d %d %d %d %d", index[0], index[1], index[2], index[3], index[4], index[5], index[6], index[7], index[8], index[9]);
     
     return 0;
 }
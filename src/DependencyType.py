@@ -0,0 +1,57 @@
+from enum import IntEnum, unique
+
+
+@unique
+class DependencyType(IntEnum):
+
+    """
+    Represents the type of the dependency between a Task and one of its upstream Tasks.
+    Each dependency also has a lag : the number of days to wait (it can be negative to overlap the tasks).
+    These are the possible values :
+    - FINISH_TO_START : The Task can start once the upstream Task is finished. This is the default.
+    - START_TO_START : The Task can start once the upstream Task is started.
+    - FINISH_TO_FINISH : The Task can finish once the upstream Task is finished.
+    - START_TO_FINISH : The Task can finish once the upstream Task is started.
+    """
+
+    FINISH_TO_START = 0
+    START_TO_START = 1
+    FINISH_TO_FINISH = 2
+    START_TO_FINISH = 3
+
+    def __str__(self):
+        """
+        Returns the string representation of the DependencyType.
+        :return: The string representation of the DependencyType.
+        """
+        if self == DependencyType.FINISH_TO_START:
+            return "Fin à début"
+        if self == DependencyType.START_TO_START:
+            return "Début à début"
+        if self == DependencyType.FINISH_TO_FINISH:
+            return "Fin à fin"
+        return "Début à fin"
+
+    def from_finish(self):
+        """
+        Tells whether the dependency starts at the finish of the upstream Task
+        :return: True for FINISH_TO_START and FINISH_TO_FINISH, False otherwise
+        """
+        return self == DependencyType.FINISH_TO_START or self == DependencyType.FINISH_TO_FINISH
+
+    def to_finish(self):
+        """
+        Tells whether the dependency constrains the finish of the Task
+        :return: True for FINISH_TO_FINISH and START_TO_FINISH, False otherwise
+        """
+        return self == DependencyType.FINISH_TO_FINISH or self == DependencyType.START_TO_FINISH
+
+    def get_delay(self, lag, upstream_duration, duration):
+        """
+        Gives the minimum number of days between the start of the upstream Task and the start of the Task
+        :param lag: The lag of the dependency
+        :param upstream_duration: The duration of the upstream Task
+        :param duration: The duration of the Task
+        :return: The number of days. It may be negative
+        """
+        return lag + (upstream_duration if self.from_finish() else 0) - (duration if self.to_finish() else 0)
@@ -1,64 +1,97 @@
+import gc
 import os
 import sys
+from contextlib import contextmanager
 
+from Calendar import Calendar
+from DependencyType import DependencyType
+from ProjectLoadError import ProjectLoadError
+from ProjectSummary import ProjectSummary
 from Task import Task
+from TaskList import TaskList
 import json
 
 from TaskStatus import TaskStatus
-from utils import c_functions
+from utils import backends, c_functions, critical_paths, monte_carlo, numpy_functions, portfolio, resource_scheduling, \
+    validation
+
+
+@contextmanager
+def _garbage_collector_paused():
+    """
+    Pauses the garbage collector while many objects are created, for example when a big project is loaded.
+    Otherwise, it runs again and again, and each time it goes through all the objects created so far,
+    even though they are all kept
+    :return: A context manager, the garbage collector runs again as before when it is exited
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
 
 
 class Project:
     """
     Represents a project. A project is a list of tasks, which should be completed before it is over.
-    This class also contains a method to load all the projects.
+    This class also contains a method to load all the projects, and one to schedule them all in the background.
 
     These are the fields of a Project :
     - name : The name of the project
     - file : The name of the file in which the project is stored
     - description : A description of the project
+    - tasks : The TaskList of the tasks of the project. The first one is the beginning task,
+              and the second one is the project task
+    - tasks_by_id : A dictionary associating the id of each task of the project to the task
+    - next_task_id : The id given to the next task added to the project. Ids are never given twice,
+                     so the id of a task does not change when other tasks are removed
     - tasks_count : The number of tasks of the project
     - project_task : The task representing the end of the project. This task should be present on EVERY project
     - beginning_task : The task representing the start of the project. This task should be present on EVERY projects
+    - arena : The TaskArena containing the native representation of the tasks. It is given to the C functions
+    - calendar : The Calendar converting the working days of the schedule to real dates.
+                 It is None if the project has no calendar, the schedule is then only given in days.
+    - resources : A dictionary associating the name of each resource of the project to its capacity
+                  (the amount of this resource available at any time, for example a number of people).
+    - leveled_end : The number of days needed to complete the project when its resources are limited.
+                    It is computed by schedule_resources.
+    - backend : The name of the scheduling backend used to compute the schedule (see utils/backends.py).
+                If it is None, the default backend is used : the C one when the C library is available,
+                and the NumPy one otherwise
+    - undo_steps : The modifications that can be undone, the last one being the last modification.
+                   Each one is the list of the operations undoing it (see TaskArena.operations)
+    - redo_steps : The modifications that were undone and that can be made again, the last one being
+                   the last undone modification. Each one is the list of the operations making it again
     """
 
     projects = []
     non_loadable_projects = []
+    # The PortfolioScheduling of the projects, see start_portfolio_scheduling
+    portfolio_scheduling = None
 
     @staticmethod
     def load_projects():
         """
         Loads the projects. Each project is a JSON file stored in the data/projects directory
-        Projects are stored in the projects list, and non-loadable projects are stored in the non_loadable_projects list
+        Projects are stored in the projects list, and non-loadable projects are stored in the non_loadable_projects list,
+        as ProjectLoadErrors telling why they could not be loaded
         :return: A tuple. The first value is the list of projects,
-                 and the second value is the list of non-loadable projects
+                 and the second value is the list of the ProjectLoadErrors of the non-loadable projects
         """
         projects = []
         non_loadable_projects = []
         for project_file_name in os.listdir("data/projects"):
             try:
                 print(f"Loading {project_file_name}... ", end="")
-                with open("data/projects/" + project_file_name, "r") as file:
-                    project_data = json.load(file)
-                    tasks = [Task(i) for i in range(len(project_data["tasks"]))]
-                    for i, task in enumerate(project_data["tasks"]):
-                        tasks[i].name = task["name"]
-                        tasks[i].description = task["description"]
-                        tasks[i].status = TaskStatus(int(task["status"]))
-                        # Just sharing this random fact : there are actually many convention
-                        # about using snake_case or camelCase in JSON, depending on what languages you use.
-                        # You can find a list there :
-                        # https://stackoverflow.com/questions/5543490/json-naming-convention-snake-case-camelcase-or-pascalcase#answer-25368854
-                        tasks[i].estimated_time = task["estimated_time"]
-                        for upstream_task in task["upstream"]:
-                            tasks[i].add_upstream_task(tasks[upstream_task])
-                    # The first task of the list is the beginning task, and the second one is the project task
-                    projects.append(Project(project_data["name"],
-                                            project_file_name,
-                                            project_data["description"],
-                                            tasks))
+                projects.append(Project.load_project(project_file_name))
             except Exception as e:
-                non_loadable_projects.append(project_file_name)
+                if isinstance(e, ProjectLoadError):
+                    non_loadable_projects.append(e)
+                else:
+                    non_loadable_projects.append(ProjectLoadError(project_file_name,
+                                                                  message=f"{type(e).__name__}: {e}"))
                 print("Failed")
                 print(f"An exception occurred while loading the project {project_file_name}", file=sys.stderr)
                 print(e, file=sys.stderr)
@@ -68,6 +101,138 @@ class Project:
         Project.non_loadable_projects = non_loadable_projects
         return projects, non_loadable_projects
 
+    @staticmethod
+    def load_project(project_file_name):
+        """
+        Loads a single project from its JSON file, stored in the data/projects directory.
+        The project is not scheduled, see load
+        :param project_file_name: The name of the file
+        :return: The Project. A ProjectLoadError is raised if the structure of its tasks is not valid
+        """
+        with open("data/projects/" + project_file_name, "r") as file, _garbage_collector_paused():
+            project_data = json.load(file)
+        tasks_data = project_data["tasks"]
+        # The structure is checked before the tasks are linked, as a cycle or a missing task would break the scheduling
+        upstream = [task["upstream"] for task in tasks_data]
+        validation.validate_structure(project_file_name, upstream)
+        # Just sharing this random fact : there are actually many convention
+        # about using snake_case or camelCase in JSON, depending on what languages you use.
+        # You can find a list there :
+        # https://stackoverflow.com/questions/5543490/json-naming-convention-snake-case-camelcase-or-pascalcase#answer-25368854
+        # Only the dependencies that are not finish to start without lag are stored,
+        # as lists containing the id of the upstream task, the type and the lag
+        project = Project.from_arrays(project_data["name"],
+                                      project_file_name,
+                                      project_data["description"],
+                                      [task["estimated_time"] for task in tasks_data],
+                                      upstream,
+                                      names=[task["name"] for task in tasks_data],
+                                      descriptions=[task["description"] for task in tasks_data],
+                                      statuses=[TaskStatus(int(task["status"])) for task in tasks_data],
+                                      dependencies=[task.get("dependencies", []) for task in tasks_data],
+                                      resources=project_data.get("resources", {}))
+        for task, task_data in zip(project.tasks, tasks_data):
+            # The three-point estimates are optional, they are only used by the simulations
+            if "estimates" in task_data:
+                task.set_estimates(*task_data["estimates"])
+            task.demands = task_data.get("demands", {})
+        # The calendar is optional, without it the dates are not displayed
+        if "calendar" in project_data:
+            project.calendar = Calendar.from_data(project_data["calendar"])
+        return project
+
+    @staticmethod
+    def from_edges(name, file, description, tasks, edges, resources=None):
+        """
+        Creates a project from its tasks and all the edges between them. The tasks are linked all at once :
+        unlike add_upstream_task, linking them does not update anything, and the arena of the project is built
+        in a single pass. The counts and the depths of the tasks are computed in a single pass too, when they are read
+        :param name: The name of the project
+        :param file: The name of the file in which the project is stored
+        :param description: The description of the project
+        :param tasks: The tasks of the project, not linked yet. Their ids should be their positions in the list,
+                      the first one is the beginning task, and the second one is the project task
+        :param edges: The edges, as tuples (upstream id, downstream id) or (upstream id, downstream id,
+                      DependencyType, lag). The upstream tasks of each task are kept in the order of the edges
+        :param resources: The resources of the project, associating their name to their capacity. This is optional
+        :return: The Project
+        """
+        for edge in edges:
+            upstream_task = tasks[edge[0]]
+            downstream_task = tasks[edge[1]]
+            downstream_task.upstream_tasks.append(upstream_task)
+            upstream_task.downstream_tasks.append(downstream_task)
+            if len(edge) > 2 and (edge[2] != DependencyType.FINISH_TO_START or edge[3] != 0):
+                downstream_task.dependencies[upstream_task] = (DependencyType(edge[2]), edge[3])
+        return Project(name, file, description, tasks, resources)
+
+    @staticmethod
+    def from_arrays(name, file, description, estimated_times, upstream, names=None, descriptions=None,
+                    statuses=None, dependencies=None, resources=None):
+        """
+        Creates a project from the values of its tasks, given as one list per field. The task i gets the id i,
+        the first one is the beginning task, and the second one is the project task. See from_edges
+        :param name: The name of the project
+        :param file: The name of the file in which the project is stored
+        :param description: The description of the project
+        :param estimated_times: The estimated_time of each task
+        :param upstream: The list of the ids of the upstream tasks of each task
+        :param names: The name of each task. By default, they are empty
+        :param descriptions: The description of each task. By default, they are empty
+        :param statuses: The TaskStatus of each task. By default, they are all NOT_STARTED
+        :param dependencies: The list of the dependencies of each task that are not finish to start without lag,
+                             as lists containing the id of the upstream task, the DependencyType and the lag.
+                             By default, there are none
+        :param resources: The resources of the project, associating their name to their capacity. This is optional
+        :return: The Project
+        """
+        with _garbage_collector_paused():
+            tasks = [Task(i, estimated_time=estimated_time) for i, estimated_time in enumerate(estimated_times)]
+            for task, task_name, task_description, status in zip(tasks,
+                                                                 names or [""] * len(tasks),
+                                                                 descriptions or [""] * len(tasks),
+                                                                 statuses or [TaskStatus.NOT_STARTED] * len(tasks)):
+                task.name = task_name
+                task.description = task_description
+                task.status = status
+            return Project.from_edges(name, file, description, tasks, Project._edges_of(upstream, dependencies),
+                                      resources)
+
+    @staticmethod
+    def _edges_of(upstream, dependencies=None):
+        """
+        Lists the edges of a project given to from_arrays, in the format used by from_edges.
+        They are generated one by one, so that the edges of a big project are never all stored at once
+        :param upstream: The list of the ids of the upstream tasks of each task
+        :param dependencies: The list of the dependencies of each task that are not finish to start without lag.
+                             This is optional
+        :return: A generator giving the edges
+        """
+        for i, upstream_ids in enumerate(upstream):
+            if dependencies is None or len(dependencies[i]) == 0:
+                for upstream_id in upstream_ids:
+                    yield upstream_id, i
+                continue
+            task_dependencies = {upstream_id: (dependency_type, lag)
+                                 for upstream_id, dependency_type, lag in dependencies[i]}
+            for upstream_id in upstream_ids:
+                yield upstream_id, i, *task_dependencies.get(upstream_id, (DependencyType.FINISH_TO_START, 0))
+
+    @staticmethod
+    def start_portfolio_scheduling(process_count=None):
+        """
+        Starts scheduling every project of the projects list in the background, in worker processes.
+        The summaries of the schedules can then be read with Project.portfolio_scheduling.get_summary
+        :param process_count: The number of worker processes. By default, there is one process per core
+        :return: The PortfolioScheduling
+        """
+        if Project.portfolio_scheduling is not None:
+            Project.portfolio_scheduling.cancel()
+        Project.portfolio_scheduling = portfolio.PortfolioScheduling([project.file for project in Project.projects],
+                                                                     process_count)
+        Project.portfolio_scheduling.start()
+        return Project.portfolio_scheduling
+
     @staticmethod
     def create_project(name, description, file_name):
         """
@@ -92,13 +257,16 @@ class Project:
         Project.projects.remove(project)
         os.remove("data/projects/" + project.file)
 
-    def __init__(self, name, file, description="", tasks=None):
+    def __init__(self, name, file, description="", tasks=None, resources=None):
         """
         Represents a project. A project has a name, a file name, a description.
         A project must have at least 2 tasks :
             * the beginning_task (represents the beginning of the project)
             * the project_task (represents the project ending).
+        It may also have resources, associating the name of each resource to its capacity. By default, there are none
         """
+        if resources is None:
+            resources = {}
         if tasks is None:
             tasks = [Task(0, name), Task(1, name)]
             # We need to link the 2 tasks
@@ -106,52 +274,63 @@ class Project:
         self.name = name
         self.file = file
         self.description = description
-        self.tasks = tasks
+        self.tasks = TaskList(tasks)
+        self.tasks_by_id = {task.id: task for task in tasks}
+        self.next_task_id = max(self.tasks_by_id) + 1
         self.tasks_count = len(self.tasks)
         self.project_task = tasks[1]
         self.beginning_task = tasks[0]
+        self.resources = resources
+        self.calendar = None
+        self.leveled_end = 0
+        # The tasks are not in the arena yet, so the statuses modified here cannot be undone
+        self.update_status()
+        self.arena = c_functions.TaskArena(tasks)
+        self.backend = None
+        self.undo_steps = []
+        self.redo_steps = []
 
     def add_existing_task(self, task, upstream_tasks, create_new_branch):
         """
         Adds an existing task to the project
-        This task should NOT have downstream or upstream tasks
+        This task should NOT have downstream or upstream tasks.
+        During a batch, the indices, the schedule and the statuses are only updated at the end of the batch
         :param task: The task to add to the project
         :param upstream_tasks: The tasks that should be completed before this task
         :param create_new_branch: Whether we should create a new branch for this task
         :return: None
         """
+        # The downstream task of a new branch is found before anything is modified,
+        # so that the project is left unchanged if it cannot be found
         if create_new_branch:
             upstream_task = upstream_tasks.pop()
             downstream_task = upstream_task.downstream_tasks[0]
             # Then we have to create an intersection. The end of the intersection is the end of the branch
             if len(upstream_task.downstream_tasks) == 1:
-                depth = 1
                 last_downstream_task = upstream_task
-                # We find the end of the branch
+                # We find the end of the branch : we leave the intersection containing it when we arrive at a task
+                # joining a task which is not downstream of upstream_task (the reachability index tells it directly,
+                # without counting the intersections entered and left on the way)
                 # (it could be the last one, so we also check the if that it isn't to avoid running into an error)
-                while len(downstream_task.downstream_tasks) != 0 and depth != 0:
-                    # We are entering an intersection
-                    if len(downstream_task.downstream_tasks) > 1:
-                        depth += 1
+                while len(downstream_task.downstream_tasks) != 0:
                     last_downstream_task = downstream_task
                     downstream_task = downstream_task.downstream_tasks[0]
-                    # We are leaving an intersection
-                    if len(downstream_task.upstream_tasks) > 1:
-                        depth -= 1
+                    if len(downstream_task.upstream_tasks) > 1 and \
+                            not all(joined_task is last_downstream_task or upstream_task.is_upstream_of(joined_task)
+                                    for joined_task in downstream_task.upstream_tasks):
+                        break
                 # We don't want to go back if we left the loop because we arrived at the last task
                 if len(downstream_task.downstream_tasks) != 0:
                     downstream_task = last_downstream_task
             else:
-                depth = 1
-                # We find the end of the intersection
-                while depth != 0:
-                    # We are entering an intersection
-                    if len(downstream_task.downstream_tasks) > 1:
-                        depth += 1
+                # We find the end of the intersection : the first task downstream of all its branches.
+                # It may also end other intersections, so the intersections are not counted on the way
+                while not all(branch_task is downstream_task or branch_task.is_upstream_of(downstream_task)
+                              for branch_task in upstream_task.downstream_tasks):
                     downstream_task = downstream_task.downstream_tasks[0]
-                    # We are leaving an intersection
-                    if len(downstream_task.upstream_tasks) > 1:
-                        depth -= 1
+        # The task is only added to the arena once the tasks it is linked to are known
+        self.arena.add_task(task)
+        if create_new_branch:
             downstream_task.add_upstream_task(task)
             # Finally, link task and upstream_task
             task.add_upstream_task(upstream_task)
@@ -177,10 +356,11 @@ class Project:
                         task.add_upstream_task(upstream_task)
         # We add the task to the project
         self.tasks.append(task)
+        self.tasks_by_id[task.id] = task
         self.tasks_count += 1
-        # And finally we fix all the indices
-        #c_functions.fix_indices(self)
-        self.load()
+        # And finally we fix all the indices, and we only update the schedule of the tasks affected by the new task
+        if self.arena.journal is None:
+            self.update_after_modifications()
 
     def add_task(self, name, description, estimated_time, upstream_tasks, create_new_branch):
         """
@@ -192,16 +372,48 @@ class Project:
         :param create_new_branch: Whether to create the task on a new branch
         :return: None
         """
-        task = Task(name=name, description=description, estimated_time=estimated_time, id_=self.tasks_count)
+        task = Task(name=name, description=description, estimated_time=estimated_time, id_=self.next_task_id)
+        self.next_task_id += 1
         self.add_existing_task(task, upstream_tasks, create_new_branch)
         #self.load()
 
+    def get_task(self, task_id):
+        """
+        Gives a task of the project from its id
+        :param task_id: The id of the task
+        :return: The task, or None if there is no task with this id in the project
+        """
+        return self.tasks_by_id.get(task_id)
+
     def remove_task(self, task):
         """
         Removes a task from the project
         :param task: The task to remove
         :return: None
         """
+        self.remove_tasks([task])
+
+    def remove_tasks(self, tasks):
+        """
+        Removes tasks from the project, one after the other. The indices, the schedule and the statuses
+        are only updated once all the tasks are removed, so removing many tasks at once is much faster.
+        During a batch, they are only updated at the end of the batch
+        :param tasks: The tasks to remove. Each one should be removable once the previous ones are removed
+        :return: None
+        """
+        for task in tasks:
+            self.unlink_task(task)
+        # And finally we fix all the indices, and we only update the schedule of the tasks affected by the removal
+        if self.arena.journal is None:
+            self.update_after_modifications()
+
+    def unlink_task(self, task):
+        """
+        Removes a task from the project, and links its upstream and downstream tasks together.
+        The indices, the schedule and the statuses are not updated, see remove_tasks
+        :param task: The task to remove
+        :return: None
+        """
         # This is a branch with a length of 1, so we simply need to remove it
         if len(task.upstream_tasks[0].downstream_tasks) > 1 and len(task.downstream_tasks[0].upstream_tasks) > 1:
             # The task cannot have multiple upstream and downstream tasks
@@ -220,8 +432,9 @@ class Project:
                 downstream_task.add_upstream_task(task.upstream_tasks[0])
             task.remove_upstream_task(task.upstream_tasks[0])
         else:
-            # We need to know at which position the task should be inserted as an upstream task
-            depth = 1
+            # We need to know at which position the task should be inserted as an upstream task.
+            # If the downstream task has no other upstream task, the position does not matter
+            depth = 1 if len(task.downstream_tasks[0].upstream_tasks) > 1 else 0
             last_task = None
             current_task = task.upstream_tasks[0]
             while depth > 0 and not current_task.is_beginning_task:
@@ -239,14 +452,148 @@ class Project:
 
             task.remove_upstream_task(task.upstream_tasks[0])
             task.downstream_tasks[0].remove_upstream_task(task)
-        # We remove the task from the project
-        self.tasks.pop(task.id)
+        # We remove the task from the project. The ids of the other tasks do not change
+        self.arena.remove_task(task)
+        self.tasks.remove(task)
+        del self.tasks_by_id[task.id]
         self.tasks_count -= 1
-        # Then, we have to shift every task id greater than task.id by -1
-        for i in range(task.id, len(self.tasks)):
-            self.tasks[i].id -= 1
-        # And finally we fix all the indices
-        self.load()
+
+    @contextmanager
+    def batch(self):
+        """
+        Groups modifications of the project, to be used in a with statement. In the block, adding and removing tasks
+        does not update the indices, the schedule and the statuses : they are updated once, when the block is left,
+        after the structure of the project is validated. Tasks can also be modified directly in the block
+        (their upstream tasks, their dependencies or their estimated_time).
+        If an exception is raised in the block, or if the project is not valid anymore, every modification made
+        in the block is undone, and the exception is raised again.
+        Batches can be nested, only the outermost one updates the project (or undoes the modifications)
+        :return: A context manager giving the project
+        """
+        if self.arena.journal is not None:
+            yield self
+            return
+        tasks = list(self.tasks)
+        next_task_id = self.next_task_id
+        operations_count = len(self.arena.operations)
+        self.arena.journal = {}
+        try:
+            yield self
+            self.validate_structure()
+        except BaseException:
+            # The tasks get their state back, and everything is computed again
+            self.arena.restore()
+            self.tasks.reset(tasks)
+            self.tasks_by_id = {task.id: task for task in tasks}
+            self.next_task_id = next_task_id
+            self.tasks_count = len(tasks)
+            # The statuses are restored as they were, but the edges were restored without counting the unfinished
+            # tasks again. Only the counts are computed : locking the tasks could change the statuses restored
+            self.count_unfinished_upstream_tasks()
+            # Nothing was modified in the end, so there is nothing to undo
+            del self.arena.operations[operations_count:]
+            self.load()
+            raise
+        self.arena.journal = None
+        self.update_after_modifications()
+
+    def validate_structure(self):
+        """
+        Checks that the tasks of the project still form a directed acyclic graph (see utils/validation.py).
+        While the topological order of the arena is valid, there cannot be any cycle, so the tasks are only
+        gone through when it is not
+        :return: None. A ValueError is raised if the project is not valid
+        """
+        if self.beginning_task not in self.tasks or self.project_task not in self.tasks:
+            raise ValueError(f"The beginning task and the project task of the project {self.name} cannot be removed")
+        if self.arena.order_valid:
+            return
+        positions = {task: position for position, task in enumerate(self.tasks)}
+        try:
+            # A task linked to a task that is not in the project gets a position that does not exist
+            validation.validate_structure(self.file, [[positions.get(upstream_task, -1)
+                                                       for upstream_task in task.upstream_tasks]
+                                                      for task in self.tasks])
+        except ProjectLoadError as e:
+            raise ValueError(f"The tasks of the project {self.name} are not valid anymore :\n{e}") from e
+
+    def update_after_modifications(self):
+        """
+        Fixes the indices, and updates the schedule after tasks were added, removed or modified.
+        Only the tasks affected by the modifications are scheduled again (see update_schedule).
+        The statuses are already up-to-date, they are updated as soon as the tasks are linked (see Task.update_locks).
+        The modifications made since the last update can then be undone all at once (see undo)
+        :return: None
+        """
+        backends.get_backend(self.backend).fix_indices(self)
+        self.update_schedule()
+        if len(self.arena.operations) != 0:
+            self.undo_steps.append(self.arena.operations)
+            self.arena.operations = []
+            # The undone modifications cannot be made again once something else was modified
+            self.redo_steps.clear()
+
+    def undo(self):
+        """
+        Undoes the last modification of the project : the last task added, the last tasks removed,
+        or the last batch (see batch). Only the tasks affected are scheduled again, like after the modification
+        :return: Whether a modification was undone. It is False if there is nothing to undo
+        """
+        if len(self.undo_steps) == 0:
+            return False
+        self.redo_steps.append(self._apply_operations(self.undo_steps[-1]))
+        self.undo_steps.pop()
+        return True
+
+    def redo(self):
+        """
+        Makes the last undone modification of the project again (see undo)
+        :return: Whether a modification was made again. It is False if there is nothing to redo
+        """
+        if len(self.redo_steps) == 0:
+            return False
+        self.undo_steps.append(self._apply_operations(self.redo_steps[-1]))
+        self.redo_steps.pop()
+        return True
+
+    def _apply_operations(self, operations):
+        """
+        Applies the operations undoing some modifications, from the last one to the first one (see undo and redo).
+        They are modifications too, so the arena records the operations undoing them
+        :param operations: The operations (see TaskArena.operations)
+        :return: The operations undoing the operations applied
+        """
+        if self.arena.journal is not None:
+            raise ValueError("The modifications of a project cannot be undone during a batch")
+        for operation in reversed(operations):
+            name, task, *values = operation
+            if name == "add_task":
+                self.arena.add_task(task)
+                self.tasks.append(task)
+                self.tasks_by_id[task.id] = task
+                self.tasks_count += 1
+            elif name == "remove_task":
+                self.arena.remove_task(task)
+                self.tasks.remove(task)
+                del self.tasks_by_id[task.id]
+                self.tasks_count -= 1
+            elif name == "add_edge":
+                downstream_task, index, downstream_index, dependency_type, lag = values
+                downstream_task.add_upstream_task(task, index, dependency_type, lag, downstream_index)
+            elif name == "remove_edge":
+                values[0].remove_upstream_task(task)
+            elif name == "set_dependency":
+                downstream_task, dependency_type, lag = values
+                downstream_task.set_dependency(task, dependency_type, lag)
+            elif name == "set_estimated_time":
+                task.estimated_time = values[0]
+            elif name == "set_status":
+                task.set_status(values[0])
+        inverse_operations = self.arena.operations
+        self.arena.operations = []
+        # There is no operation left, so this does not add a modification to undo
+        self.update_after_modifications()
+        return inverse_operations
 
     def save(self):
         """
@@ -260,11 +607,18 @@ class Project:
                                    "status": 0,
                                    "estimated_time": 0,
                                    "upstream": []} for _ in range(self.tasks_count)]}
-        self.add_tasks_to_data(project_data, self.project_task)
+        if len(self.resources) != 0:
+            project_data["resources"] = self.resources
+        if self.calendar is not None:
+            project_data["calendar"] = self.calendar.to_data()
+        # The tasks are saved at their positions in the tasks list, which are dense unlike their ids.
+        # The tasks get these positions as ids when the project is loaded again
+        positions = {task: position for position, task in enumerate(self.tasks)}
+        self.add_tasks_to_data(project_data, self.project_task, positions)
         with open("data/projects/" + self.file, "w") as file:
             json.dump(project_data, file)
 
-    def add_tasks_to_data(self, project_data, current_task):
+    def add_tasks_to_data(self, project_data, current_task, positions):
         """
         Used by self.save() to add all tasks to the tasks list.
         It adds tasks info on a line to the project_data list.
@@ -273,58 +627,198 @@ class Project:
         It's what is going to be saved in the JSON file.
         The project_data dictionary will be modified at the end of the function
         :param current_task: The task we should start this algorithm at
+        :param positions: A dictionary associating each task to its position in the tasks list of the JSON file
         :return: None
         """
-        while len(current_task.upstream_tasks) == 1 and project_data["tasks"][current_task.id]["name"] == "":
+        while len(current_task.upstream_tasks) == 1 and project_data["tasks"][positions[current_task]]["name"] == "":
             next_task = current_task.upstream_tasks[0]
             # Adding the current task to the next task's upstream_tasks list
-            project_data["tasks"][current_task.id]["upstream"].append(next_task.id)
-            self.load_task_to_data(project_data, current_task)
+            project_data["tasks"][positions[current_task]]["upstream"].append(positions[next_task])
+            self.load_task_to_data(project_data, current_task, positions)
             current_task = next_task
-        if project_data["tasks"][current_task.id]["name"] != "":
+        if project_data["tasks"][positions[current_task]]["name"] != "":
             return
-        self.load_task_to_data(project_data, current_task)
+        self.load_task_to_data(project_data, current_task, positions)
         for task in current_task.upstream_tasks:
-            project_data["tasks"][current_task.id]["upstream"].append(task.id)
+            project_data["tasks"][positions[current_task]]["upstream"].append(positions[task])
             # We skip tasks that have already been managed
-            if project_data["tasks"][task.id]["name"] == "":
-                self.add_tasks_to_data(project_data, task)
+            if project_data["tasks"][positions[task]]["name"] == "":
+                self.add_tasks_to_data(project_data, task, positions)
 
     @staticmethod
-    def load_task_to_data(project_data, task):
+    def load_task_to_data(project_data, task, positions):
         """
         Loads a single task to the JSON data (excluding the upstream field)
         :param project_data: The dictionary representing the JSON root object
         :param task: The task to load
+        :param positions: A dictionary associating each task to its position in the tasks list of the JSON file
         :return: None
         """
-        project_data["tasks"][task.id]["name"] = task.name
-        project_data["tasks"][task.id]["description"] = task.description
-        project_data["tasks"][task.id]["status"] = task.status.value
-        project_data["tasks"][task.id]["estimated_time"] = task.estimated_time
+        task_data = project_data["tasks"][positions[task]]
+        task_data["name"] = task.name
+        task_data["description"] = task.description
+        task_data["status"] = task.status.value
+        task_data["estimated_time"] = task.estimated_time
+        if len(task.demands) != 0:
+            task_data["demands"] = task.demands
+        if len(task.dependencies) != 0:
+            task_data["dependencies"] = [[positions[upstream_task], dependency_type.value, lag]
+                                         for upstream_task, (dependency_type, lag) in task.dependencies.items()]
+        if task.has_estimates():
+            task_data["estimates"] = [task.optimistic_time, task.most_likely_time, task.pessimistic_time]
 
-    def load(self):
+    def load(self, backend=None):
         """
         This function is called when the project is loaded.
-        It sets some information about each task : its index, its earliest and latest start,
-        and whether the task is critical or not
+        It sets some information about each task : its index, its earliest and latest start and finish,
+        its total and free float, and whether the task is critical or not. It also computes the project end
+        :param backend: The name of the scheduling backend to use from now on.
+                        By default, the backend of the project is kept
         :return: None
         """
-        c_functions.fix_indices(self)
-        c_functions.compute_earliest_start(self)
-        c_functions.compute_latest_start(self)
-        c_functions.identify_critical_tasks(self)
-        self.update_status()
+        if backend is not None:
+            self.backend = backend
+        backends.get_backend(self.backend).schedule(self)
+
+    def get_project_end(self):
+        """
+        Gives the number of days needed to complete the project. It is computed with the schedule (see load)
+        :return: The number of days
+        """
+        return self.arena.project_end[0]
+
+    def get_summary(self):
+        """
+        Summarizes the schedule of the project. The project must be loaded first
+        :return: The ProjectSummary
+        """
+        project_end = self.get_project_end()
+        end_date = self.calendar.get_finish_date(project_end) if self.calendar is not None else None
+        # The beginning task and the project task are always critical, they are not counted
+        critical_count = sum(task.is_critical for task in self.tasks) - 2
+        return ProjectSummary(self.file, project_end, end_date, critical_count)
+
+    def get_longest_paths(self, k):
+        """
+        Gives the k longest paths from the beginning task to the project task.
+        The length of a path is the sum of the estimated times of its tasks, so the longest ones are the critical paths
+        :param k: The number of paths
+        :return: The list of the paths, from the longest. Each path is a tuple containing its length
+                 and the list of its tasks
+        """
+        return critical_paths.longest_paths(self, k)
+
+    def get_near_critical_paths(self, days, limit=None):
+        """
+        Gives the paths from the beginning task to the project task that are at most a given number of days
+        shorter than the project (see get_project_end). The project must be loaded first
+        :param days: The number of days
+        :param limit: The maximum number of paths to give, the longest ones are kept. If it is None, there is no limit
+        :return: The list of the paths, from the longest. Each path is a tuple containing its length
+                 and the list of its tasks
+        """
+        return critical_paths.near_critical_paths(self, days, limit)
+
+    def schedule_resources(self, priority="latest_start"):
+        """
+        Computes the leveled_start of each task, the day at which it starts when the resources of the project
+        are limited. Tasks start as soon as their dependencies allow it, by priority, as long as there are enough
+        resources for them. Without resources (or demands), the leveled_start of each task is its earliest_start,
+        unless a dependency lets a task start before its upstream task (see resource_scheduling).
+        The project must be loaded first
+        :param priority: The field of the tasks deciding which one starts first, "latest_start" or "total_float"
+        :return: The number of days needed to complete the project with its resources (also stored in leveled_end)
+        """
+        return resource_scheduling.schedule_resources(self, priority)
+
+    def update_schedule(self):
+        """
+        Updates the earliest and latest start and the criticality of the tasks after some of them were modified
+        (their estimated_time or their upstream tasks). Unlike load(), only the tasks whose values may change
+        are visited, and the propagation stops as soon as values do not change anymore.
+        Indices and statuses are not updated
+        :return: The number of tasks that were visited
+        """
+        return backends.get_backend(self.backend).update_schedule(self)
+
+    def get_scenario_durations(self, delays):
+        """
+        Creates the durations of some what-if scenarios, in which some tasks are delayed.
+        The result can be modified, and then given to evaluate_scenarios
+        :param delays: A list with one dictionary per scenario. Each dictionary associates a Task to its delay (in days)
+        :return: A NumPy array with one row per scenario and one column per task
+                 (the column i is the Task at the position i of the tasks of the project)
+        """
+        if not numpy_functions.available:
+            raise ValueError("NumPy is needed to evaluate scenarios")
+        return numpy_functions.scenario_durations(self, delays)
+
+    def evaluate_scenarios(self, durations):
+        """
+        Computes the schedule of the project for many scenarios at once, without modifying the tasks.
+        Every scenario is computed in the same vectorized pass over a topological order of the tasks
+        :param durations: The durations of the tasks in each scenario. It is a matrix with one row per scenario
+                          and one column per task (the column i is the Task at the position i of the tasks)
+        :return: The ScenarioSchedule containing the earliest and latest starts, the criticality of the tasks
+                 and the end of the project in each scenario
+        """
+        if not numpy_functions.available:
+            raise ValueError("NumPy is needed to evaluate scenarios")
+        return numpy_functions.evaluate_scenarios(self, durations)
+
+    def simulate(self, samples_count, distribution="beta", seed=None, chunk_size=1000):
+        """
+        Runs a Monte Carlo simulation of the project. In each sample, the duration of every task is drawn
+        from its three-point estimates, and the project is scheduled with these durations.
+        The tasks are not modified
+        :param samples_count: The number of samples, at least 1
+        :param distribution: The name of the distribution the durations are drawn from, "beta" or "triangular"
+        :param seed: The seed of the random generator, to get the same results every time. This is optional
+        :param chunk_size: The number of samples computed at once, at least 1. The memory used is proportional to it
+        :return: The SimulationResult, containing the completion date distribution (see get_percentiles)
+                 and the criticality index of each task
+        """
+        if not monte_carlo.available:
+            raise ValueError("NumPy is needed to simulate a project")
+        return monte_carlo.simulate(self, samples_count, distribution, seed, chunk_size)
+
+    def start_simulation(self, samples_count, distribution="beta", seed=None, thread_count=None):
+        """
+        Starts a Monte Carlo simulation of the project in the background, computed by the C functions on all the cores.
+        It does the same as simulate, but it returns immediately. The progress of the simulation can be followed,
+        and the simulation can be cancelled. The project can be modified while it runs
+        :param samples_count: The number of samples, at least 1
+        :param distribution: The name of the distribution the durations are drawn from, "beta" or "triangular"
+        :param seed: The seed of the random generators, to get the same results every time. This is optional
+        :param thread_count: The number of threads. By default, there is one thread per core
+        :return: The NativeSimulation. Its get_result method returns the SimulationResult once it is done
+        """
+        if not c_functions.available:
+            raise ValueError("The C library is needed to run a simulation in the background")
+        simulation = c_functions.NativeSimulation(self, samples_count, distribution, seed, thread_count)
+        simulation.start()
+        return simulation
 
     def update_status(self):
         """
         Update the status of each Task. If at least one upstream_task has a status not set to TaskStatus.FINISHED,
         then the task has the status TaskStatus.LOCKED.
-        If every one of them is finished, then we set the status to be at least TaskStatus.NOT_STARTED
+        If every one of them is finished, then we set the status to be at least TaskStatus.NOT_STARTED.
+        The unfinished upstream tasks of each task are counted again, so this goes through every edge.
+        It is only needed when the tasks were linked without updating the counts (when the project is created) :
+        otherwise, the statuses are updated as soon as a task is linked or changes its status (see Task.update_locks)
+        :return: None
+        """
+        self.count_unfinished_upstream_tasks()
+        # A change of 0 only locks or unlocks the task, and the finished tasks locked lock their downstream tasks
+        Task.update_locks([(task, 0) for task in self.tasks])
+
+    def count_unfinished_upstream_tasks(self):
+        """
+        Counts the unfinished upstream tasks of each task again (see Task.unfinished_upstream_tasks_count),
+        without modifying the statuses. This goes through every edge
         :return: None
         """
         for task in self.tasks:
-            if sum(t.status == TaskStatus.FINISHED for t in task.upstream_tasks) != len(task.upstream_tasks):
-                task.status = TaskStatus.LOCKED
-            elif task.status == TaskStatus.LOCKED:
-                task.status = TaskStatus.NOT_STARTED
+            task.unfinished_upstream_tasks_count = sum(upstream_task.status != TaskStatus.FINISHED
+                                                       for upstream_task in task.upstream_tasks)
@@ -0,0 +1,49 @@
+class ProjectLoadError(Exception):
+
+    """
+    Represents the reason why a project could not be loaded. The structure of the tasks of a project is checked
+    before the project is created (see utils/validation.py), so that a broken file is reported instead of making
+    the scheduling loop forever or crash. These errors are stored in Project.non_loadable_projects.
+
+    These are the fields of a ProjectLoadError :
+    - file : The name of the file of the project.
+    - missing_tasks : The names of the special tasks missing from the project ("beginning task", "project task").
+    - missing_ids : The list of the references to tasks that do not exist, as tuples containing the id of the task
+                    and the upstream id it references.
+    - cycle : The ids of the tasks of a cycle, in order : each task is an upstream task of the next one,
+              and the last one is an upstream task of the first one. It is empty if there is no cycle.
+    - message : The message of the exception raised while the project was loaded, when it is not one of the errors
+                above (for example, a missing field). It is None otherwise.
+    """
+
+    def __init__(self, file, missing_tasks=(), missing_ids=(), cycle=(), message=None):
+        """
+        Creates a new ProjectLoadError
+        :param file: The name of the file of the project
+        :param missing_tasks: The names of the special tasks missing from the project
+        :param missing_ids: The references to tasks that do not exist, as tuples (task id, upstream id)
+        :param cycle: The ids of the tasks of a cycle, in order
+        :param message: The message of another exception raised while the project was loaded. This is optional
+        """
+        self.file = file
+        self.missing_tasks = list(missing_tasks)
+        self.missing_ids = list(missing_ids)
+        self.cycle = list(cycle)
+        self.message = message
+        super().__init__(self.describe())
+
+    def describe(self):
+        """
+        Describes the errors in a few lines, to display them
+        :return: The description
+        """
+        lines = []
+        for task_name in self.missing_tasks:
+            lines.append(f"The {task_name} is missing")
+        for task_id, upstream_id in self.missing_ids:
+            lines.append(f"The task {task_id} has an upstream task {upstream_id} that does not exist")
+        if len(self.cycle) != 0:
+            lines.append("The tasks " + " -> ".join(map(str, self.cycle + self.cycle[:1])) + " form a cycle")
+        if self.message is not None:
+            lines.append(self.message)
+        return "\n".join(lines)
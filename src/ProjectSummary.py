@@ -0,0 +1,28 @@
+class ProjectSummary:
+
+    """
+    Represents the few values of the schedule of a Project that are displayed in the list of the projects.
+    It is small, so that the summaries computed in other processes are sent back quickly (see utils/portfolio.py).
+
+    These are the fields of a ProjectSummary :
+    - file : The name of the file of the Project.
+    - project_end : The number of days needed to complete the Project. It is None if the Project could not be scheduled.
+    - end_date : The date at which the Project is completed, if the Project has a Calendar. It is None otherwise.
+    - critical_count : The number of critical tasks of the Project (the beginning and project tasks are not counted).
+    - error : The message of the exception raised while the Project was scheduled. It is None if there was none.
+    """
+
+    def __init__(self, file, project_end=None, end_date=None, critical_count=0, error=None):
+        """
+        Creates a new ProjectSummary
+        :param file: The name of the file of the Project
+        :param project_end: The number of days needed to complete the Project
+        :param end_date: The date at which the Project is completed. This is optional
+        :param critical_count: The number of critical tasks of the Project
+        :param error: The message of the exception raised while the Project was scheduled. This is optional
+        """
+        self.file = file
+        self.project_end = project_end
+        self.end_date = end_date
+        self.critical_count = critical_count
+        self.error = error
@@ -0,0 +1,332 @@
+from bisect import bisect_right
+from heapq import heapify, heappop, heappush
+from math import inf
+
+
+class ReachabilityIndex:
+
+    """
+    Answers whether a Task can be reached from another one by only going downstream, with a binary search.
+    It is owned by the TaskArena of a Project, which tells it about every modification of the Tasks and of the edges.
+
+    Each Task gets a key, and the keys follow a topological order : a Task always has a smaller key than its downstream
+    Tasks. The keys are given by a depth-first search, so the Tasks of a branch have consecutive keys.
+    The label of a Task is the set of the keys of the Tasks it reaches (itself included), stored as the bounds of
+    intervals (start, end, start, end, ...), each interval containing the keys from start (included) to end (excluded).
+    Since the branches are consecutive, a Task has about one interval per intersection it is in.
+    Every bound is the key of a Task (maybe removed since then) or inf : the interval of a Task itself goes from its key
+    to the key of the next Task in the arena.
+
+    The index is updated incrementally, when it is next queried :
+    - a new Task gets a key right after the key of its last upstream Task (in the order of the keys), before the next
+      key ever given. Every interval containing the key of this upstream Task then contains the new key, and the other
+      intervals do not, so the labels of the Tasks upstream of it already contain the new Task.
+    - the labels of the Tasks whose downstream Tasks changed are computed again from the labels of their downstream
+      Tasks, from the largest key to the smallest one. The Tasks upstream of a Task are only visited if its label
+      changed. Adding a Task in a branch, or removing it, does not change the other labels : only the Tasks linked
+      to it are visited.
+    The Tasks are linked in the order of their keys, so giving a key or removing it is done in O(1), without searching
+    the keys. The keys are ints with gaps between them, and a new key is in the middle of a gap.
+    When a gap is too small, or when an edge goes from a key to a smaller one, every key and label is computed again,
+    in O((V + E) k log k) with k intervals per Task.
+
+    These are the fields of the class :
+    - GAP : The gap between two consecutive keys when they are all computed again.
+
+    These are the fields of a ReachabilityIndex :
+    - arena : The TaskArena of the Tasks.
+    - keys : The key of each slot, or None if it does not have one yet.
+    - labels : The label of each slot, as a tuple of bounds.
+    - next_known_keys : The smallest key larger than the key of each slot given since the keys were all computed,
+                        even to a Task removed since then, or None if there is none. The key of a new Task is taken
+                        between them, so that no bound is between the two keys.
+    - first_known_key : The smallest key given since the keys were all computed, or None if there is none.
+    - next_slots : The slot of the Task with the next key in the arena, for each slot, or None for the last one.
+    - previous_slots : The slot of the Task with the previous key in the arena, for each slot,
+                       or None for the first one.
+    - first_slot : The slot of the Task with the smallest key in the arena, or None if there is none.
+    - valid : Whether the keys and the labels can be updated incrementally. If not, they are all computed again.
+    - new_slots : The slots of the Tasks added since the last update, in order (as the keys of a dictionary).
+    - changed_slots : The slots whose downstream Tasks changed since the last update.
+    """
+
+    GAP = 1 << 32
+
+    def __init__(self, arena):
+        """
+        Creates a new ReachabilityIndex. The keys and the labels are computed when it is first queried
+        :param arena: The TaskArena of the Tasks
+        """
+        self.arena = arena
+        self.keys = []
+        self.labels = []
+        self.next_known_keys = []
+        self.first_known_key = None
+        self.next_slots = []
+        self.previous_slots = []
+        self.first_slot = None
+        self.valid = False
+        self.new_slots = {}
+        self.changed_slots = set()
+
+    def grow(self, capacity):
+        """
+        Increases the number of slots of the index, along with the capacity of the arena
+        :param capacity: The new capacity
+        :return: None
+        """
+        added = capacity - len(self.keys)
+        self.keys += [None] * added
+        self.labels += [()] * added
+        self.next_known_keys += [None] * added
+        self.next_slots += [None] * added
+        self.previous_slots += [None] * added
+
+    def add_slot(self, slot):
+        """
+        Called when a Task is added to the arena. It gets its key once it is linked, at the next update
+        :param slot: The slot of the Task
+        :return: None
+        """
+        self.new_slots[slot] = None
+
+    def remove_slot(self, slot):
+        """
+        Called when a Task is removed from the arena. Its key is still known, since it may still be a bound
+        :param slot: The slot of the Task
+        :return: None
+        """
+        self.new_slots.pop(slot, None)
+        self.changed_slots.discard(slot)
+        if self.keys[slot] is not None:
+            next_slot = self.next_slots[slot]
+            previous_slot = self.previous_slots[slot]
+            if previous_slot is None:
+                self.first_slot = next_slot
+            else:
+                self.next_slots[previous_slot] = next_slot
+            if next_slot is not None:
+                self.previous_slots[next_slot] = previous_slot
+        self.keys[slot] = None
+        self.labels[slot] = ()
+        self.next_known_keys[slot] = None
+        self.next_slots[slot] = None
+        self.previous_slots[slot] = None
+
+    def change_slot(self, slot):
+        """
+        Called when the downstream Tasks of a Task change
+        :param slot: The slot of the Task
+        :return: None
+        """
+        self.changed_slots.add(slot)
+
+    def invalidate(self):
+        """
+        Makes the next update compute every key and every label again.
+        It is used when the edges of the arena are modified all at once (see TaskArena.restore)
+        :return: None
+        """
+        self.valid = False
+
+    def is_upstream_of(self, upstream_slot, slot):
+        """
+        Tells whether a Task can be reached from another one by only going downstream
+        :param upstream_slot: The slot of the Task we start from
+        :param slot: The slot of the Task we look for
+        :return: Whether the Task is reachable. A Task is reachable from itself
+        """
+        if not self.valid or len(self.new_slots) != 0 or len(self.changed_slots) != 0:
+            self.update()
+        # The key is in an interval if there is an odd number of bounds before it
+        return bisect_right(self.labels[upstream_slot], self.keys[slot]) % 2 == 1
+
+    def update(self):
+        """
+        Updates the keys and the labels after the modifications of the arena (see the description of the class)
+        :return: None
+        """
+        if not self.valid or not self._give_keys():
+            self._build()
+            return
+        successors = self.arena.successors
+        keys = self.keys
+        changed_slots = [slot for slot in self.changed_slots if self.arena.tasks[slot] is not None]
+        self.new_slots.clear()
+        self.changed_slots.clear()
+        # The edges added must go from a key to a larger one, otherwise the keys are not a topological order anymore
+        for slot in changed_slots:
+            key = keys[slot]
+            if any(keys[successor] <= key for successor in successors.get(slot)):
+                self._build()
+                return
+        # The labels are computed from the largest key to the smallest one, so that the labels of the downstream
+        # Tasks are up-to-date. The Tasks upstream of a Task are only visited if its label changed
+        heap = [(-keys[slot], slot) for slot in changed_slots]
+        heapify(heap)
+        visited = set()
+        while len(heap) != 0:
+            _, slot = heappop(heap)
+            if slot in visited:
+                continue
+            visited.add(slot)
+            label = self._compute_label(slot, successors.get(slot), self._get_end(slot))
+            if label != self.labels[slot]:
+                self.labels[slot] = label
+                for ancestor in self.arena.ancestors.get(slot):
+                    heappush(heap, (-keys[ancestor], ancestor))
+
+    def _give_keys(self):
+        """
+        Gives a key to each new Task, right after the key of its last upstream Task. The new Tasks linked to each other
+        get their keys in a topological order. They are then considered as changed, to compute their labels
+        :return: Whether every new Task got a key. If not, every key must be computed again
+        """
+        tasks = self.arena.tasks
+        ancestors = self.arena.ancestors
+        keys = self.keys
+        new_slots = [slot for slot in self.new_slots if tasks[slot] is not None]
+        # The number of upstream Tasks of each new Task that do not have a key yet
+        remaining = {slot: 0 for slot in new_slots}
+        for slot in new_slots:
+            for successor in self.arena.successors.get(slot):
+                if successor in remaining:
+                    remaining[successor] += 1
+        ready = [slot for slot in new_slots if remaining[slot] == 0]
+        given_count = 0
+        while len(ready) != 0:
+            slot = ready.pop()
+            upstream_slots = ancestors.get(slot)
+            if len(upstream_slots) == 0:
+                # Nothing reaches the Task : its key is before every bound
+                if self.first_known_key is None:
+                    return False
+                key = self.first_known_key - ReachabilityIndex.GAP
+                self.next_known_keys[slot] = self.first_known_key
+                self.first_known_key = key
+                previous_slot = None
+                next_slot = self.first_slot
+                self.first_slot = slot
+            else:
+                # The Task comes right after its upstream Task with the largest key
+                previous_slot = max(upstream_slots, key=keys.__getitem__)
+                previous_key = keys[previous_slot]
+                next_key = self.next_known_keys[previous_slot]
+                key = (previous_key + (previous_key + 2 * ReachabilityIndex.GAP if next_key is None else next_key)) // 2
+                if key == previous_key:
+                    return False
+                self.next_known_keys[slot] = next_key
+                self.next_known_keys[previous_slot] = key
+                next_slot = self.next_slots[previous_slot]
+                self.next_slots[previous_slot] = slot
+            self.previous_slots[slot] = previous_slot
+            self.next_slots[slot] = next_slot
+            if next_slot is not None:
+                self.previous_slots[next_slot] = slot
+            keys[slot] = key
+            self.changed_slots.add(slot)
+            given_count += 1
+            for successor in self.arena.successors.get(slot):
+                if successor in remaining:
+                    remaining[successor] -= 1
+                    if remaining[successor] == 0:
+                        ready.append(successor)
+        # The new Tasks that did not get a key are in a cycle, it is found when the project is validated
+        return given_count == len(new_slots)
+
+    def _get_end(self, slot):
+        """
+        Gives the end of the interval of a Task itself
+        :param slot: The slot of the Task
+        :return: The key of the next Task in the arena, or inf if there is none
+        """
+        next_slot = self.next_slots[slot]
+        return inf if next_slot is None else self.keys[next_slot]
+
+    def _compute_label(self, slot, successors, end):
+        """
+        Computes the label of a Task from the labels of its downstream Tasks.
+        Their keys are larger than the key of the Task, so the interval of the Task itself is the first one
+        :param slot: The slot of the Task
+        :param successors: The slots of the downstream Tasks
+        :param end: The key of the next Task in the arena, or inf
+        :return: The label, as a tuple of bounds
+        """
+        key = self.keys[slot]
+        if len(successors) == 0:
+            return key, end
+        if len(successors) == 1:
+            bounds = self.labels[successors[0]]
+        else:
+            intervals = []
+            for successor in successors:
+                successor_bounds = self.labels[successor]
+                intervals.extend(zip(successor_bounds[::2], successor_bounds[1::2]))
+            intervals.sort()
+            bounds = []
+            for start, interval_end in intervals:
+                if len(bounds) != 0 and start <= bounds[-1]:
+                    bounds[-1] = max(bounds[-1], interval_end)
+                else:
+                    bounds += (start, interval_end)
+            bounds = tuple(bounds)
+        # The interval of the Task is merged with the first one if they touch
+        if bounds[0] <= end:
+            return (key, max(end, bounds[1])) + bounds[2:]
+        return (key, end) + bounds
+
+    def _build(self):
+        """
+        Computes every key and every label again. The keys are given in the reverse postorder of a depth-first search
+        starting from the Tasks without upstream Tasks : a Task is finished after its downstream Tasks,
+        and the Tasks of a branch are finished one after the other
+        :return: None
+        """
+        tasks = self.arena.tasks
+        edges = self.arena.successors
+        # The edges are read once, since the search and the labels both need them
+        successors = [edges.edges[offset:offset + count] for offset, count in zip(edges.offsets, edges.counts)]
+        visited = [False] * len(tasks)
+        postorder = []
+        # The Tasks in a cycle (in a batch that is rolled back) are searched from any of them, to give them a key
+        roots = [slot for slot in range(len(tasks)) if self.arena.ancestors.counts[slot] == 0]
+        for root in roots + list(range(len(tasks))):
+            if tasks[root] is None or visited[root]:
+                continue
+            visited[root] = True
+            # The search is done without recursion, so that long chains of Tasks do not reach the recursion limit
+            stack = [(root, iter(successors[root]))]
+            while len(stack) != 0:
+                slot, slot_successors = stack[-1]
+                for successor in slot_successors:
+                    if not visited[successor]:
+                        visited[successor] = True
+                        stack.append((successor, iter(successors[successor])))
+                        break
+                else:
+                    stack.pop()
+                    postorder.append(slot)
+        self.keys = [None] * len(tasks)
+        self.labels = [()] * len(tasks)
+        self.next_known_keys = [None] * len(tasks)
+        self.next_slots = [None] * len(tasks)
+        self.previous_slots = [None] * len(tasks)
+        count = len(postorder)
+        for position, slot in enumerate(postorder):
+            key = (count - 1 - position) * ReachabilityIndex.GAP
+            self.keys[slot] = key
+            if position != 0:
+                self.next_known_keys[slot] = key + ReachabilityIndex.GAP
+                self.next_slots[slot] = postorder[position - 1]
+            if position != count - 1:
+                self.previous_slots[slot] = postorder[position + 1]
+        self.first_known_key = None if count == 0 else 0
+        self.first_slot = None if count == 0 else postorder[-1]
+        # The postorder goes from the largest key to the smallest one
+        end = inf
+        for slot in postorder:
+            self.labels[slot] = self._compute_label(slot, successors[slot], end)
+            end = self.keys[slot]
+        self.valid = True
+        self.new_slots.clear()
+        self.changed_slots.clear()
@@ -0,0 +1,41 @@
+class ScenarioSchedule:
+
+    """
+    Represents the schedules of a Project for many scenarios. A scenario is a set of durations for the tasks,
+    for example "what if these 3 tasks take 5 more days". The values are computed without modifying the Tasks.
+    It is created by Project.evaluate_scenarios.
+    Every value is a NumPy array with one row per scenario. When there is also one column per task,
+    the column i corresponds to the task at the position i of the tasks field (and of the tasks of the Project).
+
+    These are the fields of a ScenarioSchedule :
+    - tasks : The Tasks of the Project, in the order of the columns.
+    - durations : The estimated time of each task in each scenario.
+    - earliest_start : The earliest start of each task in each scenario.
+    - latest_start : The latest start of each task in each scenario.
+    - is_critical : Whether each task is critical in each scenario.
+    - project_end : The number of days needed to complete the Project in each scenario.
+    """
+
+    def __init__(self, tasks, durations, earliest_start, latest_start, project_end):
+        """
+        Creates a new ScenarioSchedule
+        :param tasks: The Tasks of the Project, in the order of the columns
+        :param durations: The estimated time of each task in each scenario
+        :param earliest_start: The earliest start of each task in each scenario
+        :param latest_start: The latest start of each task in each scenario
+        :param project_end: The number of days needed to complete the Project in each scenario
+        """
+        self.tasks = tasks
+        self.durations = durations
+        self.earliest_start = earliest_start
+        self.latest_start = latest_start
+        self.is_critical = earliest_start == latest_start
+        self.project_end = project_end
+
+    def get_critical_tasks(self, scenario):
+        """
+        Gives the critical tasks of a scenario
+        :param scenario: The position of the scenario
+        :return: The list of the critical Tasks, in the order of the columns
+        """
+        return [task for task, is_critical in zip(self.tasks, self.is_critical[scenario]) if is_critical]
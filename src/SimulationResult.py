@@ -0,0 +1,57 @@
+from TaskList import TaskList
+from utils.mathutils import percentile
+
+
+class SimulationResult:
+
+    """
+    Represents the results of a Monte Carlo simulation of a Project. In each sample, the duration of every task
+    is drawn at random between its optimistic and pessimistic times, and the Project is scheduled with these durations.
+    It is created by Project.simulate or by a NativeSimulation (see Project.start_simulation).
+
+    These are the fields of a SimulationResult :
+    - tasks : A TaskList of the Tasks of the Project, in the order of the criticality_index.
+    - distribution : The name of the distribution the durations were drawn from ("beta" or "triangular").
+    - samples_count : The number of samples.
+    - project_end : A sequence (a NumPy array or an array) containing the number of days needed
+                    to complete the Project in each sample.
+    - criticality_index : A sequence containing, for each task, the fraction of the samples in which it is critical.
+    """
+
+    def __init__(self, tasks, distribution, project_end, criticality_index):
+        """
+        Creates a new SimulationResult
+        :param tasks: The Tasks of the Project
+        :param distribution: The name of the distribution the durations were drawn from
+        :param project_end: The number of days needed to complete the Project in each sample
+        :param criticality_index: The fraction of the samples in which each task is critical
+        """
+        self.tasks = TaskList(tasks)
+        self.distribution = distribution
+        self.samples_count = len(project_end)
+        self.project_end = project_end
+        self.criticality_index = criticality_index
+
+    def get_percentile(self, percent):
+        """
+        Gives the number of days after which the Project is completed in a given percentage of the samples.
+        For example, the Project is completed after get_percentile(80) days in 80% of the samples
+        :param percent: The percentage, between 0 and 100
+        :return: The number of days
+        """
+        return float(percentile(self.project_end, percent))
+
+    def get_percentiles(self):
+        """
+        Gives the usual percentiles of the completion date
+        :return: A dictionary associating 50, 80 and 95 to the number of days given by get_percentile
+        """
+        return {percent: self.get_percentile(percent) for percent in (50, 80, 95)}
+
+    def get_criticality_index(self, task):
+        """
+        Gives the criticality index of a task
+        :param task: The Task
+        :return: The fraction of the samples in which the task is critical
+        """
+        return float(self.criticality_index[self.tasks.index(task)])
@@ -1,6 +1,84 @@
+from DependencyType import DependencyType
+from TaskList import TaskList
 from TaskStatus import TaskStatus
 
 
+class _ArenaValue:
+
+    """
+    A value of a Task that is stored in the TaskArena of its Project, so that the C functions can use it
+    and write it without any conversion. While the Task is not in an arena, the value is stored in the Task itself.
+
+    These are the fields of an _ArenaValue :
+    - array_name : The name of the array of the TaskArena containing the value.
+    - convert : The function used to convert the value read from the array.
+    - private_name : The name of the attribute of the Task used when the Task is not in an arena.
+    """
+
+    def __init__(self, array_name, convert=int):
+        """
+        Creates a new _ArenaValue
+        :param array_name: The name of the array of the TaskArena containing the value
+        :param convert: The function used to convert the value read from the array
+        """
+        self.array_name = array_name
+        self.convert = convert
+        self.private_name = ""
+
+    def __set_name__(self, owner, name):
+        self.private_name = "_" + name
+
+    def __get__(self, task, owner=None):
+        if task is None:
+            return self
+        if task.arena is None:
+            return getattr(task, self.private_name)
+        return self.convert(getattr(task.arena, self.array_name)[task.slot])
+
+    def __set__(self, task, value):
+        if task.arena is None:
+            setattr(task, self.private_name, value)
+        else:
+            task.arena.set_value(self.array_name, task.slot, value)
+
+
+class _PathValue:
+
+    """
+    A value of a Task computed from the paths going through it : the upstream_tasks_count, the downstream_tasks_count
+    and the max depths. They depend on every Task upstream (or downstream) of the Task, so updating them each time
+    the Tasks are linked would go through these Tasks again and again. Instead, linking Tasks only marks the values
+    that may have changed as dirty, and they are computed again when they are read (see Task.update_upstream_info).
+
+    These are the fields of a _PathValue :
+    - upstream : Whether the value is computed from the upstream Tasks (True) or from the downstream Tasks (False).
+    - private_name : The name of the attribute of the Task containing the value computed last.
+    """
+
+    def __init__(self, upstream):
+        """
+        Creates a new _PathValue
+        :param upstream: Whether the value is computed from the upstream Tasks or from the downstream Tasks
+        """
+        self.upstream = upstream
+        self.private_name = ""
+
+    def __set_name__(self, owner, name):
+        self.private_name = "_" + name
+
+    def __get__(self, task, owner=None):
+        if task is None:
+            return self
+        if self.upstream and task.upstream_info_dirty:
+            task.update_upstream_info()
+        elif not self.upstream and task.downstream_info_dirty:
+            task.update_downstream_info()
+        return getattr(task, self.private_name)
+
+    def __set__(self, task, value):
+        setattr(task, self.private_name, value)
+
+
 class Task:
 
     """
@@ -13,10 +91,15 @@ class Task:
     - id : The id of the Task. It is unique in the Project. It is used to identify the Task.
     - name : The name of the Task.
     - description : The description of the Task.
-    - upstream_tasks : A list of Tasks that should be completed before this Task can start.
-    - downstream_tasks : A list of Tasks that can start only once this Task is completed.
+    - upstream_tasks : A TaskList of the Tasks that should be completed before this Task can start.
+    - downstream_tasks : A TaskList of the Tasks that can start only once this Task is completed.
     - estimated_time : The estimated time that will be necessary to complete the Task.
     - status : The TaskStatus of the Task, this is used to know what has been done on the Task.
+               It should only be modified with set_status (or update_status), so that the downstream Tasks
+               are locked or unlocked.
+    - unfinished_upstream_tasks_count : The number of upstream Tasks that are not finished. The Task is locked
+                                        while it is not 0. It is kept up-to-date when the Tasks are linked
+                                        and when their status changes (see update_locks).
     - downstream_tasks_count : The length of the longest path we can take from this Task to the last one
                                (by only going downstream).
     - upstream_tasks_count : The length of the longest path we can take from this Task to the first one
@@ -26,14 +109,67 @@ class Task:
     - is_beginning_task : Whether the Task is the beginning Task (meaning the first Task) of the Project.
     - is_project_task : Whether the Task is the project Task (meaning the last Task) of the Project.
     - is_critical : Whether the Task is critical or not. A Task is critical if there is no margin for its starting date.
+    - earliest_finish : The earliest estimated number of days at which the Task can be completed.
+    - latest_finish : The latest estimated number of days at which the Task can be completed.
+    - total_float : The number of days the Task can be delayed without delaying the end of the Project.
+    - free_float : The number of days the Task can be delayed without delaying any downstream Task.
     - max_downstream_tasks_depth : The maximum depth a downstream Task can have relative to this Task.
                                    (here, downstream is in the larger sense of the definition).
                                    It needs to be at least 1.
     - max_upstream_tasks_depth : The maximum depth an upstream Task can have relative to this Task.
                                  (here, upstream is in the larger sense of the definition).
                                  It needs to be at least 1.
+    - optimistic_time : The shortest time that could be necessary to complete the Task. It is None if it is unknown.
+    - most_likely_time : The most likely time that will be necessary to complete the Task. It is None if it is unknown.
+    - pessimistic_time : The longest time that could be necessary to complete the Task. It is None if it is unknown.
+                         These three estimates are used to simulate the Project (see Project.simulate).
+    - dependencies : A dictionary associating the upstream Tasks whose dependency is not the default one
+                     (FINISH_TO_START without lag) to a tuple containing the DependencyType and the lag (in days).
+                     It should only be modified with set_dependency.
+    - demands : A dictionary associating the name of each resource of the Project needed by the Task
+                to the amount of this resource needed while the Task is being worked on.
+    - leveled_start : The number of days at which the Task starts when the resources of the Project are limited
+                      (see Project.schedule_resources).
+    - arena : The TaskArena of the Project the Task belongs to. It is None if the Task is not in a Project yet.
+              Modifying the upstream and downstream Tasks of the Task updates the arena in place.
+    - slot : The slot of the Task in its arena. It is -1 if the Task is not in an arena.
+    - upstream_info_dirty : Whether the upstream_tasks_count and the max_upstream_tasks_depth must be computed again.
+                            If a Task is dirty, all its downstream Tasks are dirty too.
+    - downstream_info_dirty : Whether the downstream_tasks_count and the max_downstream_tasks_depth must be computed
+                              again. If a Task is dirty, all its upstream Tasks are dirty too.
+
+    index, estimated_time and the values computed by the scheduling (from earliest_start to free_float)
+    are stored in the arena while the Task is in one. This way, the C functions directly write their results
+    where the Task reads them.
+    The counts and the max depths are only computed when they are read, see _PathValue.
+    A Task has no __dict__, its fields are stored in slots, since a project may have millions of Tasks.
+    The arena only contains the values above and the edges : the Task still owns its TaskLists, its dictionaries
+    and its strings, which take most of its memory (about 1.6 kB per Task with its slot in the arena).
     """
 
+    __slots__ = ("arena", "slot", "id", "name", "description", "upstream_tasks", "downstream_tasks", "status",
+                 "is_beginning_task", "is_project_task", "optimistic_time", "most_likely_time", "pessimistic_time",
+                 "dependencies", "demands", "leveled_start", "upstream_info_dirty", "downstream_info_dirty",
+                 "unfinished_upstream_tasks_count",
+                 # The values of the _ArenaValue and the _PathValue fields, see their private_name
+                 "_index", "_estimated_time", "_earliest_start", "_latest_start", "_is_critical", "_earliest_finish",
+                 "_latest_finish", "_total_float", "_free_float", "_upstream_tasks_count",
+                 "_max_upstream_tasks_depth", "_downstream_tasks_count", "_max_downstream_tasks_depth")
+
+    index = _ArenaValue("index")
+    estimated_time = _ArenaValue("duration")
+    earliest_start = _ArenaValue("earlier")
+    latest_start = _ArenaValue("later")
+    is_critical = _ArenaValue("is_critical", bool)
+    earliest_finish = _ArenaValue("earlier_finish")
+    latest_finish = _ArenaValue("later_finish")
+    total_float = _ArenaValue("total_float")
+    free_float = _ArenaValue("free_float")
+    upstream_tasks_count = _PathValue(True)
+    max_upstream_tasks_depth = _PathValue(True)
+    downstream_tasks_count = _PathValue(False)
+    max_downstream_tasks_depth = _PathValue(False)
+
     def __init__(self, id_, name="", description="", estimated_time=0):
         """
         Creates a new Task
@@ -44,51 +180,152 @@ class Task:
                                By default, it is 0.
         """
         super().__init__()
+        self.arena = None
+        self.slot = -1
         self.id = id_
-        self.index = 0
         self.name = name
         self.description = description
-        self.upstream_tasks = []
-        self.downstream_tasks = []
-        self.estimated_time = estimated_time
+        self.upstream_tasks = TaskList()
+        self.downstream_tasks = TaskList()
         self.status = TaskStatus.NOT_STARTED
-        self.downstream_tasks_count = 0
-        self.upstream_tasks_count = 0
-        self.earliest_start = 0
-        self.latest_start = 0
+        self.unfinished_upstream_tasks_count = 0
         self.is_beginning_task = self.id == 0
         self.is_project_task = self.id == 1
-        self.is_critical = False
+        # The Task is not in an arena yet, so its values are stored in the Task itself (see _ArenaValue).
+        # They are set directly, because projects with many tasks create them all at once (see Project.from_edges)
+        self._index = 0
+        self._estimated_time = estimated_time
+        self._earliest_start = 0
+        self._latest_start = 0
+        self._is_critical = False
+        self._earliest_finish = estimated_time
+        self._latest_finish = estimated_time
+        self._total_float = 0
+        self._free_float = 0
+        self._downstream_tasks_count = 0
+        self._upstream_tasks_count = 0
         # This task counts as a depth level, so max_downstream_tasks_depth (resp. upstream_task_count)
         # should always be at least 1
-        self.max_downstream_tasks_depth = 1
-        self.max_upstream_tasks_depth = 1
-        self.update_upstream_info()
-        self.update_downstream_info()
+        self._max_downstream_tasks_depth = 1
+        self._max_upstream_tasks_depth = 1
+        self.optimistic_time = None
+        self.most_likely_time = None
+        self.pessimistic_time = None
+        self.dependencies = {}
+        self.demands = {}
+        self.leveled_start = 0
+        self.upstream_info_dirty = True
+        self.downstream_info_dirty = True
 
     def update_status(self):
         """
         Updates changes the status of the Task to the next status
         :return: None
         """
-        self.status = self.status.next_status()
+        self.set_status(self.status.next_status())
 
-    def add_upstream_task(self, task, index=None):
+    def set_status(self, status):
+        """
+        Modifies the status of the Task. If the Task becomes finished, or is not finished anymore,
+        the unfinished_upstream_tasks_count of its downstream Tasks is updated, and they are unlocked or locked
+        (see update_locks). Only the downstream Tasks are visited, not the whole Project
+        :param status: The new TaskStatus
+        :return: None
+        """
+        was_finished = self.status == TaskStatus.FINISHED
+        if self.arena is not None:
+            self.arena.save_status(self)
+        self.status = status
+        if was_finished != (status == TaskStatus.FINISHED):
+            change = -1 if status == TaskStatus.FINISHED else 1
+            Task.update_locks([(downstream_task, change) for downstream_task in self.downstream_tasks])
+
+    @staticmethod
+    def update_locks(changes):
+        """
+        Modifies the unfinished_upstream_tasks_count of some Tasks. A Task is locked when it has unfinished upstream
+        Tasks, and a locked Task is unlocked (NOT_STARTED) when it has none anymore.
+        A finished Task that gets locked is not finished anymore, so the count of its downstream Tasks changes too.
+        The changes are applied with a stack rather than recursively, as a long chain of finished Tasks may be locked
+        :param changes: The list of the changes to apply, as tuples containing the Task and the number to add
+                        to its count. A change of 0 only locks or unlocks the Task according to its count
+        :return: None
+        """
+        while len(changes) != 0:
+            task, change = changes.pop()
+            task.unfinished_upstream_tasks_count += change
+            is_locked = task.unfinished_upstream_tasks_count != 0
+            if is_locked == (task.status == TaskStatus.LOCKED):
+                continue
+            if task.status == TaskStatus.FINISHED:
+                changes.extend((downstream_task, 1) for downstream_task in task.downstream_tasks)
+            status = TaskStatus.LOCKED if is_locked else TaskStatus.NOT_STARTED
+            if task.arena is not None:
+                task.arena.save_status(task)
+            task.status = status
+
+    def set_estimates(self, optimistic_time, most_likely_time, pessimistic_time):
+        """
+        Sets the three-point estimates of the Task
+        :param optimistic_time: The shortest time that could be necessary to complete the Task
+        :param most_likely_time: The most likely time that will be necessary to complete the Task
+        :param pessimistic_time: The longest time that could be necessary to complete the Task
+        :return: None
+        """
+        if not optimistic_time <= most_likely_time <= pessimistic_time:
+            raise ValueError(f"The estimates of the task {self.name} should be in increasing order")
+        self.optimistic_time = optimistic_time
+        self.most_likely_time = most_likely_time
+        self.pessimistic_time = pessimistic_time
+
+    def has_estimates(self):
+        """
+        :return: Whether the three-point estimates of the Task are known
+        """
+        return self.optimistic_time is not None
+
+    def get_estimates(self):
+        """
+        Gives the three-point estimates of the Task. If they are unknown, the estimated_time is used for all of them
+        :return: A tuple containing the optimistic, the most likely and the pessimistic time
+        """
+        if not self.has_estimates():
+            return self.estimated_time, self.estimated_time, self.estimated_time
+        return self.optimistic_time, self.most_likely_time, self.pessimistic_time
+
+    def add_upstream_task(self, task, index=None, dependency_type=DependencyType.FINISH_TO_START, lag=0,
+                          downstream_index=None):
         """
         Adds an upstream Task to the Task. The Task will be inserted at the given index.
         If no index is given, it will be inserted at the end of the list.
         It also adds this Task to the downstream_tasks of the given Task
         :param task: The Task to add
         :param index: The index at which to insert the Task. This is optional
+        :param dependency_type: The DependencyType between the two Tasks. By default, it is FINISH_TO_START
+        :param lag: The number of days to wait after the dependency is satisfied. By default, it is 0
+        :param downstream_index: The index at which this Task is inserted in the downstream_tasks of the given Task.
+                                 By default, it is added at the end (it is used to undo a modification)
         :return: None
         """
+        if task in self.upstream_tasks:
+            raise ValueError(f"The task {task.name} is already an upstream task of {self.name}")
+        # The arena is modified first, so that it can save the Tasks as they were (see TaskArena.save_task)
+        if self.arena is not None:
+            self.arena.add_edge(task, self, index, dependency_type, lag, downstream_index)
         if index is None:
             self.upstream_tasks.append(task)
         else:
             self.upstream_tasks.insert(index, task)
-        task.downstream_tasks.append(self)
-        self.update_upstream_info()
-        task.update_downstream_info()
+        if downstream_index is None:
+            task.downstream_tasks.append(self)
+        else:
+            task.downstream_tasks.insert(downstream_index, self)
+        if dependency_type != DependencyType.FINISH_TO_START or lag != 0:
+            self.dependencies[task] = (DependencyType(dependency_type), lag)
+        self.invalidate_upstream_info()
+        task.invalidate_downstream_info()
+        if task.status != TaskStatus.FINISHED:
+            Task.update_locks([(self, 1)])
 
     def remove_upstream_task(self, task):
         """
@@ -96,10 +333,15 @@ class Task:
         :param task:
         :return:
         """
+        if self.arena is not None:
+            self.arena.remove_edge(task, self)
         self.upstream_tasks.remove(task)
         task.downstream_tasks.remove(self)
-        self.update_upstream_info()
-        task.update_downstream_info()
+        self.dependencies.pop(task, None)
+        self.invalidate_upstream_info()
+        task.invalidate_downstream_info()
+        if task.status != TaskStatus.FINISHED:
+            Task.update_locks([(self, -1)])
 
     def replace_upstream_task(self, old_task, new_task):
         """
@@ -108,48 +350,163 @@ class Task:
         :param new_task: The Task that will replace the old one
         :return: None
         """
-        index = self.upstream_tasks.index(old_task)
-        self.upstream_tasks[index] = new_task
+        if self.arena is not None:
+            self.arena.replace_edge(old_task, new_task, self)
+        self.upstream_tasks.replace(old_task, new_task)
         old_task.downstream_tasks.remove(self)
         new_task.downstream_tasks.append(self)
-        self.update_upstream_info()
-        new_task.update_downstream_info()
+        # The new Task keeps the dependency of the old one
+        if old_task in self.dependencies:
+            self.dependencies[new_task] = self.dependencies.pop(old_task)
+        self.invalidate_upstream_info()
+        old_task.invalidate_downstream_info()
+        new_task.invalidate_downstream_info()
+        change = (new_task.status != TaskStatus.FINISHED) - (old_task.status != TaskStatus.FINISHED)
+        if change != 0:
+            Task.update_locks([(self, change)])
+
+    def get_dependency(self, task):
+        """
+        Gives the dependency between the Task and one of its upstream Tasks
+        :param task: The upstream Task
+        :return: A tuple containing the DependencyType and the lag (in days)
+        """
+        return self.dependencies.get(task, (DependencyType.FINISH_TO_START, 0))
+
+    def get_delay(self, task):
+        """
+        Gives the minimum number of days between the start of one of the upstream Tasks and the start of the Task
+        :param task: The upstream Task
+        :return: The number of days. It may be negative
+        """
+        if task not in self.dependencies:
+            return task.estimated_time
+        dependency_type, lag = self.dependencies[task]
+        return dependency_type.get_delay(lag, task.estimated_time, self.estimated_time)
+
+    def set_dependency(self, task, dependency_type, lag=0):
+        """
+        Modifies the dependency between the Task and one of its upstream Tasks
+        :param task: The upstream Task
+        :param dependency_type: The new DependencyType
+        :param lag: The new lag (in days). It can be negative. By default, it is 0
+        :return: None
+        """
+        if task not in self.upstream_tasks:
+            raise ValueError(f"The task {task.name} is not an upstream task of {self.name}")
+        if self.arena is not None:
+            self.arena.set_dependency(task, self, dependency_type, lag)
+        if dependency_type == DependencyType.FINISH_TO_START and lag == 0:
+            self.dependencies.pop(task, None)
+        else:
+            self.dependencies[task] = (DependencyType(dependency_type), lag)
+
+    def invalidate_upstream_info(self):
+        """
+        Marks the upstream_tasks_count and the max_upstream_tasks_depth of the Task and of all its downstream Tasks
+        as dirty. It is called when the upstream Tasks of the Task are modified.
+        The Tasks already dirty are not visited again, because their downstream Tasks are already dirty
+        :return: None
+        """
+        tasks = [self]
+        while len(tasks) != 0:
+            task = tasks.pop()
+            if not task.upstream_info_dirty:
+                task.upstream_info_dirty = True
+                tasks.extend(task.downstream_tasks)
+
+    def invalidate_downstream_info(self):
+        """
+        Marks the downstream_tasks_count and the max_downstream_tasks_depth of the Task and of all its upstream Tasks
+        as dirty. It is called when the downstream Tasks of the Task are modified.
+        The Tasks already dirty are not visited again, because their upstream Tasks are already dirty
+        :return: None
+        """
+        tasks = [self]
+        while len(tasks) != 0:
+            task = tasks.pop()
+            if not task.downstream_info_dirty:
+                task.downstream_info_dirty = True
+                tasks.extend(task.upstream_tasks)
+
+    @staticmethod
+    def _dirty_order(task, neighbors_name, dirty_name):
+        """
+        Gives the dirty Tasks a Task depends on, in an order where each Task comes after the Tasks it depends on.
+        It is a depth-first search, done without recursion so that long chains of Tasks do not reach the recursion limit
+        :param task: The Task
+        :param neighbors_name: The name of the list of the Tasks it depends on, "upstream_tasks" or "downstream_tasks"
+        :param dirty_name: The name of the dirty flag, "upstream_info_dirty" or "downstream_info_dirty"
+        :return: The list of the dirty Tasks, ending with the Task
+        """
+        order = []
+        visited = {task}
+        stack = [(task, iter(getattr(task, neighbors_name)))]
+        while len(stack) != 0:
+            current_task, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if getattr(neighbor, dirty_name) and neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append((neighbor, iter(getattr(neighbor, neighbors_name))))
+                    break
+            else:
+                stack.pop()
+                order.append(current_task)
+        return order
 
     def update_upstream_info(self):
         """
-        Updates the upstream_tasks_count and max_upstream_tasks_depth of the Task.
-        This calls the same method recursively on all the downstream Tasks.
+        Computes the upstream_tasks_count and the max_upstream_tasks_depth of the Task,
+        and of every dirty upstream Task first. Each of them is computed once, in a single topological pass
         :return: None
         """
-        self.upstream_tasks_count = 0
-        self.max_upstream_tasks_depth = 0
-        if len(self.upstream_tasks) == 0:
-            self.max_upstream_tasks_depth = 1
-        for upstream_task in self.upstream_tasks:
-            if upstream_task.upstream_tasks_count >= self.upstream_tasks_count:
-                self.upstream_tasks_count = upstream_task.upstream_tasks_count + 1
-            self.max_upstream_tasks_depth += upstream_task.max_upstream_tasks_depth
-        # Propagate changes to downstream tasks
-        for downstream_task in self.downstream_tasks:
-            downstream_task.update_upstream_info()
+        for task in Task._dirty_order(self, "upstream_tasks", "upstream_info_dirty"):
+            # The upstream Tasks are up-to-date, so their values are read without checking them
+            upstream_tasks_count = 0
+            max_upstream_tasks_depth = 0 if len(task.upstream_tasks) != 0 else 1
+            for upstream_task in task.upstream_tasks:
+                if upstream_task._upstream_tasks_count >= upstream_tasks_count:
+                    upstream_tasks_count = upstream_task._upstream_tasks_count + 1
+                max_upstream_tasks_depth += upstream_task._max_upstream_tasks_depth
+            task._upstream_tasks_count = upstream_tasks_count
+            task._max_upstream_tasks_depth = max_upstream_tasks_depth
+            task.upstream_info_dirty = False
 
     def update_downstream_info(self):
         """
-        Updates the downstream_tasks_count and max_downstream_tasks_depth of the Task.
-        This calls the same method recursively on all the upstream Tasks.
-        :return:
+        Computes the downstream_tasks_count and the max_downstream_tasks_depth of the Task,
+        and of every dirty downstream Task first. Each of them is computed once, in a single topological pass
+        :return: None
+        """
+        for task in Task._dirty_order(self, "downstream_tasks", "downstream_info_dirty"):
+            # The downstream Tasks are up-to-date, so their values are read without checking them
+            downstream_tasks_count = 0
+            max_downstream_tasks_depth = 0 if len(task.downstream_tasks) != 0 else 1
+            for downstream_task in task.downstream_tasks:
+                if downstream_task._downstream_tasks_count >= downstream_tasks_count:
+                    downstream_tasks_count = downstream_task._downstream_tasks_count + 1
+                max_downstream_tasks_depth += downstream_task._max_downstream_tasks_depth
+            task._downstream_tasks_count = downstream_tasks_count
+            task._max_downstream_tasks_depth = max_downstream_tasks_depth
+            task.downstream_info_dirty = False
+
+    def is_upstream_of(self, task):
+        """
+        Tells whether the Task is upstream of another Task, in the larger sense : the other Task can be reached
+        from the Task by only going downstream. It is answered by the ReachabilityIndex of the arena,
+        with a binary search
+        :param task: The other Task. It should be in the same Project, which must be loaded
+        :return: Whether the Task is upstream of the other Task. A Task is not upstream of itself
+        """
+        return task is not self and self.arena.reachability.is_upstream_of(self.slot, task.slot)
+
+    def is_downstream_of(self, task):
+        """
+        Tells whether the Task is downstream of another Task, in the larger sense (see is_upstream_of)
+        :param task: The other Task. It should be in the same Project
+        :return: Whether the Task is downstream of the other Task. A Task is not downstream of itself
         """
-        self.downstream_tasks_count = 0
-        self.max_downstream_tasks_depth = 0
-        if len(self.downstream_tasks) == 0:
-            self.max_downstream_tasks_depth = 1
-        for downstream_task in self.downstream_tasks:
-            if downstream_task.downstream_tasks_count >= self.downstream_tasks_count:
-                self.downstream_tasks_count = downstream_task.downstream_tasks_count + 1
-            self.max_downstream_tasks_depth += downstream_task.max_downstream_tasks_depth
-        # Propagate changes to upstream tasks
-        for upstream_task in self.upstream_tasks:
-            upstream_task.update_downstream_info()
+        return task.is_upstream_of(self)
 
     def __str__(self):
         return f"<Task name={self.name} index={self.index}>"
@@ -0,0 +1,140 @@
+from bisect import bisect_left, insort
+from itertools import count
+
+
+class TaskList(dict):
+
+    """
+    Represents the upstream or the downstream Tasks of a Task, or the Tasks of a Project. It behaves like a list
+    of distinct Tasks : it keeps the order in which the Tasks were added (the tree layout relies on it),
+    and tasks[i] gives the Task at position i.
+    The Tasks are stored as the keys of a dict, so checking if a Task is in the list and removing a Task
+    do not go through the list. Iterating over the list, len and the in operator are the ones of the dict.
+
+    Each Task is associated to a number, given in the order in which the Tasks were added. When a Task is removed,
+    its number is kept in a sorted list, so that the position of a Task is its number minus the number of Tasks
+    removed before it. This way, index does not go through the list either, and tasks[i] finds the number of
+    the Task at position i with a binary search in the removed numbers.
+    The numbers are given again from 0 when a Task is inserted before the end, or when there are more removed Tasks
+    than Tasks. Inserting before the end and replacing a Task go through the TaskList, as the keys of a dict
+    cannot be moved : they are only used to move the edges of a Task, so they go through its neighbours.
+
+    These are the fields of a TaskList :
+    - numbered : The list of the Tasks by number. The removed Tasks are replaced by None.
+    - removed : The sorted list of the numbers of the removed Tasks. It is None if no Task was removed.
+    """
+
+    __slots__ = ("numbered", "removed")
+
+    def __init__(self, tasks=()):
+        """
+        Creates a new TaskList
+        :param tasks: The Tasks of the TaskList, in order. By default, it is empty
+        """
+        self.numbered = list(tasks)
+        super().__init__(zip(self.numbered, count()))
+        self.removed = None
+
+    def __getitem__(self, index):
+        """
+        Gives the Task at a position
+        :param index: The position. It can be negative, like the index of a list
+        :return: The Task
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError("TaskList index out of range")
+        if index < 0:
+            index += len(self)
+        if self.removed is None:
+            return self.numbered[index]
+        # removed[i] - i is the number of Tasks left before the i-th removed Task, so the number of the Task
+        # is its position plus the number of removed Tasks for which this is at most the position
+        low, high = 0, len(self.removed)
+        while low < high:
+            middle = (low + high) // 2
+            if self.removed[middle] - middle <= index:
+                low = middle + 1
+            else:
+                high = middle
+        return self.numbered[index + low]
+
+    def __repr__(self):
+        return f"TaskList({list(self)})"
+
+    def append(self, task):
+        """
+        Adds a Task at the end of the TaskList
+        :param task: The Task to add
+        :return: None
+        """
+        if task in self:
+            raise ValueError(f"The task {task.name} is already in the TaskList")
+        self[task] = len(self.numbered)
+        self.numbered.append(task)
+
+    def insert(self, index, task):
+        """
+        Inserts a Task before a position. It goes through the whole TaskList, as the keys of a dict cannot be moved,
+        unless the Task is inserted at the end
+        :param index: The position, it behaves like the index given to list.insert
+        :param task: The Task to insert
+        :return: None
+        """
+        if task in self:
+            raise ValueError(f"The task {task.name} is already in the TaskList")
+        if index >= len(self):
+            self.append(task)
+            return
+        tasks = list(self)
+        tasks.insert(index, task)
+        self.reset(tasks)
+
+    def remove(self, task):
+        """
+        Removes a Task from the TaskList
+        :param task: The Task to remove
+        :return: None
+        """
+        if task not in self:
+            raise ValueError(f"The task {task.name} is not in the TaskList")
+        if self.removed is None:
+            self.removed = []
+        number = dict.pop(self, task)
+        insort(self.removed, number)
+        self.numbered[number] = None
+        if len(self.removed) > len(self):
+            self.reset(list(self))
+
+    def replace(self, old_task, new_task):
+        """
+        Replaces a Task by another one, at the same position.
+        It goes through the whole TaskList, as the keys of a dict cannot be moved
+        :param old_task: The Task to replace
+        :param new_task: The Task that replaces it
+        :return: None
+        """
+        if old_task not in self:
+            raise ValueError(f"The task {old_task.name} is not in the TaskList")
+        self.reset(new_task if task is old_task else task for task in list(self))
+
+    def index(self, task):
+        """
+        Gives the position of a Task
+        :param task: The Task
+        :return: The position of the Task
+        """
+        if task not in self:
+            raise ValueError(f"The task {task.name} is not in the TaskList")
+        number = self.get(task)
+        return number if self.removed is None else number - bisect_left(self.removed, number)
+
+    def reset(self, tasks):
+        """
+        Replaces all the Tasks of the TaskList
+        :param tasks: The new Tasks, in order
+        :return: None
+        """
+        self.numbered = list(tasks)
+        self.clear()
+        self.update(zip(self.numbered, count()))
+        self.removed = None
@@ -2,12 +2,21 @@
 The entry point of the application. It initializes everything and contains the main loop.
 """
 
+import multiprocessing
+
 from Project import Project
-from render.screen.HomeScreen import HomeScreen
-from render.Window import Window
 
 if __name__ == '__main__':
+    # The worker processes of the portfolio scheduling run this file again. In the executable built by PyInstaller,
+    # this lets them run the worker instead of the application
+    multiprocessing.freeze_support()
+    # The render modules open the window when they are imported, so they are only imported by the application,
+    # and not by the worker processes (which import this file without running this block)
+    from render.screen.HomeScreen import HomeScreen
+    from render.Window import Window
     Project.load_projects()
+    # The projects are scheduled in the background, so that their end can be displayed in the list of the projects
+    Project.start_portfolio_scheduling()
     window = Window.instance
     window.set_screen(HomeScreen())
     while True:
@@ -105,11 +105,12 @@ class AddTaskScreen(Screen):
             self.upstream_tasks_error.set_text("")
         if not is_valid:
             return
-        self.project.add_task(self.name_widget.get_content(),
-                              self.description_widget.get_content(),
-                              estimated_time,
-                              upstream_tasks,
-                              self.new_branch_checkbox.activated)
+        with self.project.batch():
+            self.project.add_task(self.name_widget.get_content(),
+                                  self.description_widget.get_content(),
+                                  estimated_time,
+                                  upstream_tasks,
+                                  self.new_branch_checkbox.activated)
         Window.instance.set_screen(self.last_screen)
 
     def go_back(self):
@@ -15,9 +15,13 @@ class HomeScreen(Screen):
     """
     The Screen that is displayed when the user wants to choose what he wants to do.
     The user can choose a project to launch, create a new project, or quit the application.
+    The end and the critical tasks of each project are displayed as soon as the projects are scheduled
+    in the background (see Project.start_portfolio_scheduling).
 
     These are the fields of a HomeScreen :
     - project_list : The ListWidget of all the projects that were loaded
+    - summaries_count : The number of summaries given to the project_list. The summaries received since then
+                        are given to it on the next update.
     """
 
     def __init__(self):
@@ -29,7 +33,9 @@ class HomeScreen(Screen):
         self.label.bb.left = (1920 - self.label.bb.width) / 2
         self.project_list = ProjectListWidget(pygame.Rect(460, 100, 1000, 700),
                                               self.projects,
-                                              on_item_clicked=self.on_select_project)
+                                              on_item_clicked=self.on_select_project,
+                                              get_summary=self.get_summary)
+        self.summaries_count = self.get_summaries_count()
         self.create_project_button = ButtonWidget((810, 900), (300, 100), "Créer un projet", self.on_create_project,
                                                   font_size=30, bold=True)
 
@@ -42,6 +48,36 @@ class HomeScreen(Screen):
         yield self.project_list
         yield self.create_project_button
 
+    def update(self):
+        """
+        Gives the summaries received since the last frame to the project_list
+        :return: None
+        """
+        summaries_count = self.get_summaries_count()
+        if summaries_count != self.summaries_count:
+            self.summaries_count = summaries_count
+            self.project_list.update_summaries()
+
+    @staticmethod
+    def get_summary(project):
+        """
+        Gives the summary of the schedule of a project
+        :param project: The Project
+        :return: The ProjectSummary, or None if the project is not scheduled yet
+        """
+        if Project.portfolio_scheduling is None:
+            return None
+        return Project.portfolio_scheduling.get_summary(project.file)
+
+    @staticmethod
+    def get_summaries_count():
+        """
+        :return: The number of summaries received from the scheduling of the projects
+        """
+        if Project.portfolio_scheduling is None:
+            return 0
+        return len(Project.portfolio_scheduling.summaries)
+
     def set_projects(self, projects):
         """
         Modifies the list of projects
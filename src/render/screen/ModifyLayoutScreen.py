@@ -14,6 +14,8 @@ class ModifyLayoutScreen(Screen):
     - project : The Project we are modifying the layout of.
     - tree_widget : The TreeWidget that displays the layout of the Project and allows the user to modify it.
     - confirm_button : The ButtonWidget that allows the user to go back to the previous Screen.
+    - undo_button : The ButtonWidget that allows the user to undo the last modification of the layout.
+    - redo_button : The ButtonWidget that allows the user to make the last undone modification again.
     """
 
     def __init__(self, project, last_screen):
@@ -26,6 +28,8 @@ class ModifyLayoutScreen(Screen):
         self.tree_widget = ModifyLayoutTreeWidget((0, 0), (1920, 1080), project)
         self.confirm_button = ButtonWidget((20, 20), (150, 70), "Retour",
                                            lambda: Window.instance.set_screen(last_screen), font_size=30, bold=True)
+        self.undo_button = ButtonWidget((190, 20), (150, 70), "Annuler", self.on_undo, font_size=30, bold=True)
+        self.redo_button = ButtonWidget((360, 20), (150, 70), "Rétablir", self.on_redo, font_size=30, bold=True)
 
     def get_widgets(self):
         """
@@ -34,3 +38,21 @@ class ModifyLayoutScreen(Screen):
         """
         yield self.tree_widget
         yield self.confirm_button
+        yield self.undo_button
+        yield self.redo_button
+
+    def on_undo(self):
+        """
+        Undoes the last modification of the Project, and displays the layout again
+        :return: None
+        """
+        if self.project.undo():
+            self.tree_widget.reload()
+
+    def on_redo(self):
+        """
+        Makes the last undone modification of the Project again, and displays the layout again
+        :return: None
+        """
+        if self.project.redo():
+            self.tree_widget.reload()
@@ -1,5 +1,6 @@
 import pygame
 
+from Project import Project
 from render.screen.ModifyLayoutScreen import ModifyLayoutScreen
 from render.widget.GanttWidget import GanttWidget
 from render.Window import Window
@@ -7,6 +8,7 @@ from render.screen.AddTaskScreen import AddTaskScreen
 from render.screen.ProjectSettingsScreen import ProjectSettingsScreen
 from render.screen.Screen import Screen
 from render.widget.ButtonWidget import ButtonWidget
+from render.widget.LabelWidget import LabelWidget
 from render.widget.TaskInformationWidget import TaskInformationWidget
 from render.widget.tasks_tree.show_tasks.ShowTasksTreeWidget import ShowTasksTreeWidget
 
@@ -14,20 +16,28 @@ from render.widget.tasks_tree.show_tasks.ShowTasksTreeWidget import ShowTasksTre
 class ProjectScreen(Screen):
 
     """
-    This is the main Screen for managing a project. It is divided in 4 parts:
+    This is the main Screen for managing a project. It is divided in 5 parts:
     - The tree view of the tasks.
     - The Gantt diagram of the project, displaying the earliest possible dates for starting and finishing each task.
     - The Gantt diagram of the project, displaying the latest possible dates for starting and finishing each task.
+    - The Gantt diagram of the project, displaying the dates for starting and finishing each task
+      when the resources of the project are limited.
     - The actions we can do on the project
-      (add a Task, modify the layout of the tasks, access the project settings, save the project, close the project)
+      (add a Task, modify the layout of the tasks, access the project settings, save the project, close the project,
+      simulate the project)
+
+    These are the fields of the class:
+    - LONGEST_PATHS_COUNT: The number of paths highlighted by self.longest_paths_widget.
 
     These are the fields of a ProjectScreen:
     - project: The Project that the user is consulting.
     - menu: The id of the menu that the user is currently viewing.
-    - menu_buttons: A list of 4 buttons that allow the user to switch between the 4 different menus.
+    - menu_buttons: A list of 5 buttons that allow the user to switch between the 5 different menus.
     - task_information_widget: The TaskInformationWidget that displays the information of the selected task.
                                If no task is selected, this widget is not displayed.
     - tree_widget: The ShowTasksTreeWidget that displays the tree view of the tasks.
+    - longest_paths_widget: The ButtonWidget that allows the user to highlight (or not) the longest paths
+                            of the project in the tree view. They are the critical and the near-critical paths.
     - add_task_widget: The ButtonWidget that allows the user to add a task to the project.
     - modify_layout_widget: The ButtonWidget that allows the user to modify the layout of the tasks.
     - project_settings_widget: The ButtonWidget that allows the user to access the project settings.
@@ -36,8 +46,15 @@ class ProjectScreen(Screen):
     - earliest_gantt_widget: The GanttWidget that displays the earliest possible dates
                              for starting and finishing each task.
     - latest_gantt_widget: The GanttWidget that displays the latest possible dates for starting and finishing each task.
+    - resources_gantt_widget: The GanttWidget that displays the dates for starting and finishing each task
+                              when the resources of the project are limited.
+    - simulate_widget: The ButtonWidget that allows the user to start (or cancel) a Monte Carlo simulation of the project.
+    - simulation_label_widget: The LabelWidget that displays the progress or the results of the simulation.
+    - simulation: The NativeSimulation that is running or that ran last. It is None if no simulation was started.
     """
 
+    LONGEST_PATHS_COUNT = 5
+
     def __init__(self, project):
         """
         Creates a new ProjectScreen
@@ -45,19 +62,26 @@ class ProjectScreen(Screen):
         """
         self.project = project
         self.project.load()
+        # Without resources, the tasks are not leveled (the Gantt chart of the resources shows the earliest times)
+        if len(self.project.resources) != 0:
+            self.project.schedule_resources()
         self.menu = 0
-        self.menu_buttons = [ButtonWidget((0, 0), (479, 100), "Vue générale du projet", lambda: self.change_menu(0),
-                                          font_size=24, bold=True),
-                             ButtonWidget((480, 0), (479, 100), "Diagramme de Gantt (dates au plus tôt)",
-                                          lambda: self.change_menu(1), font_size=24),
-                             ButtonWidget((960, 0), (479, 100), "Diagramme de Gantt (dates au plus tard)",
-                                          lambda: self.change_menu(2), font_size=24),
-                             ButtonWidget((1440, 0), (479, 100), "Actions", lambda: self.change_menu(3), font_size=24)]
-        self.task_information_widget = TaskInformationWidget((10, 870), self.delete_task)
+        self.menu_buttons = [ButtonWidget((0, 0), (383, 100), "Vue générale du projet", lambda: self.change_menu(0),
+                                          font_size=20, bold=True),
+                             ButtonWidget((384, 0), (383, 100), "Diagramme de Gantt (dates au plus tôt)",
+                                          lambda: self.change_menu(1), font_size=20),
+                             ButtonWidget((768, 0), (383, 100), "Diagramme de Gantt (dates au plus tard)",
+                                          lambda: self.change_menu(2), font_size=20),
+                             ButtonWidget((1152, 0), (383, 100), "Diagramme de Gantt (ressources)",
+                                          lambda: self.change_menu(3), font_size=20),
+                             ButtonWidget((1536, 0), (384, 100), "Actions", lambda: self.change_menu(4), font_size=20)]
+        self.task_information_widget = TaskInformationWidget((10, 870), project, self.delete_task)
         self.tree_widget = ShowTasksTreeWidget((0, 100),
                                                (1920, 980),
                                                project,
                                                self.task_information_widget.set_task)
+        self.longest_paths_widget = ButtonWidget((1560, 110), (350, 60), "Afficher les chemins les plus longs",
+                                                 self.on_longest_paths, font_size=20)
         self.add_task_widget = ButtonWidget((710, 200), (500, 100), "Ajouter une tâche", self.on_add_widget,
                                             font_size=30, bold=True)
         self.modify_layout_widget = ButtonWidget((710, 310), (500, 100), "Modifier la disposition", self.modify_layout,
@@ -68,8 +92,13 @@ class ProjectScreen(Screen):
                                                 font_size=30, bold=True)
         self.go_back_widget = ButtonWidget((710, 640), (500, 100), "Fermer le projet", self.on_close_project,
                                            font_size=30, bold=True)
-        self.earliest_gantt_widget = GanttWidget(pygame.Rect(0, 100, 1920, 980), project, True)
-        self.latest_gantt_widget = GanttWidget(pygame.Rect(0, 100, 1920, 980), project, False)
+        self.earliest_gantt_widget = GanttWidget(pygame.Rect(0, 100, 1920, 980), project, GanttWidget.EARLIEST)
+        self.latest_gantt_widget = GanttWidget(pygame.Rect(0, 100, 1920, 980), project, GanttWidget.LATEST)
+        self.resources_gantt_widget = GanttWidget(pygame.Rect(0, 100, 1920, 980), project, GanttWidget.RESOURCES)
+        self.simulate_widget = ButtonWidget((710, 750), (500, 100), "Simuler le projet", self.on_simulate,
+                                            font_size=30, bold=True)
+        self.simulation_label_widget = LabelWidget((710, 860), "", font_size=24, color=(0, 0, 0))
+        self.simulation = None
 
     def get_widgets(self):
         """
@@ -79,18 +108,43 @@ class ProjectScreen(Screen):
         yield from self.menu_buttons
         if self.menu == 0:
             yield self.tree_widget
+            yield self.longest_paths_widget
             if self.tree_widget.selected_task is not None:
                 yield self.task_information_widget
         elif self.menu == 1:
             yield self.earliest_gantt_widget
         elif self.menu == 2:
             yield self.latest_gantt_widget
+        elif self.menu == 3:
+            yield self.resources_gantt_widget
         else:
             yield self.go_back_widget
             yield self.add_task_widget
             yield self.save_project_widget
             yield self.project_settings_widget
             yield self.modify_layout_widget
+            yield self.simulate_widget
+            yield self.simulation_label_widget
+
+    def update(self):
+        """
+        Updates the text of self.simulation_label_widget while a simulation is running
+        :return: None
+        """
+        if self.simulation is None:
+            return
+        if not self.simulation.is_done():
+            text = f"Simulation en cours... {self.simulation.get_progress():.0%}"
+        elif self.simulation.get_error() is not None:
+            text = "La simulation n'a pas pu être lancée"
+        elif self.simulation.get_result() is None:
+            text = "Simulation annulée"
+        else:
+            result = self.simulation.get_result()
+            text = f"{result.samples_count} échantillons : " \
+                   + ", ".join(f"P{percent} = {days:.1f} jours" for percent, days in result.get_percentiles().items())
+        if self.simulation_label_widget.text != text:
+            self.simulation_label_widget.set_text(text)
 
     def reload(self):
         """
@@ -98,9 +152,14 @@ class ProjectScreen(Screen):
         :return: None
         """
         self.project.load()
+        if len(self.project.resources) != 0:
+            self.project.schedule_resources()
         self.tree_widget.reload()
+        if len(self.tree_widget.highlighted_tasks) != 0:
+            self.tree_widget.highlight_paths(self.project.get_longest_paths(self.LONGEST_PATHS_COUNT))
         self.earliest_gantt_widget.reload()
         self.latest_gantt_widget.reload()
+        self.resources_gantt_widget.reload()
 
     def on_add_widget(self):
         """
@@ -123,7 +182,8 @@ class ProjectScreen(Screen):
         Deletes the given task from the project
         :return: None
         """
-        self.project.remove_task(self.tree_widget.selected_task)
+        with self.project.batch():
+            self.project.remove_task(self.tree_widget.selected_task)
         self.task_information_widget.set_task(None)
         self.reload()
 
@@ -135,6 +195,34 @@ class ProjectScreen(Screen):
         """
         Window.instance.set_screen(ModifyLayoutScreen(self.project, self))
 
+    def on_longest_paths(self):
+        """
+        Callback from self.longest_paths_widget. It highlights the LONGEST_PATHS_COUNT longest paths of the project
+        in the tree view, or stops highlighting them if they already are
+        :return: None
+        """
+        if len(self.tree_widget.highlighted_tasks) == 0:
+            self.tree_widget.highlight_paths(self.project.get_longest_paths(self.LONGEST_PATHS_COUNT))
+            self.longest_paths_widget.rerender(text="Masquer les chemins les plus longs")
+        else:
+            self.tree_widget.highlight_paths([])
+            self.longest_paths_widget.rerender(text="Afficher les chemins les plus longs")
+
+    def on_simulate(self):
+        """
+        Callback from self.simulate_widget. It starts a Monte Carlo simulation of the project in the background.
+        If a simulation is already running, it is cancelled instead
+        :return: None
+        """
+        if self.simulation is not None and not self.simulation.is_done():
+            self.simulation.cancel()
+            return
+        try:
+            self.simulation = self.project.start_simulation(10000)
+        except ValueError as e:
+            self.simulation = None
+            self.simulation_label_widget.set_text(str(e))
+
     def change_menu(self, menu):
         """
         Changes the menu that is currently displayed
@@ -145,12 +233,14 @@ class ProjectScreen(Screen):
         for i, btn in enumerate(self.menu_buttons):
             btn.rerender(bold=(i == self.menu))
 
-    @staticmethod
-    def on_close_project():
+    def on_close_project(self):
         """
         Callback from self.go_back_widget. It is called when the user wants to close the Project.
+        The summary of the Project displayed in the list of the projects is updated with its modifications.
         It sets the Screen to a ProjectListScreen
         :return: None
         """
         from render.screen.HomeScreen import HomeScreen
+        if Project.portfolio_scheduling is not None:
+            Project.portfolio_scheduling.set_summary(self.project.get_summary())
         Window.instance.set_screen(HomeScreen())
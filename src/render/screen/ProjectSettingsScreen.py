@@ -1,3 +1,6 @@
+import datetime
+
+from Calendar import Calendar
 from Project import Project
 from render.Window import Window
 from render.screen.Screen import Screen
@@ -24,6 +27,11 @@ class ProjectSettingsScreen(Screen):
     - description_entry : The EntryWidget used to edit the description of the Project.
                           By default, it is filled with the description of the Project.
     - description_warning_label : The LabelWidget used to display a warning if the description is invalid.
+    - start_date_label : The LabelWidget indicating the purpose of the following EntryWidget.
+    - start_date_entry : The EntryWidget used to edit the start date of the Project (in the Calendar.DATE_FORMAT).
+                         By default, it is filled with the start date of the Calendar of the Project,
+                         or empty if it has none. If it is emptied, the Project has no Calendar anymore.
+    - start_date_warning_label : The LabelWidget used to display a warning if the start date is invalid.
     - save_button : The ButtonWidget used to save the changes.
     - cancel_button : The ButtonWidget used to cancel the changes.
     - delete_button : The ButtonWithConfirmationWidget used to delete the Project.
@@ -46,6 +54,10 @@ class ProjectSettingsScreen(Screen):
         self.description_entry = EntryWidget((655, 380), (600, 300), (600, 300), -1, True,
                                              default_content=self.project.description)
         self.description_warning_label = LabelWidget((655, 685), "", color=(255, 0, 0), font_size=20)
+        self.start_date_label = LabelWidget((965, 210), "Date de début (JJ/MM/AAAA) :", color=(0, 0, 0), font_size=24)
+        self.start_date_entry = EntryWidget((965, 250), (200, 30), (200, 30), 10, False,
+                                            default_content=self.get_start_date())
+        self.start_date_warning_label = LabelWidget((965, 285), "", color=(255, 0, 0), font_size=20)
         self.save_button = ButtonWidget((655, 750), (300, 100), "Sauvegarder", self.on_save, font_size=30, bold=True)
         self.cancel_button = ButtonWidget((965, 750), (300, 100), "Annuler",
                                           lambda: Window.instance.set_screen(self.last_screen), font_size=30, bold=True)
@@ -64,6 +76,9 @@ class ProjectSettingsScreen(Screen):
         yield self.description_label
         yield self.description_entry
         yield self.description_warning_label
+        yield self.start_date_label
+        yield self.start_date_entry
+        yield self.start_date_warning_label
         yield self.save_button
         yield self.cancel_button
         yield self.delete_button
@@ -86,12 +101,38 @@ class ProjectSettingsScreen(Screen):
             is_valid = False
         else:
             self.description_warning_label.set_text("")
+        start_date = None
+        if self.start_date_entry.get_content() != "":
+            try:
+                start_date = datetime.datetime.strptime(self.start_date_entry.get_content(),
+                                                        Calendar.DATE_FORMAT).date()
+                self.start_date_warning_label.set_text("")
+            except ValueError:
+                self.start_date_warning_label.set_text("La date doit être au format JJ/MM/AAAA")
+                is_valid = False
         if not is_valid:
             return
         self.project.name = self.name_entry.get_content()
         self.project.description = self.description_entry.get_content()
+        if start_date is None:
+            self.project.calendar = None
+        elif self.project.calendar is None:
+            self.project.calendar = Calendar(start_date)
+        elif self.project.calendar.start_date != start_date:
+            self.project.calendar = Calendar(start_date, self.project.calendar.working_days,
+                                             self.project.calendar.holidays)
         Window.instance.set_screen(self.last_screen)
 
+    def get_start_date(self):
+        """
+        Gives the start date of the Project, to fill self.start_date_entry
+        :return: The start date of the Calendar of the Project in the Calendar.DATE_FORMAT, or an empty string
+                 if the Project has no Calendar
+        """
+        if self.project.calendar is None:
+            return ""
+        return self.project.calendar.start_date.strftime(Calendar.DATE_FORMAT)
+
     def on_delete(self):
         """
         Callback from self.delete_button. It deletes the Project and redirects the user to the HomeScreen
@@ -8,13 +8,16 @@ class GanttTaskWidget(Widget):
     """
     Represents a single Task in the GanttWidget.
     It is a rectangle that is spread over the whole time the task is being worked on.
+    In the graph of the earliest times, it is followed by an outline spreading over the total float of the task.
 
     These are the fields of the class :
     - COLORS : The colors used to represent the tasks.
+    - EARLIEST, LATEST, RESOURCES : The modes of the Widget, the times at which the task is represented
+                                    (the earliest or latest possible times, or the times when resources are limited).
 
     These are the fields of a GanttTaskWidget :
     - task : The Task that is represented by this Widget.
-    - is_earliest_graph : Whether the time represented is the earliest or the latest possible.
+    - mode : The times represented (EARLIEST, LATEST or RESOURCES).
     - total_time : The total time (in day) of the Project.
     - parent_bb : The bounding box of the parent Widget.
                   This is used while rendering to crop the bounding box of this Widget.
@@ -35,18 +38,22 @@ class GanttTaskWidget(Widget):
               0xff00ff,
               ]
 
-    def __init__(self, task, is_earliest_graph, total_time, parent_bb, get_y_offset):
+    EARLIEST = 0
+    LATEST = 1
+    RESOURCES = 2
+
+    def __init__(self, task, mode, total_time, parent_bb, get_y_offset):
         """
         Creates a new GanttTaskWidget
         :param task: The Task that is represented by this Widget
-        :param is_earliest_graph: Whether the time represented is the earliest or the latest possible
+        :param mode: The times represented (EARLIEST, LATEST or RESOURCES)
         :param total_time: The total time (in day) of the Project
         :param parent_bb: The bounding box of the parent Widget
         :param get_y_offset: A function that returns the number of pixels scrolled
         """
         super().__init__()
         self.task = task
-        self.is_earliest_graph = is_earliest_graph
+        self.mode = mode
         self.total_time = total_time
         self.parent_bb = parent_bb
         self.get_y_offset = get_y_offset
@@ -75,14 +82,33 @@ class GanttTaskWidget(Widget):
                              self.color,
                              pygame.Rect((100, 3 - self.amount_cropped), self.timeline_size))
         else:
-            start = self.task.earliest_start if self.is_earliest_graph else self.task.latest_start
-            end = start + self.task.estimated_time
+            start, end = self.get_times()
             pygame.draw.rect(surface,
                              self.color,
                              pygame.Rect(100 + start / self.total_time * self.timeline_size[0],
                                          3 - self.amount_cropped,
                                          (end - start) / self.total_time * self.timeline_size[0],
                                          self.timeline_size[1]))
+            # The task can end up to its latest finish without delaying the project
+            if self.mode == self.EARLIEST and self.task.total_float > 0:
+                pygame.draw.rect(surface,
+                                 self.color,
+                                 pygame.Rect(100 + end / self.total_time * self.timeline_size[0],
+                                             3 - self.amount_cropped,
+                                             self.task.total_float / self.total_time * self.timeline_size[0],
+                                             self.timeline_size[1]),
+                                 width=2)
+
+    def get_times(self):
+        """
+        Returns the times at which the task starts and ends in the graph
+        :return: A tuple containing the start and the end of the task (in days)
+        """
+        if self.mode == self.EARLIEST:
+            return self.task.earliest_start, self.task.earliest_finish
+        if self.mode == self.LATEST:
+            return self.task.latest_start, self.task.latest_finish
+        return self.task.leveled_start, self.task.leveled_start + self.task.estimated_time
 
     def get_bb(self):
         """
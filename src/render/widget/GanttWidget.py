@@ -12,11 +12,15 @@ class GanttWidget(Widget):
     by a rectangle that spreads over the time when the task is being done.
     The GanttWidget is scrollable to be able to display every task.
 
+    These are the fields of the class :
+    - EARLIEST : The mode of the graph of the earliest possible times.
+    - LATEST : The mode of the graph of the latest possible times.
+    - RESOURCES : The mode of the graph of the times when the resources of the Project are limited.
+
     These are the fields of a GanttWidget :
     - project : the Project to display
     - bb : the bounding box of the Widget
-    - is_earliest_graph : a boolean that indicates if the graph is the graph for the earliest possible times (True)
-                          or the latest (False)
+    - mode : the times displayed by the graph (EARLIEST, LATEST or RESOURCES)
     - scroll_bar : the ScrollBarWidget of the Widget
     - task_widgets : the list of GanttTaskWidget that represent the tasks of the project
     - total_time : the total number of days of the project
@@ -24,21 +28,24 @@ class GanttWidget(Widget):
     - font : the font used to display the time marks
     """
 
-    def __init__(self, bb, project, is_earliest_graph):
+    EARLIEST = GanttTaskWidget.EARLIEST
+    LATEST = GanttTaskWidget.LATEST
+    RESOURCES = GanttTaskWidget.RESOURCES
+
+    def __init__(self, bb, project, mode):
         """
         Creates a GanttWidget
         :param bb: The bounding box of the Widget
         :param project: The Project to display
-        :param is_earliest_graph: A boolean that indicates if the graph is the graph
-                                  for the earliest possible times (True) or the latest (False)
+        :param mode: The times displayed by the graph (EARLIEST, LATEST or RESOURCES)
         """
         super().__init__()
         self.project = project
         self.bb = bb
-        self.is_earliest_graph = is_earliest_graph
+        self.mode = mode
         self.scroll_bar = ScrollBarWidget(self.get_bb, lambda: project.tasks_count*50 + 50)
         self.task_widgets = []
-        self.total_time = self.project.project_task.earliest_start + self.project.project_task.estimated_time
+        self.total_time = self.get_total_time()
         self.generate_widgets(self.project.beginning_task)
         self.number_of_time_marks = (project.tasks_count // 5) % 5 + 5
         self.font = pygame.font.SysFont("Arial", 16)
@@ -53,16 +60,18 @@ class GanttWidget(Widget):
 
     def draw(self, surface):
         """
-        Draws the Widget on the given Surface. It draws the time marks
+        Draws the Widget on the given Surface. It draws the time marks, as dates if the Project has a Calendar
         :param surface: The Surface on which the Widget should be drawn
         :return: None
         """
         surface.fill(0xffffff)
         for i in range(self.number_of_time_marks):
-            time_mark = self.font.render(str((self.project.project_task.latest_start
-                                         + self.project.project_task.estimated_time) * i / self.number_of_time_marks),
-                                         False,
-                                         0x000000)
+            time = self.total_time * i / self.number_of_time_marks
+            # With a calendar, the time marks are the real dates
+            if self.project.calendar is not None:
+                time_mark = self.font.render(self.project.calendar.format_date(int(time)), False, 0x000000)
+            else:
+                time_mark = self.font.render(str(time), False, 0x000000)
             pos = 100 + (self.bb.width - 100) * i / self.number_of_time_marks
             surface.blit(time_mark, (pos - time_mark.get_width() / 2, 3))
             pygame.draw.line(surface, 0x000000, (pos, 20), (pos, self.bb.height))
@@ -73,10 +82,29 @@ class GanttWidget(Widget):
         :return: None
         """
         self.task_widgets.clear()
-        self.total_time = self.project.project_task.earliest_start + self.project.project_task.estimated_time
+        self.total_time = self.get_total_time()
         self.generate_widgets(self.project.beginning_task)
         self.number_of_time_marks = (self.project.tasks_count // 5) % 5 + 5
 
+    def get_total_time(self):
+        """
+        Returns the number of days displayed by the graph
+        :return: The number of days needed to complete the Project with the times of the graph
+        """
+        if self.get_task_mode() == self.RESOURCES:
+            return self.project.leveled_end
+        return self.project.get_project_end()
+
+    def get_task_mode(self):
+        """
+        Returns the times represented by the GanttTaskWidgets. Without resources, the tasks are never limited,
+        so the graph of the resources represents the earliest times instead of the leveled ones
+        :return: The mode of the GanttTaskWidgets (EARLIEST, LATEST or RESOURCES)
+        """
+        if self.mode == self.RESOURCES and len(self.project.resources) == 0:
+            return self.EARLIEST
+        return self.mode
+
     def generate_widgets(self, first_task):
         """
         Generates the GanttTaskWidgets for the given task and its downstream tasks on the same line.
@@ -85,14 +113,14 @@ class GanttWidget(Widget):
         :return: None
         """
         self.task_widgets.append(GanttTaskWidget(first_task,
-                                                 self.is_earliest_graph,
+                                                 self.get_task_mode(),
                                                  self.total_time,
                                                  self.bb,
                                                  self.scroll_bar.get_scroll_in_pixel))
         while len(first_task.downstream_tasks) == 1 and len(first_task.downstream_tasks[0].upstream_tasks) == 1:
             first_task = first_task.downstream_tasks[0]
             self.task_widgets.append(GanttTaskWidget(first_task,
-                                     self.is_earliest_graph,
+                                     self.get_task_mode(),
                                      self.total_time,
                                      self.bb,
                                      self.scroll_bar.get_scroll_in_pixel))
@@ -10,6 +10,7 @@ class LabelWidget(Widget):
 
     These are the fields of a LabelWidget :
     - color : The color of the text
+    - text : The text displayed
     - font : The font used to render the text
     - text_render : The Surface containing the rendered text.
                     We use this field to avoid recreating the Surface at each frame, as this surface is static.
@@ -45,5 +46,6 @@ class LabelWidget(Widget):
         :param text: The new text to display
         :return: None
         """
+        self.text = text
         self.text_render = self.font.render(text, False, self.color)
         self.bb = pygame.Rect(self.bb.topleft, (self.text_render.get_width(), self.text_render.get_height()))
@@ -1,5 +1,6 @@
 import pygame.font
 
+from Calendar import Calendar
 from render.widget.Widget import Widget
 
 
@@ -8,6 +9,7 @@ class ProjectItemWidget(Widget):
     """
     Represents a Project in the ProjectListWidget. The Project is represented by a rectangle containing its name
     and its description. Both of them are wrapped to fit the width of the ProjectItemWidget.
+    Below them, the summary of the schedule of the Project is displayed once it is computed.
 
     These are the fields of a ProjectItemWidget :
     - project : The Project that is represented by this ProjectItemWidget.
@@ -17,17 +19,22 @@ class ProjectItemWidget(Widget):
     - actual_bb : The actual bounding box of this ProjectItemWidget, taking into account the scroll
                   of the parent widget. This is where the Widget will be rendered.
     - crop_amount : The amount of pixels that are cropped from the top of the Widget.
+    - summary : The ProjectSummary of the Project. It is None while the Project is not scheduled.
+    - text_renders : The renders of the words of the name and the description, with their positions.
+    - summary_font : The font used to display the summary.
+    - summary_y : The vertical position of the summary.
     - render : The Surface containing the render of this ProjectItemWidget.
                This is computed before rendering to avoid computing it at every frame.
     """
 
-    def __init__(self, project, width, parent_bb, get_scroll):
+    def __init__(self, project, width, parent_bb, get_scroll, summary=None):
         """
         Creates a new ProjectItemWidget
         :param project: The Project that is represented by this ProjectItemWidget
         :param width: The width of the ProjectItemWidget
         :param parent_bb: The bounding box of the parent Widget
         :param get_scroll: A function that returns by how many pixels the parent widget is scrolled
+        :param summary: The ProjectSummary of the Project, if it is already computed
         """
         super().__init__()
         self.project = project
@@ -36,6 +43,7 @@ class ProjectItemWidget(Widget):
         self.bb = pygame.Rect(0, 0, width, 0)
         self.actual_bb = self.bb.copy()
         self.crop_amount = 0
+        self.summary = summary
         text_renders = []
         name_font = pygame.font.SysFont("Arial", 24)
         description_font = pygame.font.SysFont("Arial", 16)
@@ -62,13 +70,50 @@ class ProjectItemWidget(Widget):
                 y += font_height + 3
             text_renders.append((text_render, (x, y)))
             x += text_render.get_width() + whitespace_size
-        self.bb.height = y + font_height + 5
+        self.text_renders = text_renders
+        self.summary_font = pygame.font.SysFont("Arial", 16, italic=True)
+        # The line of the summary is kept even before the summary is computed, so the height never changes
+        self.summary_y = y + font_height + 10
+        self.bb.height = self.summary_y + self.summary_font.get_height() + 5
+        self.render = None
+        self.generate_render()
+
+    def generate_render(self):
+        """
+        Generates the render of the ProjectItemWidget. This is done to avoid generating it on every frame.
+        It is called when the ProjectItemWidget is created or when its summary is changed
+        :return: None
+        """
         self.render = pygame.Surface(self.bb.size)
         self.render.fill(0xaaaaaa)
-        for word in text_renders:
+        for word in self.text_renders:
             self.render.blit(word[0], word[1])
+        self.render.blit(self.summary_font.render(self.get_summary_text(), True, 0x000000), (5, self.summary_y))
         pygame.draw.rect(self.render, 0x000000, pygame.Rect((0, 0), self.bb.size), 1)
 
+    def get_summary_text(self):
+        """
+        Gives the text displaying the summary of the Project
+        :return: The text
+        """
+        if self.summary is None:
+            return "Planification en cours..."
+        if self.summary.error is not None:
+            return "Planification impossible"
+        text = f"Fin : {self.summary.project_end} jours"
+        if self.summary.end_date is not None:
+            text += f" (le {self.summary.end_date.strftime(Calendar.DATE_FORMAT)})"
+        return text + f", {self.summary.critical_count} tâches critiques"
+
+    def set_summary(self, summary):
+        """
+        Modifies the summary of the Project, and regenerates the render
+        :param summary: The new ProjectSummary
+        :return: None
+        """
+        self.summary = summary
+        self.generate_render()
+
     def draw(self, surface):
         """
         Draws the ProjectItemWidget on the given Surface
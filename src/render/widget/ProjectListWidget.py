@@ -16,23 +16,26 @@ class ProjectListWidget(Widget):
     - bb : The bounding box of the ProjectListWidget.
     - items : The list of ProjectItemWidget.
     - on_item_clicked : The callback function to call when a ProjectItemWidget is clicked.
+    - get_summary : The function giving the ProjectSummary of a Project, or None if it is not computed yet.
     - total_height : The total height of the ProjectListWidget. There are no correlations between this value
                      and the height of the bounding box. It simply represents the optimal height
                      of the ProjectListWidget, but does not influence on its real height.
     - scrollbar : The ScrollBarWidget of the ProjectListWidget.
     """
 
-    def __init__(self, bb, projects, on_item_clicked=lambda x: None):
+    def __init__(self, bb, projects, on_item_clicked=lambda x: None, get_summary=lambda x: None):
         """
         Creates a new ProjectListWidget
         :param bb: The bounding box of the ProjectListWidget
         :param projects: The list of Projects to display
         :param on_item_clicked: The callback function to call when a ProjectItemWidget is clicked
+        :param get_summary: The function giving the ProjectSummary of a Project, or None if it is not computed yet
         """
         super().__init__()
         self.bb = bb
         self.items = []
         self.on_item_clicked = on_item_clicked
+        self.get_summary = get_summary
         self.total_height = 0
         self.scrollbar = ScrollBarWidget(self.get_bb, lambda: self.total_height)
         self.set_projects(projects)
@@ -87,7 +90,7 @@ class ProjectListWidget(Widget):
         min_height_index = 0
         heights_of_lines = [10] * widgets_per_line
         for project in projects:
-            widget = ProjectItemWidget(project, 300, self.bb, self.get_scroll_in_pixel)
+            widget = ProjectItemWidget(project, 300, self.bb, self.get_scroll_in_pixel, self.get_summary(project))
             widget.set_position((min_height_index * 320 + first_widget_x + self.bb.x,
                                  heights_of_lines[min_height_index] + self.bb.y))
             heights_of_lines[min_height_index] += widget.bb.height + 20
@@ -95,3 +98,14 @@ class ProjectListWidget(Widget):
                 if height < heights_of_lines[min_height_index]:
                     min_height_index = i
             self.items.append(widget)
+
+    def update_summaries(self):
+        """
+        Gives their summary to the ProjectItemWidgets that did not have one yet
+        :return: None
+        """
+        for widget in self.items:
+            if widget.summary is None:
+                summary = self.get_summary(widget.project)
+                if summary is not None:
+                    widget.set_summary(summary)
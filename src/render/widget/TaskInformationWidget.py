@@ -13,6 +13,7 @@ class TaskInformationWidget(Widget):
 
     These are the fields of a TaskInformationWidget :
     - bb : The bounding box of the widget.
+    - project : The Project of the Task. Its Calendar is used to display the dates of the Task.
     - task : The Task that is being displayed.
     - font : The font used to display the information.
     - render : The surface that is drawn on the screen.
@@ -26,14 +27,16 @@ class TaskInformationWidget(Widget):
                       This action is not possible to undo, that is why a confirmation is required.
     """
 
-    def __init__(self, pos, on_delete_task):
+    def __init__(self, pos, project, on_delete_task):
         """
         Creates a new TaskInformationWidget
         :param pos: The position of the TaskInformationWidget
+        :param project: The Project of the displayed Tasks
         :param on_delete_task: The function to call when the user asks the deletion of the Task
         """
         super().__init__()
         self.bb = pygame.Rect(pos, (1900, 200))
+        self.project = project
         self.task = None
         self.font = pygame.font.SysFont("Arial", 20)
         self.render = None
@@ -81,26 +84,55 @@ class TaskInformationWidget(Widget):
         self.render.blit(self.font.render("Index de la tâche : " + str(self.task.index), True, (0, 0, 0)), (3, 43))
         self.render.blit(self.font.render("Durée estimée : " + str(self.task.estimated_time), True, (0, 0, 0)), (3, 63))
         self.render.blit(
-            self.font.render("Peut démarrer à partir de : " + str(self.task.earliest_start), True, (0, 0, 0)), (3, 83))
-        self.render.blit(self.font.render("Peut démarrer jusqu'au : " + str(self.task.latest_start), True, (0, 0, 0)),
-                         (3, 103))
+            self.font.render("Peut démarrer à partir de : " + self.format_day(self.task.earliest_start),
+                             True, (0, 0, 0)),
+            (3, 83))
+        self.render.blit(
+            self.font.render("Peut démarrer jusqu'au : " + self.format_day(self.task.latest_start), True, (0, 0, 0)),
+            (3, 103))
         self.render.blit(self.font.render("Statut : " + str(self.task.status), True, (0, 0, 0)), (3, 123))
         self.render.blit(self.font.render("Id de la tâche : " + str(self.task.id), True, (0, 0, 0)), (3, 143))
+        self.render.blit(
+            self.font.render("Peut finir à partir de : " + self.format_day(self.task.earliest_finish, True),
+                             True, (0, 0, 0)),
+            (600, 43))
+        self.render.blit(
+            self.font.render("Peut finir jusqu'au : " + self.format_day(self.task.latest_finish, True),
+                             True, (0, 0, 0)),
+            (600, 63))
+        self.render.blit(self.font.render("Marge totale : " + str(self.task.total_float), True, (0, 0, 0)), (600, 83))
+        self.render.blit(self.font.render("Marge libre : " + str(self.task.free_float), True, (0, 0, 0)), (600, 103))
+        # Only the dependencies that are not finish to start without lag are displayed
+        if len(self.task.dependencies) != 0:
+            dependencies = ", ".join(f"{dependency_type} après {task.name} ({lag:+d} jours)"
+                                     for task, (dependency_type, lag) in self.task.dependencies.items())
+            self.render.blit(self.font.render("Dépendances : " + dependencies, True, (0, 0, 0)), (600, 123))
+
+    def format_day(self, day, is_finish=False):
+        """
+        Formats a day of the schedule. If the Project has a Calendar, the date of the day is added
+        :param day: The number of working days since the beginning of the Project
+        :param is_finish: Whether the day is the finish of the Task, in which case the date is the last day worked
+        :return: The formatted day
+        """
+        if self.project.calendar is None:
+            return str(day)
+        date = self.project.calendar.get_finish_date(day) if is_finish else self.project.calendar.get_date(day)
+        return f"{day} (le {date.strftime(self.project.calendar.DATE_FORMAT)})"
 
     def update_status(self):
         """
-        Updates the TaskStatus of the Task and, if needed, the TaskStatus of the downstream tasks.
+        Updates the TaskStatus of the Task and, if needed, the TaskStatus of the downstream tasks
+        (see Task.set_status). The change of status can be undone like the other modifications of the Project.
         This also updates the change_status_button and regenerates the render.
         If needed, can_change_status is set to False.
         :return: None
         """
         self.task.update_status()
+        self.project.update_after_modifications()
         self.change_status_button.rerender(text="Prochain statut : " + str(self.task.status))
         self.generate_render()
         if self.task.status == TaskStatus.FINISHED:
-            for task in self.task.downstream_tasks:
-                if sum(t.status == TaskStatus.FINISHED for t in task.upstream_tasks) == len(task.upstream_tasks):
-                    task.status = TaskStatus.NOT_STARTED
             self.can_change_status = False
 
     def set_task(self, task):
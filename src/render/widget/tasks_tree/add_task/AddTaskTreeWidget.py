@@ -90,13 +90,13 @@ class AddTaskTreeWidget(TreeWidget):
         :param task:
         :return:
         """
-        # A list of all the Tasks that can still be selected
-        still_enabled_tasks = set()
-        for downstream in task.downstream_tasks:
-            for upstream in downstream.upstream_tasks:
-                still_enabled_tasks.add(upstream.id)
         for task_widget in self.task_widgets:
-            # If the task is not in the still_enabled_tasks set, it means that it can no longer be selected
-            # If it does, we do not enable it, because it could have been disabled by a previous call to this function
-            if task_widget.task.id not in still_enabled_tasks:
+            other_task = task_widget.task
+            # The Tasks that can still be selected join a downstream Task of the given Task. A Task upstream
+            # or downstream of the given Task is on the same path, so it cannot be selected with it : the index
+            # of the project tells it directly (see Task.is_upstream_of). Checking if a Task is in a TaskList
+            # does not go through it
+            # If it can still be selected, we do not enable it, because it could have been disabled by a previous call
+            if other_task.is_upstream_of(task) or task.is_upstream_of(other_task) or \
+                    not any(downstream in task.downstream_tasks for downstream in other_task.downstream_tasks):
                 task_widget.enabled = False
@@ -104,8 +104,12 @@ class ModifyLayoutTreeWidget(TreeWidget):
         # If at some point the depth (relative to the old downstream task) is negative,
         # then we left the branch, and we can conclude that the two tasks are not on the same branch
         # (at least not at the same depth)
+        # Both walks only follow one path between the two tasks, so we first check that there is a path at all
+        # (this does not need any walk, see Task.is_upstream_of)
         depth = 0
         if to_task.downstream_tasks_count < downstream_task.downstream_tasks_count:
+            if not downstream_task.is_upstream_of(to_task):
+                return
             current_task = to_task.upstream_tasks[0]
             if current_task == from_task:
                 # There must be at least one more
@@ -121,6 +125,8 @@ class ModifyLayoutTreeWidget(TreeWidget):
             if current_task != downstream_task or depth < 0:
                 return
         else:
+            if downstream_task != to_task and not to_task.is_upstream_of(downstream_task):
+                return
             current_task = to_task
             while current_task != downstream_task and \
                     current_task.downstream_tasks_count > downstream_task.downstream_tasks_count and \
@@ -132,22 +138,24 @@ class ModifyLayoutTreeWidget(TreeWidget):
                     depth -= 1
             if current_task != downstream_task or depth < 0:
                 return
-        downstream_tasks = list(from_task.downstream_tasks)
-        for task in downstream_tasks:
-            task.remove_upstream_task(from_task)
-        # We need to know at which position the task should be inserted as an upstream task
-        depth = 1
-        last_task = None
-        current_task = from_task
-        while depth > 0:
-            if len(current_task.upstream_tasks) > 1:
-                depth += 1
-            last_task = current_task
-            current_task = current_task.upstream_tasks[0]
-            if len(current_task.downstream_tasks) > 1:
-                depth -= 1
-        # We can now insert the task at the right position
-        downstream_task.add_upstream_task(from_task, current_task.downstream_tasks.index(last_task))
+        # The links are moved in a batch, so that the project is only updated once they are all moved
+        with self.project.batch():
+            downstream_tasks = list(from_task.downstream_tasks)
+            for task in downstream_tasks:
+                task.remove_upstream_task(from_task)
+            # We need to know at which position the task should be inserted as an upstream task
+            depth = 1
+            last_task = None
+            current_task = from_task
+            while depth > 0:
+                if len(current_task.upstream_tasks) > 1:
+                    depth += 1
+                last_task = current_task
+                current_task = current_task.upstream_tasks[0]
+                if len(current_task.downstream_tasks) > 1:
+                    depth -= 1
+            # We can now insert the task at the right position
+            downstream_task.add_upstream_task(from_task, current_task.downstream_tasks.index(last_task))
         self.reload()
 
     def on_mouse_motion_bb(self, pos, motion, buttons):
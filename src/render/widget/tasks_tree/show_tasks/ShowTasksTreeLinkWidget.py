@@ -6,13 +6,16 @@ class ShowTasksTreeLinkWidget(TreeLinkWidget):
     """
     Represents a link between two tasks in the ShowTaskTreeWidget.
     The only difference between this and the normal TreeLinkWidget is that the color of the link is set to red
-    if it represents a part of a critical path, i.e. if both tasks are critical.
+    if it represents a part of a critical path, i.e. if both tasks are critical,
+    and to orange if it represents a part of a highlighted path.
 
     These are the fields of a ShowTasksTreeLinkWidget:
     - is_critical: Whether the link represents a part of a critical path, i.e. whether both tasks are critical.
+    - is_highlighted: A function that returns whether the link represents a part of a highlighted path.
     """
 
-    def __init__(self, from_position, to_position, from_task, to_task, get_position_offset, get_parent_bb):
+    def __init__(self, from_position, to_position, from_task, to_task, get_position_offset, get_parent_bb,
+                 is_highlighted):
         """
         Creates a new ShowTasksTreeLinkWidget
         :param from_position: The absolute position the ShowTasksTreeLinkWidget is coming from
@@ -21,9 +24,11 @@ class ShowTasksTreeLinkWidget(TreeLinkWidget):
         :param to_task: The Task the ShowTasksTreeLinkWidget is going to
         :param get_position_offset: A function that returns the amount of pixels in each direction dragged by the user
         :param get_parent_bb: A function that returns the bounding box of the parent Widget
+        :param is_highlighted: A function that returns whether the link represents a part of a highlighted path
         """
         super().__init__(from_position, to_position, get_position_offset, get_parent_bb)
         self.is_critical = from_task.is_critical and to_task.is_critical
+        self.is_highlighted = is_highlighted
 
     def draw(self, surface):
         """
@@ -33,5 +38,7 @@ class ShowTasksTreeLinkWidget(TreeLinkWidget):
         """
         if self.is_critical:
             self._draw(surface, 0xff0000)
+        elif self.is_highlighted():
+            self._draw(surface, 0xff8800)
         else:
             super().draw(surface)
@@ -5,16 +5,18 @@ class ShowTasksTreeTaskWidget(TreeTaskWidget):
 
     """
     Represents a Task in a ShowTaskTreeWidget. The only difference between this and the normal TreeTaskWidget is that
-    the ShowTasksTreeTaskWidget is selectable.
+    the ShowTasksTreeTaskWidget is selectable, and that it is colored if it belongs to a highlighted path.
 
     These are the fields of a ShowTasksTreeTaskWidget :
     - on_click: A callback function that is called when the ShowTasksTreeTaskWidget is clicked.
                 It takes a parameter : the associated Task to the ShowTasksTreeTaskWidget
     - get_selected_task: A function that returns the currently selected Task.
                          This is used to know if the current instance is the Task selected.
+    - is_highlighted: A function that returns whether the Task belongs to a highlighted path.
     """
 
-    def __init__(self, task, position, get_position_offset, get_parent_bb, on_click, get_selected_task, get_scale):
+    def __init__(self, task, position, get_position_offset, get_parent_bb, on_click, get_selected_task, is_highlighted,
+                 get_scale):
         """
         Creates a new ShowTasksTreeTaskWidget
         :param task: The Task the ShowTasksTreeTaskWidget represents
@@ -23,12 +25,14 @@ class ShowTasksTreeTaskWidget(TreeTaskWidget):
         :param get_parent_bb: A function that returns the bounding box of the parent Widget
         :param on_click: A callback function that is called when the ShowTasksTreeTaskWidget is clicked
         :param get_selected_task: A function that returns the currently selected Task
+        :param is_highlighted: A function that returns whether the Task belongs to a highlighted path
         :param get_scale: A function that returns the information about the zoom. It returns a tuple where
                           the first element is the scale factor and the second element is the center of the zoom
         """
         super().__init__(task, position, get_position_offset, get_parent_bb, get_scale)
         self.on_click = on_click
         self.get_selected_task = get_selected_task
+        self.is_highlighted = is_highlighted
 
     def draw(self, surface):
         """
@@ -38,6 +42,8 @@ class ShowTasksTreeTaskWidget(TreeTaskWidget):
         """
         if self.get_selected_task() == self.task:
             self._draw(surface, circle_color=0xbbbbbb)
+        elif self.is_highlighted():
+            self._draw(surface, circle_color=0xffd8a8)
         else:
             super().draw(surface)
 
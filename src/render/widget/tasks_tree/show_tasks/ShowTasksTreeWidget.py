@@ -8,11 +8,15 @@ class ShowTasksTreeWidget(TreeWidget):
     """
     Represents a tree. This is a specialisation of the TreeWidget. The difference between a normal TreeWidget
     and a ShowTasksTreeWidget is that the ShowTasksTreeWidget allows the user to click on a Task to select it.
+    It can also highlight some paths of the Project, for example the near-critical ones.
 
     These are the fields of a ShowTasksTreeWidget :
     - selected_task: The Task that is currently selected by the user. If no Task is selected, this is None.
     - on_selection_change: A callback function that is called when the selected Task changes.
                            It takes a parameter : the new selected Task.
+    - highlighted_tasks: The set of the Tasks belonging to a highlighted path.
+    - highlighted_links: The set of the links belonging to a highlighted path,
+                         as tuples containing the upstream and the downstream Task.
     """
 
     def __init__(self, position, size, first_task, on_selection_change):
@@ -24,6 +28,8 @@ class ShowTasksTreeWidget(TreeWidget):
         :param on_selection_change: A callback function that is called when the selected Task changes.
                                     It takes the selected Task as parameter
         """
+        self.highlighted_tasks = set()
+        self.highlighted_links = set()
         super().__init__(position, size, first_task)
         self.selected_task = None
         self.on_selection_change = on_selection_change
@@ -46,6 +52,7 @@ class ShowTasksTreeWidget(TreeWidget):
                                        get_bb,
                                        self.on_task_clicked,
                                        lambda: self.selected_task,
+                                       lambda: task in self.highlighted_tasks,
                                        get_scale)
 
     def generate_tree_link_widget(self, start, end, get_position_offset, get_bb, from_task, to_task):
@@ -60,7 +67,13 @@ class ShowTasksTreeWidget(TreeWidget):
         :param to_task: The Task the ShowTasksTreeLinkWidget is going to
         :return: The generated ShowTasksTreeLinkWidget
         """
-        return ShowTasksTreeLinkWidget(start, end, from_task, to_task, get_position_offset, get_bb)
+        return ShowTasksTreeLinkWidget(start,
+                                       end,
+                                       from_task,
+                                       to_task,
+                                       get_position_offset,
+                                       get_bb,
+                                       lambda: (from_task, to_task) in self.highlighted_links)
 
     def on_task_clicked(self, task):
         """
@@ -72,3 +85,13 @@ class ShowTasksTreeWidget(TreeWidget):
         """
         self.selected_task = None if self.selected_task == task else task
         self.on_selection_change(self.selected_task)
+
+    def highlight_paths(self, paths):
+        """
+        Highlights the given paths. The paths highlighted before are not highlighted anymore
+        :param paths: The paths to highlight, as given by Project.get_longest_paths : each path is a tuple containing
+                      its length and the list of its Tasks. If it is empty, nothing is highlighted
+        :return: None
+        """
+        self.highlighted_tasks = {task for _, tasks in paths for task in tasks}
+        self.highlighted_links = {(tasks[i], tasks[i + 1]) for _, tasks in paths for i in range(len(tasks) - 1)}
@@ -0,0 +1,104 @@
+"""
+This file contains the registry of the scheduling backends.
+A backend is a module computing the schedule of a Project. Every backend has the same functions :
+fix_indices, schedule and update_schedule.
+They all take the Project as their only parameter, and they write their results in the TaskArena of the Project.
+compute_earliest_start, compute_latest_start and identify_critical_tasks are deprecated, and they are defined here
+for every backend : schedule computes every value at once, so they only compute the schedule again with the backend
+of the Project if it is not current (see TaskArena.is_schedule_current).
+"""
+
+import warnings
+
+from utils import c_functions, numpy_functions
+
+# The registered backends, by name. When no backend is asked for, the first available one is used
+backends = {}
+# The name of the backend used by the Projects that do not ask for a specific one. None means automatic
+default_backend = None
+
+
+def register_backend(name, module):
+    """
+    Registers a scheduling backend. The backends registered first are preferred
+    :param name: The name of the backend
+    :param module: The module (or any object) having the functions of a backend,
+                   and a field available telling whether it can be used
+    :return: None
+    """
+    backends[name] = module
+
+
+def available_backends():
+    """
+    Lists the backends that can be used
+    :return: The names of the available backends, from the preferred one to the least preferred one
+    """
+    return [name for name, backend in backends.items() if backend.available]
+
+
+def get_backend(name=None):
+    """
+    Finds a scheduling backend
+    :param name: The name of the backend. If it is None, default_backend is used,
+                 and if it is None too, the preferred available backend is returned
+    :return: The backend
+    :raise ValueError: If the backend does not exist or is not available
+    """
+    if name is None:
+        name = default_backend
+    if name is None:
+        names = available_backends()
+        if len(names) == 0:
+            raise ValueError("No scheduling backend is available. Compile Core.c, or install NumPy")
+        name = names[0]
+    if name not in backends:
+        raise ValueError(f"Unknown scheduling backend {name}. The backends are {', '.join(backends)}")
+    if not backends[name].available:
+        raise ValueError(f"The scheduling backend {name} is not available")
+    return backends[name]
+
+
+register_backend("c", c_functions)
+register_backend("numpy", numpy_functions)
+
+
+def _schedule_if_outdated(project, name):
+    """
+    Used by the deprecated functions computing a single value of the schedule. Every value is computed by schedule
+    (or update_schedule) at once, so the schedule is only computed again if a Task was modified since the last one
+    :param project: The project
+    :param name: The name of the deprecated function
+    :return: None
+    """
+    warnings.warn(f"{name} is deprecated, every value is computed by schedule and update_schedule",
+                  DeprecationWarning, stacklevel=3)
+    if not project.arena.is_schedule_current():
+        get_backend(project.backend).update_schedule(project)
+
+
+def compute_earliest_start(project):
+    """
+    Deprecated. Computes the earliest_start of each task of the project, if the schedule is not current
+    :param project: The project
+    :return: None
+    """
+    _schedule_if_outdated(project, "compute_earliest_start")
+
+
+def compute_latest_start(project):
+    """
+    Deprecated. Computes the latest_start of each task of the project, if the schedule is not current
+    :param project: The project
+    :return: None
+    """
+    _schedule_if_outdated(project, "compute_latest_start")
+
+
+def identify_critical_tasks(project):
+    """
+    Deprecated. Sets the value of is_critical for each task of the project, if the schedule is not current
+    :param project: The project
+    :return: None
+    """
+    _schedule_if_outdated(project, "identify_critical_tasks")
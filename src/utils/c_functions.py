@@ -1,206 +1,904 @@
 import os
+import random
 import sys
-from ctypes import CDLL, POINTER, c_int, Structure, c_char_p, cast, pointer, byref
-
-if sys.platform == "win32":
-    dll = CDLL(f"{os.path.abspath(os.curdir)}\\Core.dll")
-elif sys.platform == "linux":
-    dll = CDLL(f"{os.path.abspath(os.curdir)}/Core.so")
-elif sys.platform == "darwin":
-    dll = CDLL(f"{os.path.abspath(os.curdir)}/Core.dylib")
-else:
-    print("Platform not recognized", file=sys.stderr)
-    sys.exit(0)
-
-
-class Task_Struct(Structure):
-
-    """
-    Represents a Task as a C struct. This is used to pass data to the C functions via ctypes.
-
-    These are the fields of the class:
-    - _tasks : A list of all the Task_Structs representing a Project. This is used to keep track of the Task_Structs
-               that have been created. The Task_Structs are in the right order, so that the id of the Task_Structs
-               match the position in the list.
-
-    These are the fields of a Task_Struct :
-    - _task : The Task this structure represents.
-    - _downstream_tasks_id : The ids of the downstream Tasks.
-    - _upstream_tasks_id : The ids of the upstream Tasks.
-    - name : The name of the Task.
-    - successors : A list of pointers of Task_Struct representing the downstream Task_Structs
-                  (in the form of a double pointer of Task_Struct).
-    - ancestors : A list of pointers of Task_Struct representing the upstream Task_Structs
-                 (in the form of a double pointer of Task_Struct).
-    - id : The id of the Task.
-    - successors_count : The length of the array of downstream Tasks.
-    - ancestors_count : The length of the array of upstream Tasks.
-    - index : The index of the Task.
-    - duration : The estimated duration of the Task.
-    - earlier : The earliest possible start of the Task (In day. The first Task starts at day 0).
-    - later : The latest possible start of the Task (In day. The first Task starts at day 0).
-    - is_critical : Whether the Task is critical.
-    """
-
-    _tasks = []
+import threading
+from array import array
+from itertools import accumulate, chain
+from operator import attrgetter, itemgetter
+from ctypes import CDLL, POINTER, c_bool, c_int, c_double, c_ulonglong, Structure, byref
 
-    @staticmethod
-    def convert_tasks(first_task, task_count):
-        """
-        Convert a list of tasks into a list of Task_Struct
-        :param first_task: The first task of the project
-        :param task_count: The number of tasks in the project
-        :return: None
-        """
-        # Initialize the list of Task_Struct
-        Task_Struct._tasks = [None] * task_count
-        # Create the first task (which will create all the others in a recursive way)
-        Task_Struct(first_task)
-        # Load data into the Task_Struct
-        for i, task in enumerate(Task_Struct._tasks):
-            # There should not be any, but we still check, just in case
-            # If this occurs, code may not continue working properly
-            if task is None:
-                print(f"Task with id {i} doesn't seem to exist. "
-                      f"This error occurred while converting tasks to task structures", file=sys.stderr)
-                continue
-            task.load()
+from DependencyType import DependencyType
+from ReachabilityIndex import ReachabilityIndex
+from SimulationResult import SimulationResult
 
-    @staticmethod
-    def get_converted_task(task):
-        """
-        Get the Task_Struct corresponding to a specific Task
-        :param task: The Task to get the Task_Struct of
-        :return: The Task_Struct corresponding to the given Task
-        """
-        return Task_Struct._tasks[task.id]
-
-    def __init__(self, task):
-        """
-        Initialize a Task_Struct. This will also initialize non-initialized downstream structures.
-        Values will not be initialized until the load() method is called.
-        :param task: The task this structure represents
-        """
-        super().__init__()
-        Task_Struct._tasks[task.id] = self
-        self._task = task
-        self._downstream_tasks_id = [task.id for task in self._task.downstream_tasks]
-        # Create downstream Task_Struct if they are not already created
-        for task in self._task.downstream_tasks:
-            if Task_Struct._tasks[task.id] is None:
-                Task_Struct(task)
-        self._upstream_tasks_id = [task.id for task in self._task.upstream_tasks]
-        self.name = b""
-        self.successors = POINTER(POINTER(Task_Struct))()
-        self.ancestors = POINTER(POINTER(Task_Struct))()
-        self.id = 0
-        self.successors_count = 0
-        self.ancestors_count = 0
-        self.index = 0
-        self.duration = 0
-        self.earlier = 0
-        self.later = 0
-        self.duration = 0
-        self.is_critical = False
-
-    def load(self):
-        """
-        Load data from the Task into the Task_Struct
-        :return: None
-        """
-        self.name = self._task.name.encode("utf-8")
-        downstream_tasks_array_type = POINTER(Task_Struct) * len(self._downstream_tasks_id)
-        downstream_tasks_pointers = [pointer(Task_Struct._tasks[i]) for i in self._downstream_tasks_id]
-        self.successors = cast(downstream_tasks_array_type(*downstream_tasks_pointers), POINTER(POINTER(Task_Struct)))
-        upstream_tasks_array_type = POINTER(Task_Struct) * len(self._upstream_tasks_id)
-        upstream_tasks_pointers = [pointer(Task_Struct._tasks[i]) for i in self._upstream_tasks_id]
-        self.ancestors = cast(upstream_tasks_array_type(*upstream_tasks_pointers), POINTER(POINTER(Task_Struct)))
-        self.id = c_int(self._task.id)
-        self.successors_count = len(self._task.downstream_tasks)
-        self.ancestors_count = len(self._task.upstream_tasks)
-        self.index = c_int(self._task.index)
-        self.duration = self._task.estimated_time
-        self.earlier = self._task.earliest_start
-        self.later = self._task.latest_start
-        self.is_critical = self._task.is_critical
+_library_extensions = {"win32": "dll", "linux": "so", "darwin": "dylib"}
 
-    @staticmethod
-    def save_indices():
+# The library is optional : if it cannot be loaded, the other scheduling backends are used instead (see backends.py)
+try:
+    dll = CDLL(os.path.join(os.path.abspath(os.curdir), f"Core.{_library_extensions[sys.platform]}"))
+except KeyError:
+    print("Platform not recognized, the C functions will not be available", file=sys.stderr)
+    dll = None
+except OSError as e:
+    print(f"The C library could not be loaded, the C functions will not be available : {e}", file=sys.stderr)
+    dll = None
+
+available = dll is not None
+
+
+class Tasks_Struct(Structure):
+
+    """
+    Represents the Tasks of a Project as a C struct. This is used to pass data to the C functions via ctypes.
+    It does not own any data : every field points to an array of a TaskArena, without copying it.
+    The values of the Task stored in the slot i of the TaskArena are at the position i of each array.
+
+    These are the fields of a Tasks_Struct :
+    - id_count : The number of slots. Every array of values has this length.
+    - successor_offsets : The position of the first downstream Task of each Task in the successors array.
+    - successor_counts : The number of downstream Tasks of each Task.
+    - successors : The slots of the downstream Tasks.
+    - successor_types : The DependencyType of each edge of the successors array.
+    - successor_lags : The lag of each edge of the successors array.
+    - ancestor_offsets : The position of the first upstream Task of each Task in the ancestors array.
+    - ancestor_counts : The number of upstream Tasks of each Task.
+    - ancestors : The slots of the upstream Tasks.
+    - ancestor_types : The DependencyType of each edge of the ancestors array.
+    - ancestor_lags : The lag of each edge of the ancestors array.
+    - duration : The estimated duration of each Task.
+    - index : The index of each Task.
+    - earlier : The earliest possible start of each Task (In day. The first Task starts at day 0).
+    - later : The latest possible start of each Task (In day. The first Task starts at day 0).
+    - is_critical : Whether each Task is critical.
+    - earlier_finish : The earliest possible end of each Task.
+    - later_finish : The latest possible end of each Task.
+    - total_float : The number of days each Task can be delayed without delaying the end of the project.
+    - free_float : The number of days each Task can be delayed without delaying any downstream Task.
+    - project_end : A single value, the number of days needed to complete the project.
+    - position : The position of each Task in the last topological order computed.
+    """
+
+    _fields_ = [
+        ('id_count', c_int),
+        ('successor_offsets', POINTER(c_int)),
+        ('successor_counts', POINTER(c_int)),
+        ('successors', POINTER(c_int)),
+        ('successor_types', POINTER(c_int)),
+        ('successor_lags', POINTER(c_int)),
+        ('ancestor_offsets', POINTER(c_int)),
+        ('ancestor_counts', POINTER(c_int)),
+        ('ancestors', POINTER(c_int)),
+        ('ancestor_types', POINTER(c_int)),
+        ('ancestor_lags', POINTER(c_int)),
+        ('duration', POINTER(c_int)),
+        ('index', POINTER(c_int)),
+        ('earlier', POINTER(c_int)),
+        ('later', POINTER(c_int)),
+        ('is_critical', POINTER(c_int)),
+        ('earlier_finish', POINTER(c_int)),
+        ('later_finish', POINTER(c_int)),
+        ('total_float', POINTER(c_int)),
+        ('free_float', POINTER(c_int)),
+        ('project_end', POINTER(c_int)),
+        ('position', POINTER(c_double)),
+    ]
+
+
+class EdgeList:
+
+    """
+    The edges of one direction (either successors or ancestors) of a TaskArena,
+    in a compressed sparse row layout with some spare room. The DependencyType and the lag of each edge
+    are stored in two arrays with the same layout.
+    The edges of the slot i are edges[offsets[i]:offsets[i] + counts[i]]. After them, there are
+    sizes[i] - counts[i] unused values, so that adding an edge does not move the edges most of the time.
+    When a slot is full, its edges are moved at the end of the edges array, with twice as much room.
+    The room left behind is reclaimed when more than half of the edges array is unused.
+
+    These are the fields of an EdgeList :
+    - offsets : The position of the first edge of each slot.
+    - counts : The number of edges of each slot.
+    - sizes : The room reserved for the edges of each slot.
+    - edges : The slots at the other end of the edges.
+    - types : The DependencyType of each edge.
+    - lags : The lag of each edge.
+    - unused : The number of values of the edges array that do not belong to any slot anymore.
+    """
+
+    def __init__(self):
+        """
+        Creates a new empty EdgeList
         """
-        Save the index of every Task_Struct into its corresponding Task.
-        This method does not save other data.
+        self.offsets = array("i")
+        self.counts = array("i")
+        self.sizes = array("i")
+        self.edges = array("i")
+        self.types = array("i")
+        self.lags = array("i")
+        self.unused = 0
+
+    def grow(self, capacity):
+        """
+        Adds slots without any edge, so that there are capacity slots
+        :param capacity: The new number of slots
         :return: None
         """
-        for task_struct in Task_Struct._tasks:
-            task_struct._task.index = task_struct.index
+        added = capacity - len(self.offsets)
+        self.offsets.extend([len(self.edges)] * added)
+        self.counts.extend([0] * added)
+        self.sizes.extend([0] * added)
 
-    @staticmethod
-    def save_earliest_start():
+    def fill(self, counts, edges, types, lags):
         """
-        Saves the earliest_start of every Task_Struct into its corresponding Task.
-        This method does not save other data.
+        Replaces the edges of every slot at once. No room is reserved, so this is much faster than inserting the edges
+        one by one, and it is used when the whole graph is known (see TaskArena.__init__)
+        :param counts: The number of edges of each of the first slots. The other slots have no edge
+        :param edges: The slots at the other end of all the edges, slot after slot
+        :param types: The DependencyType of all the edges, in the same order
+        :param lags: The lag of all the edges, in the same order
         :return: None
         """
-        for task_struct in Task_Struct._tasks:
-            task_struct._task.earliest_start = task_struct.earlier
+        empty_count = len(self.offsets) - len(counts)
+        self.offsets = array("i", accumulate(counts, initial=0))
+        self.offsets.extend([self.offsets.pop()] * empty_count)
+        self.counts = array("i", counts)
+        self.counts.extend([0] * empty_count)
+        self.sizes = array("i", self.counts)
+        self.edges = array("i", edges)
+        self.types = array("i", types)
+        self.lags = array("i", lags)
+        self.unused = 0
 
-    @staticmethod
-    def save_latest_start():
+    def get(self, slot):
+        """
+        Returns the edges of a slot
+        :param slot: The slot
+        :return: An array containing the slots at the other end of the edges, in order
+        """
+        return self.edges[self.offsets[slot]:self.offsets[slot] + self.counts[slot]]
+
+    def insert(self, slot, position, target_slot, dependency_type=0, lag=0):
+        """
+        Inserts an edge into the edges of a slot
+        :param slot: The slot owning the edge
+        :param position: Where to insert the edge. If it is None, it is added at the end.
+                         It behaves like the index given to list.insert, so it can be negative or too big
+        :param target_slot: The slot at the other end of the edge
+        :param dependency_type: The DependencyType of the edge. By default, it is FINISH_TO_START
+        :param lag: The lag of the edge. By default, it is 0
+        :return: None
+        """
+        count = self.counts[slot]
+        if count == self.sizes[slot]:
+            self._relocate(slot, max(2, count * 2))
+        if position is None or position > count:
+            position = count
+        elif position < 0:
+            position = max(0, count + position)
+        offset = self.offsets[slot]
+        for values, value in ((self.edges, target_slot), (self.types, dependency_type), (self.lags, lag)):
+            values[offset + position + 1:offset + count + 1] = values[offset + position:offset + count]
+            values[offset + position] = value
+        self.counts[slot] = count + 1
+
+    def remove(self, slot, position):
+        """
+        Removes an edge from the edges of a slot, keeping the order of the other edges
+        :param slot: The slot owning the edge
+        :param position: The position of the edge in the edges of the slot
+        :return: None
+        """
+        offset = self.offsets[slot]
+        count = self.counts[slot]
+        for values in (self.edges, self.types, self.lags):
+            values[offset + position:offset + count - 1] = values[offset + position + 1:offset + count]
+        self.counts[slot] = count - 1
+
+    def replace(self, slot, position, new_target_slot):
+        """
+        Replaces the slot at the other end of an edge. The edge keeps its DependencyType and its lag
+        :param slot: The slot owning the edge
+        :param position: The position of the edge in the edges of the slot
+        :param new_target_slot: The slot that replaces the one at the other end of the edge
+        :return: None
+        """
+        self.edges[self.offsets[slot] + position] = new_target_slot
+
+    def set_dependency(self, slot, position, dependency_type, lag):
+        """
+        Modifies the DependencyType and the lag of an edge
+        :param slot: The slot owning the edge
+        :param position: The position of the edge in the edges of the slot
+        :param dependency_type: The new DependencyType
+        :param lag: The new lag
+        :return: None
+        """
+        self.types[self.offsets[slot] + position] = dependency_type
+        self.lags[self.offsets[slot] + position] = lag
+
+    def clear(self, slot):
+        """
+        Removes every edge of a slot. Its room is kept, so that it can be used by the next Task using this slot
+        :param slot: The slot
+        :return: None
         """
-        Saves the latest_start of every Task_Struct into its corresponding Task.
-        This method does not save other data.
+        self.counts[slot] = 0
+
+    def _relocate(self, slot, size):
+        """
+        Moves the edges of a slot at the end of the edges array, with more room
+        :param slot: The slot
+        :param size: The new room reserved for the edges of the slot
+        :return: None
+        """
+        if self.unused > len(self.edges) // 2:
+            self._compact()
+        offset = self.offsets[slot]
+        count = self.counts[slot]
+        self.unused += self.sizes[slot]
+        self.offsets[slot] = len(self.edges)
+        self.sizes[slot] = size
+        for values in (self.edges, self.types, self.lags):
+            values.extend(values[offset:offset + count])
+            values.extend([0] * (size - count))
+
+    def _compact(self):
+        """
+        Rebuilds the edges array without the room that does not belong to any slot anymore
+        :return: None
+        """
+        edges, types, lags = array("i"), array("i"), array("i")
+        for slot in range(len(self.offsets)):
+            offset = self.offsets[slot]
+            self.offsets[slot] = len(edges)
+            edges.extend(self.edges[offset:offset + self.sizes[slot]])
+            types.extend(self.types[offset:offset + self.sizes[slot]])
+            lags.extend(self.lags[offset:offset + self.sizes[slot]])
+        self.edges = edges
+        self.types = types
+        self.lags = lags
+        self.unused = 0
+
+
+class TaskArena:
+
+    """
+    The native representation of the Tasks of a Project. It is owned by the Project, and it is kept up to date
+    by the Tasks themselves when their upstream or downstream Tasks change, so it never needs to be rebuilt.
+
+    Every Task has a slot in the arena. The values of the Tasks are stored as plain int arrays (one value per slot),
+    and the edges are stored in two EdgeLists. They are kept in the same order as the upstream_tasks
+    and downstream_tasks TaskLists of the Tasks, so the position of an edge is given by TaskList.index
+    (the edges are modified before the TaskLists). These arrays are given to the C functions without being copied,
+    and the C functions write their results directly in them. The Tasks then read their values from the arrays.
+    When there is no free slot anymore, the arena doubles its capacity.
+
+    The arena also keeps the topological order computed by the last full schedule, as a position for each slot,
+    and the slots whose values may have changed since then. This way, the schedule can be updated
+    by only visiting the Tasks that were affected by the modifications (see update_schedule).
+    The order is kept valid while edges are added, by moving one of the two Tasks between its neighbours.
+    If that is not possible, order_valid is set to False, and the next update is a full schedule.
+
+    During a batch of modifications (see Project.batch), the arena also keeps a journal : the first time a Task
+    is modified, its state is saved, so that every modification of the batch can be undone (see restore).
+    Every modification is also recorded as the operation undoing it, for the history of the Project
+    (see Project.undo). It only contains the Tasks and the positions involved, not a copy of the Tasks.
+
+    These are the fields of a TaskArena :
+    - capacity : The number of slots of the arena.
+    - tasks : The Task stored in each slot, or None if the slot is free.
+    - free_slots : The slots that are not used. The last one is the next one to be used.
+    - successors : The EdgeList of the downstream Tasks of each slot.
+    - ancestors : The EdgeList of the upstream Tasks of each slot.
+    - duration : The estimated_time of each slot.
+    - index : The index of each slot.
+    - earlier : The earliest_start of each slot.
+    - later : The latest_start of each slot.
+    - is_critical : Whether each slot is critical (1) or not (0).
+    - earlier_finish : The earliest_finish of each slot.
+    - later_finish : The latest_finish of each slot.
+    - total_float : The total_float of each slot.
+    - free_float : The free_float of each slot.
+    - project_end : An array containing a single value, the number of days needed to complete the project.
+    - position : The position of each slot in the topological order.
+    - order_valid : Whether the positions are a valid topological order.
+    - next_position : The position given to the next Task added to the arena.
+    - dirty_earlier : The slots whose earliest_start may have changed since the last computation.
+    - dirty_later : The slots whose latest_start may have changed since the last computation.
+    - end_dirty : Whether a Task finishing at the end of the project was removed since the last computation,
+                  in which case the project may end earlier.
+    - reachability : The ReachabilityIndex of the Tasks, answering Task.is_upstream_of.
+    - journal : A dictionary associating each Task modified since the start of the current batch to its state
+                before the batch (see save_task), or to None if it was added during the batch.
+                It is None if there is no batch.
+    - operations : The operations undoing the modifications made since the last update of the Project, in the order
+                   of the modifications (see Project.update_after_modifications). Each operation is a tuple :
+                   ("add_task", task), ("remove_task", task),
+                   ("add_edge", upstream task, downstream task, upstream index, downstream index, type, lag),
+                   ("remove_edge", upstream task, downstream task), ("set_dependency", upstream task, downstream task,
+                   type, lag), ("set_estimated_time", task, estimated_time) or ("set_status", task, status).
+    """
+
+    # The arrays containing the values of the Tasks, with the name of the field of the Task they contain
+    VALUE_FIELDS = {"duration": "estimated_time",
+                    "index": "index",
+                    "earlier": "earliest_start",
+                    "later": "latest_start",
+                    "is_critical": "is_critical",
+                    "earlier_finish": "earliest_finish",
+                    "later_finish": "latest_finish",
+                    "total_float": "total_float",
+                    "free_float": "free_float"}
+
+    def __init__(self, tasks):
+        """
+        Creates a new TaskArena containing the given Tasks.
+        The Tasks may already be linked together, their edges are copied into the arena all at once
+        :param tasks: The Tasks of the Project
+        """
+        self.capacity = 0
+        self.tasks = []
+        self.free_slots = []
+        self.successors = EdgeList()
+        self.ancestors = EdgeList()
+        for array_name in TaskArena.VALUE_FIELDS:
+            setattr(self, array_name, array("i"))
+        self.project_end = array("i", [0])
+        self.position = array("d")
+        self.order_valid = False
+        self.next_position = 0
+        self.dirty_earlier = set()
+        self.dirty_later = set()
+        self.end_dirty = False
+        self.journal = None
+        self.operations = []
+        self.reachability = ReachabilityIndex(self)
+        self._grow(max(2, len(tasks)))
+        # We add all the Tasks at once : the Task i gets the slot i, like add_task would give it
+        self.free_slots = self.free_slots[:self.capacity - len(tasks)]
+        self.tasks[:len(tasks)] = tasks
+        # The Tasks are not in an arena yet, so their values are read where they store them (see _ArenaValue)
+        for array_name, field in TaskArena.VALUE_FIELDS.items():
+            getattr(self, array_name)[:len(tasks)] = array("i", map(attrgetter("_" + field), tasks))
+        self.position[:len(tasks)] = array("d", range(len(tasks)))
+        self.next_position = len(tasks)
+        self.dirty_earlier = set(range(len(tasks)))
+        self.dirty_later = set(range(len(tasks)))
+        for slot, task in enumerate(tasks):
+            task.arena = self
+            task.slot = slot
+        # The edges are given as flat sequences, so that no object is created for each edge of a big project
+        default_dependency = (DependencyType.FINISH_TO_START, 0)
+        dependencies = [task.dependencies.get(upstream_task, default_dependency)
+                        for task in tasks for upstream_task in task.upstream_tasks]
+        self.ancestors.fill([len(task.upstream_tasks) for task in tasks],
+                            [upstream_task.slot for task in tasks for upstream_task in task.upstream_tasks],
+                            map(itemgetter(0), dependencies), map(itemgetter(1), dependencies))
+        dependencies = [downstream_task.dependencies.get(task, default_dependency)
+                        for task in tasks for downstream_task in task.downstream_tasks]
+        self.successors.fill([len(task.downstream_tasks) for task in tasks],
+                             [downstream_task.slot for task in tasks for downstream_task in task.downstream_tasks],
+                             map(itemgetter(0), dependencies), map(itemgetter(1), dependencies))
+
+    def add_task(self, task):
+        """
+        Adds a Task to the arena. The Task should not be linked to Tasks of the arena yet.
+        The values of the Task are moved into the arena
+        :param task: The Task to add
+        :return: None
+        """
+        if self.journal is not None and task not in self.journal:
+            self.journal[task] = None
+        self.operations.append(("remove_task", task))
+        if len(self.free_slots) == 0:
+            self._grow(self.capacity * 2)
+        slot = self.free_slots.pop()
+        self.tasks[slot] = task
+        for array_name, field in TaskArena.VALUE_FIELDS.items():
+            getattr(self, array_name)[slot] = getattr(task, field)
+        self.position[slot] = self.next_position
+        self.next_position += 1
+        self.dirty_earlier.add(slot)
+        self.dirty_later.add(slot)
+        self.reachability.add_slot(slot)
+        task.arena = self
+        task.slot = slot
+
+    def remove_task(self, task):
+        """
+        Removes a Task from the arena. The Task should not have any upstream or downstream Task anymore.
+        The Task keeps the values it had in the arena
+        :param task: The Task to remove
+        :return: None
+        """
+        self.save_task(task)
+        self.operations.append(("add_task", task))
+        slot = task.slot
+        if self.earlier_finish[slot] >= self.project_end[0]:
+            self.end_dirty = True
+        values = {field: getattr(task, field) for field in TaskArena.VALUE_FIELDS.values()}
+        task.arena = None
+        task.slot = -1
+        for field, value in values.items():
+            setattr(task, field, value)
+        self.successors.clear(slot)
+        self.ancestors.clear(slot)
+        self.dirty_earlier.discard(slot)
+        self.dirty_later.discard(slot)
+        self.reachability.remove_slot(slot)
+        self.tasks[slot] = None
+        self.free_slots.append(slot)
+
+    def set_value(self, array_name, slot, value):
+        """
+        Modifies a value of a slot. If the duration is modified, the values that depend on it are marked as dirty
+        :param array_name: The name of the array containing the value
+        :param slot: The slot
+        :param value: The new value
+        :return: None
+        """
+        values = getattr(self, array_name)
+        if array_name == "duration" and values[slot] != value:
+            self.save_task(self.tasks[slot])
+            self.operations.append(("set_estimated_time", self.tasks[slot], values[slot]))
+            # The duration of a task is used by its dependencies in both directions (see DependencyType.get_delay)
+            self.dirty_earlier.update(self.successors.get(slot))
+            self.dirty_earlier.add(slot)
+            self.dirty_later.update(self.ancestors.get(slot))
+            self.dirty_later.add(slot)
+        values[slot] = value
+
+    def add_edge(self, upstream_task, downstream_task, index=None, dependency_type=0, lag=0, downstream_index=None):
+        """
+        Adds an edge between two Tasks, the same way Task.add_upstream_task does
+        :param upstream_task: The upstream Task
+        :param downstream_task: The downstream Task
+        :param index: The position of upstream_task in the ancestors of downstream_task.
+                      If it is None, it is added at the end
+        :param dependency_type: The DependencyType of the edge. By default, it is FINISH_TO_START
+        :param lag: The lag of the edge. By default, it is 0
+        :param downstream_index: The position of downstream_task in the successors of upstream_task.
+                                 If it is None, it is added at the end
+        :return: None
+        """
+        self.save_task(upstream_task)
+        self.save_task(downstream_task)
+        self.operations.append(("remove_edge", upstream_task, downstream_task))
+        self.ancestors.insert(downstream_task.slot, index, upstream_task.slot, dependency_type, lag)
+        self.successors.insert(upstream_task.slot, downstream_index, downstream_task.slot, dependency_type, lag)
+        self.dirty_earlier.add(downstream_task.slot)
+        self.dirty_later.add(upstream_task.slot)
+        self.reachability.change_slot(upstream_task.slot)
+        self._keep_order(upstream_task.slot, downstream_task.slot)
+
+    def remove_edge(self, upstream_task, downstream_task):
+        """
+        Removes the edge between two Tasks, the same way Task.remove_upstream_task does.
+        It should be called before the Tasks are removed from the TaskLists
+        :param upstream_task: The upstream Task
+        :param downstream_task: The downstream Task
         :return: None
         """
-        for task_struct in Task_Struct._tasks:
-            task_struct._task.latest_start = task_struct.later
+        self.save_task(upstream_task)
+        self.save_task(downstream_task)
+        index = downstream_task.upstream_tasks.index(upstream_task)
+        downstream_index = upstream_task.downstream_tasks.index(downstream_task)
+        # The edge is added back at the same positions on both sides, the layout of the tree relies on them
+        self.operations.append(("add_edge", upstream_task, downstream_task, index, downstream_index,
+                                *downstream_task.get_dependency(upstream_task)))
+        self.ancestors.remove(downstream_task.slot, index)
+        self.successors.remove(upstream_task.slot, downstream_index)
+        self.dirty_earlier.add(downstream_task.slot)
+        self.dirty_later.add(upstream_task.slot)
+        self.reachability.change_slot(upstream_task.slot)
+
+    def replace_edge(self, old_upstream_task, new_upstream_task, downstream_task):
+        """
+        Replaces an upstream Task of a Task by another one, the same way Task.replace_upstream_task does.
+        The new edge keeps the DependencyType and the lag of the old one.
+        It should be called before the Tasks are replaced in the TaskLists
+        :param old_upstream_task: The upstream Task to replace
+        :param new_upstream_task: The Task that replaces it
+        :param downstream_task: The downstream Task
+        :return: None
+        """
+        self.save_task(old_upstream_task)
+        self.save_task(new_upstream_task)
+        self.save_task(downstream_task)
+        index = downstream_task.upstream_tasks.index(old_upstream_task)
+        position = old_upstream_task.downstream_tasks.index(downstream_task)
+        # It is undone by removing the new edge, and then adding the old one back where it was
+        self.operations.append(("add_edge", old_upstream_task, downstream_task, index, position,
+                                *downstream_task.get_dependency(old_upstream_task)))
+        self.operations.append(("remove_edge", new_upstream_task, downstream_task))
+        self.ancestors.replace(downstream_task.slot, index, new_upstream_task.slot)
+        offset = self.successors.offsets[old_upstream_task.slot]
+        dependency_type, lag = self.successors.types[offset + position], self.successors.lags[offset + position]
+        self.successors.remove(old_upstream_task.slot, position)
+        self.successors.insert(new_upstream_task.slot, None, downstream_task.slot, dependency_type, lag)
+        self.dirty_earlier.add(downstream_task.slot)
+        self.dirty_later.add(old_upstream_task.slot)
+        self.dirty_later.add(new_upstream_task.slot)
+        self.reachability.change_slot(old_upstream_task.slot)
+        self.reachability.change_slot(new_upstream_task.slot)
+        self._keep_order(new_upstream_task.slot, downstream_task.slot)
+
+    def set_dependency(self, upstream_task, downstream_task, dependency_type, lag):
+        """
+        Modifies the DependencyType and the lag of the edge between two Tasks, the same way Task.set_dependency does
+        :param upstream_task: The upstream Task
+        :param downstream_task: The downstream Task
+        :param dependency_type: The new DependencyType
+        :param lag: The new lag
+        :return: None
+        """
+        self.save_task(upstream_task)
+        self.save_task(downstream_task)
+        self.operations.append(("set_dependency", upstream_task, downstream_task,
+                                *downstream_task.get_dependency(upstream_task)))
+        self.ancestors.set_dependency(downstream_task.slot, downstream_task.upstream_tasks.index(upstream_task),
+                                      dependency_type, lag)
+        self.successors.set_dependency(upstream_task.slot, upstream_task.downstream_tasks.index(downstream_task),
+                                       dependency_type, lag)
+        self.dirty_earlier.add(downstream_task.slot)
+        self.dirty_later.add(upstream_task.slot)
+
+    def save_task(self, task):
+        """
+        Saves the state of a Task in the journal, if there is a batch and if the Task was not modified yet
+        during this batch. It is called before the Task is modified, by the methods modifying the arena.
+        Every modification of an edge saves both of its Tasks
+        :param task: The Task
+        :return: None
+        """
+        if self.journal is not None and task not in self.journal:
+            self.journal[task] = (list(task.upstream_tasks), list(task.downstream_tasks), dict(task.dependencies),
+                                  task.estimated_time, task.status)
+
+    def save_status(self, task):
+        """
+        Saves the status of a Task before it is modified (see Task.set_status and Task.update_locks).
+        The statuses are not stored in the arena, but they are part of the state of the Tasks,
+        and they are modified along with the edges when Tasks are locked or unlocked
+        :param task: The Task
+        :return: None
+        """
+        self.save_task(task)
+        self.operations.append(("set_status", task, task.status))
+
+    def restore(self):
+        """
+        Undoes every modification saved in the journal, and ends the batch. The Tasks added during the batch
+        are removed from the arena, the Tasks removed are added back, and the other Tasks get their state back.
+        Their slots may change, so the topological order is not valid anymore
+        :return: None
+        """
+        journal = self.journal
+        self.journal = None
+        for task, state in journal.items():
+            if state is None and task.arena is self:
+                self.remove_task(task)
+        for task, state in journal.items():
+            if state is not None and task.arena is not self:
+                self.add_task(task)
+        for task, state in journal.items():
+            if state is not None:
+                self.ancestors.clear(task.slot)
+                self.successors.clear(task.slot)
+                upstream_tasks, downstream_tasks, task.dependencies, task.estimated_time, task.status = state
+                task.upstream_tasks.reset(upstream_tasks)
+                task.downstream_tasks.reset(downstream_tasks)
+                task.upstream_info_dirty = False
+                task.downstream_info_dirty = False
+        # Both Tasks of each modified edge were saved, so the edges are added back from the saved Tasks only,
+        # once they all have their slot
+        for task, state in journal.items():
+            if state is not None:
+                for upstream_task in task.upstream_tasks:
+                    self.ancestors.insert(task.slot, None, upstream_task.slot, *task.get_dependency(upstream_task))
+                for downstream_task in task.downstream_tasks:
+                    self.successors.insert(task.slot, None, downstream_task.slot,
+                                           *downstream_task.get_dependency(task))
+                task.invalidate_upstream_info()
+                task.invalidate_downstream_info()
+        self.order_valid = False
+        # The edges were added back directly, so every key and label is computed again
+        self.reachability.invalidate()
+
+    def set_scheduled(self, count):
+        """
+        Called after a full schedule. The positions computed are a valid topological order,
+        and every value is up-to-date
+        :param count: The number of slots that were scheduled
+        :return: None
+        """
+        self.order_valid = True
+        self.next_position = count
+        self.dirty_earlier.clear()
+        self.dirty_later.clear()
+        self.end_dirty = False
+
+    def is_schedule_current(self):
+        """
+        Tells whether the values of the last schedule are still valid, because no Task was modified since then
+        :return: Whether the schedule is current
+        """
+        return self.order_valid and len(self.dirty_earlier) == 0 and len(self.dirty_later) == 0 and not self.end_dirty
+
+    def _keep_order(self, upstream_slot, downstream_slot):
+        """
+        Keeps the topological order valid after an edge was added. If the upstream slot is after the downstream one,
+        we try to move one of them between its upstream and downstream neighbours.
+        If it is not possible, the order is marked as not valid
+        :param upstream_slot: The slot at the start of the new edge
+        :param downstream_slot: The slot at the end of the new edge
+        :return: None
+        """
+        if not self.order_valid or self.position[upstream_slot] < self.position[downstream_slot]:
+            return
+        for slot in (downstream_slot, upstream_slot):
+            lowest = max((self.position[s] for s in self.ancestors.get(slot)), default=None)
+            highest = min((self.position[s] for s in self.successors.get(slot)), default=None)
+            if lowest is None:
+                position = highest - 1
+            elif highest is None:
+                position = lowest + 1
+            else:
+                position = (lowest + highest) / 2
+            # When positions are too close, there may not be any number between them
+            if (lowest is None or lowest < position) and (highest is None or position < highest):
+                self.position[slot] = position
+                return
+        self.order_valid = False
+
+    def get_struct(self):
+        """
+        Creates the Tasks_Struct representing the arena. It shares the memory of the arrays of the arena.
+        Arrays cannot be resized while the returned Tasks_Struct exists, so it should only be kept during a C call
+        :return: The Tasks_Struct representing the arena
+        """
+        return Tasks_Struct(self.capacity, *(self._view(values) for values in self._struct_arrays()))
+
+    def copy_struct(self):
+        """
+        Creates a Tasks_Struct representing a copy of the arena. Unlike get_struct, it can be kept
+        while the arena is modified, for example during a simulation running in the background.
+        The copied arrays are kept alive by the returned Tasks_Struct
+        :return: The Tasks_Struct representing the copy of the arena
+        """
+        return Tasks_Struct(self.capacity,
+                            *(self._view(array(values.typecode, values)) for values in self._struct_arrays()))
+
+    def _struct_arrays(self):
+        """
+        Lists the arrays of the arena in the order of the fields of a Tasks_Struct
+        :return: The list of arrays
+        """
+        return [self.successors.offsets, self.successors.counts, self.successors.edges,
+                self.successors.types, self.successors.lags,
+                self.ancestors.offsets, self.ancestors.counts, self.ancestors.edges,
+                self.ancestors.types, self.ancestors.lags,
+                *(getattr(self, array_name) for array_name in TaskArena.VALUE_FIELDS),
+                self.project_end, self.position]
 
     @staticmethod
-    def save_criticality():
+    def _view(values):
+        """
+        Creates a ctypes array sharing the memory of an array, using the buffer protocol
+        :param values: The array
+        :return: The ctypes array
         """
-        Saves the value is_critical of every Task_Struct into its corresponding Task.
-        This method does not save other data.
+        return ((c_double if values.typecode == "d" else c_int) * len(values)).from_buffer(values)
+
+    def _grow(self, capacity):
+        """
+        Increases the capacity of the arena
+        :param capacity: The new capacity
         :return: None
         """
-        for task_struct in Task_Struct._tasks:
-            task_struct._task.is_critical = bool(task_struct.is_critical)
+        added = capacity - self.capacity
+        self.free_slots = list(range(capacity - 1, self.capacity - 1, -1)) + self.free_slots
+        self.tasks += [None] * added
+        self.successors.grow(capacity)
+        self.ancestors.grow(capacity)
+        for array_name in (*TaskArena.VALUE_FIELDS, "position"):
+            getattr(self, array_name).extend([0] * added)
+        self.reachability.grow(capacity)
+        self.capacity = capacity
 
-    def __str__(self):
-        return f"Task_Struct({self._task})"
 
-    __repr__ = __str__
+class Simulation_Struct(Structure):
 
+    """
+    Represents a Monte Carlo simulation as a C struct. It is shared by Python and the threads running the simulation.
+
+    These are the fields of a Simulation_Struct :
+    - sample_count : The number of samples to compute.
+    - thread_count : The number of threads computing the samples.
+    - distribution : The distribution the durations are drawn from (0 for beta, 1 for triangular).
+    - seed : The seed of the random generators.
+    - optimistic, most_likely, pessimistic : The three-point estimates of each slot.
+    - project_end : The number of days needed to complete the project in each sample. It is written by the threads.
+    - critical_counts : The number of samples in which each slot is critical. It is written at the end.
+    - progress : The number of samples done. It is written by the threads while the simulation runs.
+    - cancelled : Set it to 1 to stop the simulation. The threads stop before computing their next sample.
+    """
+
+    _fields_ = [
+        ('sample_count', c_int),
+        ('thread_count', c_int),
+        ('distribution', c_int),
+        ('seed', c_ulonglong),
+        ('optimistic', POINTER(c_double)),
+        ('most_likely', POINTER(c_double)),
+        ('pessimistic', POINTER(c_double)),
+        ('project_end', POINTER(c_double)),
+        ('critical_counts', POINTER(c_int)),
+        ('progress', c_int),
+        ('cancelled', c_int),
+    ]
+
+
+class NativeSimulation:
+
+    """
+    A Monte Carlo simulation of a Project, computed by the C functions on several threads.
+    The C function is called from a Python thread. ctypes releases the GIL during the call,
+    so the rest of the application keeps running while the simulation runs on all the cores.
+    The simulation uses a copy of the tasks, so the Project can be modified while it runs.
+
+    These are the fields of a NativeSimulation :
+    - tasks : The Tasks of the Project when the simulation started.
+    - slots : The slot of each of these Tasks.
+    - distribution : The name of the distribution the durations are drawn from ("beta" or "triangular").
+    - tasks_struct : The Tasks_Struct of the copy of the arena.
+    - first_slot : The slot of the beginning task.
+    - project_end : The array in which the C function writes the end of the project in each sample.
+    - critical_counts : The array in which the C function writes the number of samples in which each slot is critical.
+    - struct : The Simulation_Struct given to the C function.
+    - thread : The Python thread calling the C function.
+    - samples_done : The number of samples computed, once the simulation is over. It is None while it runs.
+    - error : The reason why the simulation failed, or None if it did not fail.
+    """
+
+    DISTRIBUTIONS = ("beta", "triangular")
+
+    def __init__(self, project, samples_count, distribution="beta", seed=None, thread_count=None):
+        """
+        Prepares a simulation. It is started by start()
+        :param project: The project to simulate
+        :param samples_count: The number of samples, at least 1
+        :param distribution: The name of the distribution the durations are drawn from, "beta" or "triangular"
+        :param seed: The seed of the random generators. The results only depend on it, not on the number of threads.
+                     If it is None, a random seed is used
+        :param thread_count: The number of threads. By default, there is one thread per core
+        """
+        if distribution not in NativeSimulation.DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution {distribution}. "
+                             f"The distributions are {', '.join(NativeSimulation.DISTRIBUTIONS)}")
+        if samples_count < 1:
+            raise ValueError(f"The number of samples must be at least 1, not {samples_count}")
+        if seed is None:
+            seed = random.getrandbits(64)
+        if thread_count is None:
+            thread_count = os.cpu_count() or 1
+        arena = project.arena
+        self.tasks = list(project.tasks)
+        self.slots = [task.slot for task in self.tasks]
+        self.distribution = distribution
+        self.tasks_struct = arena.copy_struct()
+        self.first_slot = project.beginning_task.slot
+        estimates = [array("d", [0]) * arena.capacity for _ in range(3)]
+        for task, slot in zip(self.tasks, self.slots):
+            for values, estimate in zip(estimates, task.get_estimates()):
+                values[slot] = estimate
+        # The samples that are not computed keep a negative value, see get_result
+        self.project_end = array("d", [-1]) * samples_count
+        self.critical_counts = array("i", [0]) * arena.capacity
+        self.struct = Simulation_Struct(samples_count,
+                                        max(1, min(thread_count, samples_count)),
+                                        NativeSimulation.DISTRIBUTIONS.index(distribution),
+                                        seed % 2 ** 64,
+                                        *(TaskArena._view(values) for values in estimates),
+                                        TaskArena._view(self.project_end),
+                                        TaskArena._view(self.critical_counts),
+                                        0,
+                                        0)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.samples_done = None
+        self.error = None
+
+    def start(self):
+        """
+        Starts the simulation in the background
+        :return: None
+        """
+        self.thread.start()
+
+    def _run(self):
+        """
+        Runs the simulation. This is called in the thread of the simulation
+        :return: None
+        """
+        samples_done = _simulate(byref(self.tasks_struct), self.first_slot, byref(self.struct))
+        # The C function stops the simulation if one of its threads cannot be created
+        if samples_done < 0:
+            self.error = "The threads of the simulation could not be created"
+            samples_done = 0
+        self.samples_done = samples_done
+
+    def get_progress(self):
+        """
+        :return: The fraction of the samples that are computed, between 0 and 1
+        """
+        return self.struct.progress / self.struct.sample_count if self.struct.sample_count else 1
+
+    def cancel(self):
+        """
+        Asks the simulation to stop. The samples already computed are kept
+        :return: None
+        """
+        self.struct.cancelled = 1
+
+    def is_done(self):
+        """
+        :return: Whether the simulation is over (because all samples were computed, or because it was cancelled)
+        """
+        return self.samples_done is not None
+
+    def get_error(self):
+        """
+        :return: The reason why the simulation failed, or None if it did not fail
+        """
+        return self.error
+
+    def wait(self):
+        """
+        Waits until the simulation is over
+        :return: The SimulationResult
+        """
+        self.thread.join()
+        return self.get_result()
+
+    def get_result(self):
+        """
+        Gives the results of the simulation. If it was cancelled, only the samples computed are used
+        :return: The SimulationResult, or None if the simulation is not over, if it failed or if no sample was computed
+        """
+        if not self.samples_done:
+            return None
+        # The samples are shared between the threads, so the computed ones are not necessarily the first ones
+        project_end = self.project_end if self.samples_done == self.struct.sample_count else \
+            array("d", (value for value in self.project_end if value >= 0))
+        return SimulationResult(self.tasks, self.distribution, project_end,
+                                [self.critical_counts[slot] / self.samples_done for slot in self.slots])
 
-# Fields of the struct
-Task_Struct._fields_ = [
-    ('name', c_char_p),
-    ('successors', POINTER(POINTER(Task_Struct))),
-    ('ancestors', POINTER(POINTER(Task_Struct))),
-    ('id', c_int),
-    ('successors_count', c_int),
-    ('ancestors_count', c_int),
-    ('index', c_int),
-    ('duration', c_int),
-    ('earlier', c_int),
-    ('later', c_int),
-    ('is_critical', c_int),
-]
 
 # Functions of the dll
-_fill_indices = dll.fill_indice
-_fill_indices.argtypes = [POINTER(Task_Struct), POINTER(Task_Struct), POINTER(c_int), POINTER(c_int)]
-_fill_indices.restype = None
+if available:
+    _fill_indices = dll.fill_indice
+    _fill_indices.argtypes = [POINTER(Tasks_Struct), c_int, c_int, POINTER(c_int), POINTER(c_int)]
+    _fill_indices.restype = None
+
+    _schedule = dll.schedule
+    _schedule.argtypes = [POINTER(Tasks_Struct), c_int, c_int, c_int]
+    _schedule.restype = c_int
 
-_task_earlier = dll.task_earlier
-_task_earlier.argtypes = [POINTER(Task_Struct)]
-_task_earlier.restype = None
+    _compute_schedule = dll.compute_schedule
+    _compute_schedule.argtypes = [POINTER(Tasks_Struct), c_int]
+    _compute_schedule.restype = c_int
 
-_task_later = dll.task_later
-_task_later.argtypes = [POINTER(Task_Struct)]
-_task_later.restype = None
+    _update_schedule = dll.update_schedule
+    _update_schedule.argtypes = [POINTER(Tasks_Struct), POINTER(c_int), c_int, POINTER(c_int), c_int, c_bool]
+    _update_schedule.restype = c_int
 
-_identify_critical = dll.identify_critical
-_identify_critical.argtypes = [POINTER(Task_Struct)]
-_identify_critical.restype = None
+    _simulate = dll.simulate
+    _simulate.argtypes = [POINTER(Tasks_Struct), c_int, POINTER(Simulation_Struct)]
+    _simulate.restype = c_int
+
+    _check_structure = dll.check_structure
+    _check_structure.argtypes = [c_int, POINTER(c_int), POINTER(c_int), POINTER(c_int)]
+    _check_structure.restype = c_int
 
 
 def fix_indices(project):
@@ -211,44 +909,82 @@ def fix_indices(project):
     """
     first_index = c_int(1)
     last_index = c_int(project.tasks_count)
-    Task_Struct.convert_tasks(project.beginning_task, project.tasks_count)
-    first_task = Task_Struct.get_converted_task(project.beginning_task)
-    last_task = Task_Struct.get_converted_task(project.project_task)
-    _fill_indices(byref(first_task), byref(last_task), byref(first_index), byref(last_index))
-    Task_Struct.save_indices()
+    _fill_indices(byref(project.arena.get_struct()),
+                  project.beginning_task.slot,
+                  project.project_task.slot,
+                  byref(first_index),
+                  byref(last_index))
 
 
-def compute_earliest_start(project):
+def _compute_schedule_of(project):
     """
-    Compute the earliest_start of each task of the project
+    Runs the scheduling engine on the arena of the project.
+    The engine computes a topological order once, and then does a single forward and backward pass on it,
+    so every value (earliest start, latest start and criticality) is computed in O(V+E).
     :param project: The project
-    :return: None
+    :return: The number of tasks that were scheduled
     """
-    Task_Struct.convert_tasks(project.beginning_task, project.tasks_count)
-    first_task = Task_Struct.get_converted_task(project.beginning_task)
-    _task_earlier(byref(first_task))
-    Task_Struct.save_earliest_start()
+    count = _compute_schedule(byref(project.arena.get_struct()), project.beginning_task.slot)
+    project.arena.set_scheduled(count)
+    return count
 
 
-def compute_latest_start(project):
+def schedule(project):
     """
-    Compute the earliest_start of each task of the project
+    Computes the index, the earliest_start, the latest_start and the value is_critical of each task of the project,
+    as well as the values derived from them (finishes, floats and the project end).
+    The indices and the schedule are computed in one native call.
+    The results are written directly into the arrays of the arena, where the Tasks read them
     :param project: The project
     :return: None
     """
-    Task_Struct.convert_tasks(project.beginning_task, project.tasks_count)
-    last_task = Task_Struct.get_converted_task(project.project_task)
-    _task_later(byref(last_task))
-    Task_Struct.save_latest_start()
+    count = _schedule(byref(project.arena.get_struct()),
+                      project.beginning_task.slot,
+                      project.project_task.slot,
+                      project.tasks_count)
+    project.arena.set_scheduled(count)
 
 
-def identify_critical_tasks(project):
+def update_schedule(project):
     """
-    Sets the value of is_critical for each task of the project
+    Updates the earliest_start, the latest_start, the value is_critical (and the values derived from them) of the tasks
+    of the project after some tasks were modified (their estimated_time or their upstream tasks).
+    Only the tasks whose values may have changed are visited. If the topological order of the arena
+    is not valid anymore, everything is computed again instead.
+    Indices are not updated
     :param project: The project
-    :return: None
+    :return: The number of tasks that were visited
+    """
+    arena = project.arena
+    if not arena.order_valid:
+        return _compute_schedule_of(project)
+    earlier_seeds = array("i", arena.dirty_earlier)
+    later_seeds = array("i", arena.dirty_later)
+    end_dirty = arena.end_dirty
+    arena.dirty_earlier.clear()
+    arena.dirty_later.clear()
+    arena.end_dirty = False
+    return _update_schedule(byref(arena.get_struct()),
+                            TaskArena._view(earlier_seeds), len(earlier_seeds),
+                            TaskArena._view(later_seeds), len(later_seeds),
+                            end_dirty)
+
+
+def check_structure(upstream):
+    """
+    Runs Kahn's algorithm on the tasks of a project that is not created yet (see utils/validation.py)
+    :param upstream: The list of the ids of the upstream tasks of each task. The task i has the id i
+    :return: The number of upstream tasks of each task that could not be put in a topological order (the tasks
+             that still have some are in a cycle, or after one), or None if an upstream id is not the id of a task
     """
-    Task_Struct.convert_tasks(project.beginning_task, project.tasks_count)
-    first_task = Task_Struct.get_converted_task(project.beginning_task)
-    _identify_critical(byref(first_task))
-    Task_Struct.save_criticality()
+    try:
+        # The arrays are built from lists, which is faster than from iterators as their size is known
+        counts = array("i", list(map(len, upstream)))
+        ids = array("i", list(chain.from_iterable(upstream)))
+    except (TypeError, OverflowError):
+        return None
+    remaining = array("i", [0]) * len(upstream)
+    if _check_structure(len(upstream), TaskArena._view(counts), TaskArena._view(ids),
+                        TaskArena._view(remaining)) < 0:
+        return None
+    return remaining
@@ -0,0 +1,137 @@
+"""
+This file contains the enumeration of the longest paths of a project. A path goes from the beginning task
+to the project task, and its length is the number of days between the start of its first task and the finish
+of its last task, each task starting as soon as its dependency with the previous one allows it
+(with finish to start dependencies only, it is the sum of the estimated times of its tasks). The longest paths are
+the critical paths, and the paths that are a few days shorter are the near-critical ones : a small delay on them
+is enough to delay the whole project.
+
+A project can have an exponential number of paths, so they are never all enumerated :
+- longest_paths keeps, for each task, the k longest paths from the beginning task to it. They are computed
+  in the topological order from the k longest paths of its upstream tasks, in O(E * k log k).
+- near_critical_paths goes backwards from the project task, and only follows the upstream tasks that are
+  the end of a path long enough. The longest path from the beginning task to each task is known, so every path
+  started this way ends as a path within the given number of days : the work is proportional to the paths found.
+
+Paths are given as tuples containing their length and the list of their tasks, from the beginning task
+to the project task. They are sorted from the longest to the shortest.
+"""
+
+import heapq
+from operator import itemgetter
+
+
+def _topological_order(project):
+    """
+    Gives the tasks of the project in a topological order (each task comes after its upstream tasks)
+    :param project: The project
+    :return: The list of the tasks
+    """
+    remaining = {task: len(task.upstream_tasks) for task in project.tasks}
+    order = [project.beginning_task]
+    # The list grows while we go through it, like a queue
+    for task in order:
+        for downstream_task in task.downstream_tasks:
+            remaining[downstream_task] -= 1
+            if remaining[downstream_task] == 0:
+                order.append(downstream_task)
+    return order
+
+
+def _to_path(entry):
+    """
+    Converts a path of the enumeration to a list of tasks
+    :param entry: A tuple containing the length of the path (until the finish of its last task), its last task
+                  and the entry of the rest of the path (None for the first task)
+    :return: A tuple containing the length of the path and the list of its tasks
+    """
+    length = entry[0]
+    tasks = []
+    while entry is not None:
+        tasks.append(entry[1])
+        entry = entry[2]
+    tasks.reverse()
+    return length, tasks
+
+
+def longest_paths(project, k):
+    """
+    Gives the k longest paths of the project. There are fewer if the project does not have k paths
+    :param project: The project
+    :param k: The number of paths
+    :return: The list of the paths, each path being a tuple containing its length and the list of its tasks
+    """
+    if k <= 0:
+        return []
+    # best[task] contains the k longest paths from the beginning task to the task, from the longest.
+    # Each path is a tuple containing its length, its last task and the path without its last task
+    best = {}
+    for task in _topological_order(project):
+        if len(task.upstream_tasks) == 0:
+            best[task] = [(task.estimated_time, task, None)]
+            continue
+        if len(task.dependencies) == 0:
+            # With finish to start dependencies without lag, the task starts when the path to its upstream task ends
+            best[task] = [(path[0] + task.estimated_time, task, path)
+                          for path in heapq.nlargest(k,
+                                                     (path for upstream_task in task.upstream_tasks
+                                                      for path in best[upstream_task]),
+                                                     key=itemgetter(0))]
+            continue
+        # Otherwise, it starts at the start of the upstream task plus the delay of their dependency
+        shifts = [(upstream_task, task.get_delay(upstream_task) - upstream_task.estimated_time)
+                  for upstream_task in task.upstream_tasks]
+        best[task] = [(start + task.estimated_time, task, path)
+                      for start, path in heapq.nlargest(k,
+                                                        ((path[0] + shift, path) for upstream_task, shift in shifts
+                                                         for path in best[upstream_task]),
+                                                        key=itemgetter(0))]
+    return [_to_path(path) for path in best.get(project.project_task, [])]
+
+
+def near_critical_paths(project, days, limit=None):
+    """
+    Gives the paths of the project that are at most a given number of days shorter than the project.
+    The project end is the one computed by the scheduling backends, so the project must be loaded first
+    :param project: The project
+    :param days: The number of days. With 0, only the critical paths are given
+    :param limit: The maximum number of paths to give, the longest ones are kept. If it is None, there is no limit
+    :return: The list of the paths, each path being a tuple containing its length and the list of its tasks
+    """
+    order = _topological_order(project)
+    if project.project_task not in order:
+        return []
+    # head[task] is the length of the longest path from the beginning task to the start of the task
+    head = {}
+    for task in order:
+        head[task] = max((head[upstream_task] + task.get_delay(upstream_task)
+                          for upstream_task in task.upstream_tasks), default=0)
+    # The paths are compared to the end of the project computed by the scheduling backends
+    minimum_length = project.get_project_end() - days
+    # We go backwards from the project task. A partial path goes from a task to the project task. It is a tuple
+    # containing the length of the longest path it can be completed into (negated, heapq gives the smallest first),
+    # a counter (so that the tasks are never compared), the number of days from the start of its first task
+    # to the finish of the project task, its first task, and the rest of the partial path
+    # as a tuple (second task, rest), None after the project task.
+    # The partial path with the longest completion is always extended first, so the paths are found from the longest
+    tail = project.project_task.estimated_time
+    partial_paths = [(-head[project.project_task] - tail, 0, tail, project.project_task, None)]
+    counter = 1
+    paths = []
+    while len(partial_paths) != 0 and (limit is None or len(paths) < limit):
+        _, _, tail, task, rest = heapq.heappop(partial_paths)
+        rest = (task, rest)
+        if len(task.upstream_tasks) == 0:
+            tasks = []
+            while rest is not None:
+                tasks.append(rest[0])
+                rest = rest[1]
+            paths.append((tail, tasks))
+            continue
+        for upstream_task in task.upstream_tasks:
+            upstream_tail = tail + task.get_delay(upstream_task)
+            if upstream_tail + head[upstream_task] >= minimum_length:
+                heapq.heappush(partial_paths, (-upstream_tail - head[upstream_task], counter, upstream_tail,
+                                               upstream_task, rest))
+                counter += 1
+    return paths
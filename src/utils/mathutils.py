@@ -18,3 +18,25 @@ def clamp(x, inf, sup):
     :return: The clamped value
     """
     return max(inf, min(x, sup))
+
+
+def percentile(values, percent):
+    """
+    Computes a percentile of some values, interpolating linearly between the two closest values.
+    Here are some example usages :
+    >>> percentile([1, 2, 3, 4, 5], 50)
+    3.0
+    >>> percentile([1, 2, 3, 4], 50)
+    2.5
+    >>> percentile([5, 1, 3], 100)
+    5
+    :param values: The values. They do not need to be sorted
+    :param percent: The percentage, between 0 and 100
+    :return: The value below which percent percents of the values are
+    """
+    values = sorted(values)
+    position = (len(values) - 1) * percent / 100
+    lower = int(position)
+    if lower == len(values) - 1:
+        return values[lower]
+    return values[lower] + (values[lower + 1] - values[lower]) * (position - lower)
@@ -0,0 +1,85 @@
+"""
+This file contains the Monte Carlo simulation engine. The durations of the tasks are drawn from their three-point
+estimates (optimistic, most likely and pessimistic time), and the project is scheduled for every sample
+with the vectorized scenario computation of the NumPy backend.
+Samples are computed by chunks, so that the memory used does not depend on the number of samples.
+"""
+
+from SimulationResult import SimulationResult
+from utils import numpy_functions
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+available = np is not None
+
+# The distributions the durations can be drawn from
+DISTRIBUTIONS = ("beta", "triangular")
+
+# The biggest difference between the earliest and the latest start of a critical task.
+# Durations are not integers in a simulation, so both values may differ a little because of rounding errors
+_CRITICAL_TOLERANCE = 1e-6
+
+
+def _draw_durations(estimates, distribution, samples_count, generator):
+    """
+    Draws the durations of the tasks
+    :param estimates: A NumPy array with one row per slot, containing the optimistic, most likely
+                      and pessimistic times of the task in the slot
+    :param distribution: The name of the distribution, "beta" or "triangular"
+    :param samples_count: The number of samples to draw
+    :param generator: The numpy.random.Generator used to draw the samples
+    :return: A NumPy array with one row per slot and one column per sample
+    """
+    optimistic, most_likely, pessimistic = (estimates[:, i, np.newaxis] for i in range(3))
+    width = pessimistic - optimistic
+    # The tasks whose duration is certain are not drawn, the distributions need a positive width
+    uncertain = width[:, 0] > 0
+    durations = np.repeat(most_likely, samples_count, axis=1)
+    optimistic, most_likely, width = optimistic[uncertain], most_likely[uncertain], width[uncertain]
+    shape = (np.count_nonzero(uncertain), samples_count)
+    if distribution == "beta":
+        # This is the PERT distribution : a beta distribution whose mean is (o + 4m + p) / 6
+        alpha = 1 + 4 * (most_likely - optimistic) / width
+        beta = 1 + 4 * (optimistic + width - most_likely) / width
+        durations[uncertain] = optimistic + width * generator.beta(alpha, beta, shape)
+    else:
+        durations[uncertain] = generator.triangular(optimistic, most_likely, optimistic + width, shape)
+    return durations
+
+
+def simulate(project, samples_count, distribution="beta", seed=None, chunk_size=1000):
+    """
+    Simulates the project. For each sample, the duration of each task is drawn between its optimistic
+    and pessimistic times, and the project is scheduled with these durations. The tasks without three-point estimates
+    always take their estimated_time. The project and its tasks are not modified
+    :param project: The project
+    :param samples_count: The number of samples, at least 1
+    :param distribution: The name of the distribution the durations are drawn from, "beta" or "triangular"
+    :param seed: The seed of the random generator. Two simulations with the same seed and the same chunk_size
+                 give the same results. If it is None, the results are different each time
+    :param chunk_size: The number of samples computed at once, at least 1. The memory used is proportional to it
+    :return: The SimulationResult
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {distribution}. The distributions are {', '.join(DISTRIBUTIONS)}")
+    if samples_count < 1:
+        raise ValueError(f"The number of samples must be at least 1, not {samples_count}")
+    if chunk_size < 1:
+        raise ValueError(f"The number of samples computed at once must be at least 1, not {chunk_size}")
+    generator = np.random.default_rng(seed)
+    graph = numpy_functions.ScheduleGraph(project)
+    slots = np.array([task.slot for task in project.tasks])
+    estimates = np.zeros((project.arena.capacity, 3))
+    estimates[slots] = [task.get_estimates() for task in project.tasks]
+    project_end = np.empty(samples_count)
+    critical_counts = np.zeros(project.arena.capacity, dtype=np.int64)
+    for start in range(0, samples_count, chunk_size):
+        count = min(chunk_size, samples_count - start)
+        durations = _draw_durations(estimates, distribution, count, generator)
+        earlier, later, project_end[start:start + count] = numpy_functions.compute_scenarios(graph, durations)
+        later -= earlier
+        critical_counts += np.count_nonzero(later < _CRITICAL_TOLERANCE, axis=1)
+    return SimulationResult(list(project.tasks), distribution, project_end, critical_counts[slots] / samples_count)
@@ -0,0 +1,474 @@
+"""
+This file contains the NumPy scheduling backend. It computes the same values as the C functions,
+and it is used when the C library cannot be loaded.
+The tasks are processed level by level : the level of a task is the length of the longest path
+from the beginning task to it, so every upstream task of a task is in a lower level.
+Each level is an array of slots, and all the tasks of a level are computed at once with NumPy.
+Levels with only a few tasks are computed in Python, which is faster for them.
+Every type of dependency is a minimum delay between the start of the upstream task and the start of the downstream
+task (see DependencyType.get_delay), so the levels are computed the same way whatever the types of the dependencies.
+"""
+
+from DependencyType import DependencyType
+from ScenarioSchedule import ScenarioSchedule
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+available = np is not None
+
+# The levels having less tasks than this are computed in Python, because NumPy calls have a cost of their own
+_MIN_VECTORIZED_LEVEL = 64
+
+
+def _values(values):
+    """
+    Creates a NumPy array sharing the memory of an array of a TaskArena, using the buffer protocol.
+    Arrays cannot be resized while the returned NumPy array exists, so it should only be kept during a computation
+    :param values: The array
+    :return: The NumPy array
+    """
+    return np.frombuffer(values, dtype=np.float64 if values.typecode == "d" else np.int32)
+
+
+def _compact(edge_list):
+    """
+    Copies the edges of an EdgeList without the spare room, in a compressed sparse row layout
+    :param edge_list: The EdgeList
+    :return: A tuple. The edges of the slot i are in the second value, between the positions
+             first_value[i] (included) and first_value[i + 1] (excluded).
+             The third and the fourth values contain the types and the lags of these edges, at the same positions
+    """
+    offsets = _values(edge_list.offsets)
+    counts = _values(edge_list.counts)
+    pointers = np.zeros(counts.size + 1, dtype=np.int64)
+    np.cumsum(counts, out=pointers[1:])
+    positions = np.repeat(offsets - pointers[:-1], counts) + np.arange(pointers[-1])
+    return (pointers, _values(edge_list.edges)[positions], _values(edge_list.types)[positions],
+            _values(edge_list.lags)[positions])
+
+
+def _gather(pointers, level):
+    """
+    Gathers the edges of the tasks of a level
+    :param pointers: The first value returned by _compact
+    :param level: The slots of the tasks of the level, as a NumPy array
+    :return: A tuple. The first value contains the positions of the edges in the values returned by _compact,
+             task after task, and the second value contains the position of the first edge of each task
+             in the first value
+    """
+    starts = pointers[level]
+    counts = pointers[level + 1] - starts
+    firsts = np.cumsum(counts) - counts
+    return np.repeat(starts - firsts, counts) + np.arange(counts.sum()), firsts
+
+
+def _delays(lags, from_finish, to_finish, upstream_durations, durations):
+    """
+    Computes the minimum number of days between the start of the upstream task and the start of the downstream task
+    of many edges at once (see DependencyType.get_delay)
+    :param lags: The lags of the edges
+    :param from_finish: Whether each edge starts at the finish of its upstream task (1) or not (0)
+    :param to_finish: Whether each edge constrains the finish of its downstream task (1) or not (0)
+    :param upstream_durations: The durations of the upstream tasks of the edges.
+                               With several scenarios, it has one row per edge and one column per scenario
+    :param durations: The durations of the downstream tasks of the edges, with the same shape
+    :return: The delays, with the same shape as the durations
+    """
+    if upstream_durations.ndim == 2:
+        lags = lags[:, np.newaxis]
+        from_finish = from_finish[:, np.newaxis]
+        to_finish = to_finish[:, np.newaxis]
+    return lags + from_finish * upstream_durations - to_finish * durations
+
+
+def _levels(successor_pointers, successors, ancestor_pointers, first_slot):
+    """
+    Computes the levels of the tasks reachable from a task, using Kahn's algorithm one level at a time.
+    Long chains of tasks give many levels containing only a few tasks. Calling NumPy for them would be slower
+    than doing it in Python, so the levels smaller than _MIN_VECTORIZED_LEVEL are computed in Python,
+    and they are given as lists instead of arrays
+    :param successor_pointers: The pointers of the successors, returned by _compact
+    :param successors: The successors, returned by _compact
+    :param ancestor_pointers: The pointers of the ancestors, returned by _compact
+    :param first_slot: The slot of the first task
+    :return: The list of levels
+    """
+    # remaining_list[slot] is the number of upstream tasks of the task that are not in a level yet
+    remaining_list = np.diff(ancestor_pointers).tolist()
+    successor_pointers_list = successor_pointers.tolist()
+    successors_list = successors.tolist()
+    levels = []
+    level = [first_slot]
+    while len(level) > 0:
+        levels.append(level)
+        if isinstance(level, list):
+            next_level = []
+            for task in level:
+                for successor in successors_list[successor_pointers_list[task]:successor_pointers_list[task + 1]]:
+                    remaining_list[successor] -= 1
+                    if remaining_list[successor] == 0:
+                        next_level.append(successor)
+        else:
+            positions, _ = _gather(successor_pointers, level)
+            level_successors, counts = np.unique(successors[positions], return_counts=True)
+            successors_of_level = level_successors.tolist()
+            remaining = np.array([remaining_list[successor] for successor in successors_of_level]) - counts
+            for successor, count in zip(successors_of_level, remaining.tolist()):
+                remaining_list[successor] = count
+            # Every upstream task of these successors is in a level, so they can be added
+            next_level = level_successors[remaining == 0].tolist()
+        level = next_level if len(next_level) < _MIN_VECTORIZED_LEVEL else np.array(next_level)
+    return levels
+
+
+class ScheduleGraph:
+
+    """
+    The graph of the tasks of a project, prepared to be scheduled level by level.
+    It is computed from the arena of the project, so it must be computed again when the tasks are linked differently.
+    It does not depend on the durations of the tasks, so it can be used to schedule many sets of durations.
+
+    These are the fields of a ScheduleGraph :
+    - successor_pointers, successors : The downstream tasks of each slot, in the layout returned by _compact.
+    - ancestor_pointers, ancestors : The upstream tasks of each slot, in the layout returned by _compact.
+    - successor_owners, ancestor_owners : The slot each edge belongs to, at the same positions.
+    - successor_dependencies, ancestor_dependencies : The lags of the edges, whether they start at the finish
+                                                      of their upstream task and whether they constrain the finish
+                                                      of their downstream task, at the same positions.
+    - typed : Whether some edges are not finish to start dependencies without lag.
+              If they all are, the delay of an edge is the duration of its upstream task.
+    - successor_lists, ancestor_lists : The same values as Python lists, used for the small levels.
+    - levels : The levels of the tasks reachable from the beginning task (see _levels).
+    - order : The slots of all the levels, one level after the other. It is a topological order.
+    """
+
+    def __init__(self, project):
+        """
+        Creates the ScheduleGraph of a project
+        :param project: The project
+        """
+        arena = project.arena
+        self.successor_pointers, self.successors, successor_types, successor_lags = _compact(arena.successors)
+        self.ancestor_pointers, self.ancestors, ancestor_types, ancestor_lags = _compact(arena.ancestors)
+        self.successor_owners = np.repeat(np.arange(self.successor_pointers.size - 1),
+                                          np.diff(self.successor_pointers))
+        self.ancestor_owners = np.repeat(np.arange(self.ancestor_pointers.size - 1), np.diff(self.ancestor_pointers))
+        self.successor_dependencies = ScheduleGraph._dependencies(successor_types, successor_lags)
+        self.ancestor_dependencies = ScheduleGraph._dependencies(ancestor_types, ancestor_lags)
+        self.typed = bool(np.any(successor_types != DependencyType.FINISH_TO_START) or np.any(successor_lags != 0))
+        self.successor_lists = (self.successor_pointers.tolist(), self.successors.tolist(),
+                                *(values.tolist() for values in self.successor_dependencies))
+        self.ancestor_lists = (self.ancestor_pointers.tolist(), self.ancestors.tolist(),
+                               *(values.tolist() for values in self.ancestor_dependencies))
+        self.levels = _levels(self.successor_pointers, self.successors, self.ancestor_pointers,
+                              project.beginning_task.slot)
+        self.order = np.concatenate([np.asarray(level, dtype=np.int64) for level in self.levels])
+
+    @staticmethod
+    def _dependencies(types, lags):
+        """
+        Splits the types of some edges into the two values needed to compute their delays
+        :param types: The types of the edges
+        :param lags: The lags of the edges
+        :return: A tuple containing the lags, whether each edge starts at the finish of its upstream task (1 or 0)
+                 and whether it constrains the finish of its downstream task (1 or 0)
+        """
+        from_finish = (types == DependencyType.FINISH_TO_START) | (types == DependencyType.FINISH_TO_FINISH)
+        to_finish = (types == DependencyType.FINISH_TO_FINISH) | (types == DependencyType.START_TO_FINISH)
+        return lags, from_finish.astype(np.int32), to_finish.astype(np.int32)
+
+    def get_successors(self, slot):
+        """
+        Gives the downstream tasks of a slot
+        :param slot: The slot
+        :return: The list of the slots of the downstream tasks
+        """
+        pointers, successors = self.successor_lists[:2]
+        return successors[pointers[slot]:pointers[slot + 1]]
+
+    def get_ancestors(self, slot):
+        """
+        Gives the upstream tasks of a slot
+        :param slot: The slot
+        :return: The list of the slots of the upstream tasks
+        """
+        pointers, ancestors = self.ancestor_lists[:2]
+        return ancestors[pointers[slot]:pointers[slot + 1]]
+
+    def get_successor_delays(self, slot, durations):
+        """
+        Gives the downstream tasks of a slot with the delays of their dependencies
+        :param slot: The slot
+        :param durations: The durations of the tasks, indexed by slot. Each duration may be a row of scenarios
+        :return: The list of the tuples containing the slot of each downstream task and its delay
+        """
+        pointers, successors, lags, from_finish, to_finish = self.successor_lists
+        return [(successors[i], lags[i] + (durations[slot] if from_finish[i] else 0)
+                 - (durations[successors[i]] if to_finish[i] else 0))
+                for i in range(pointers[slot], pointers[slot + 1])]
+
+    def get_ancestor_delays(self, slot, durations):
+        """
+        Gives the upstream tasks of a slot with the delays of their dependencies
+        :param slot: The slot
+        :param durations: The durations of the tasks, indexed by slot. Each duration may be a row of scenarios
+        :return: The list of the tuples containing the slot of each upstream task and its delay
+        """
+        pointers, ancestors, lags, from_finish, to_finish = self.ancestor_lists
+        return [(ancestors[i], lags[i] + (durations[ancestors[i]] if from_finish[i] else 0)
+                 - (durations[slot] if to_finish[i] else 0))
+                for i in range(pointers[slot], pointers[slot + 1])]
+
+    def successor_delays(self, positions, durations):
+        """
+        Computes the delays of some edges of the successors
+        :param positions: The positions of the edges, as returned by _gather
+        :param durations: The durations of the tasks, indexed by slot (with one column per scenario if there are many)
+        :return: The delays of the edges
+        """
+        if not self.typed:
+            return durations[self.successor_owners[positions]]
+        return _delays(*(values[positions] for values in self.successor_dependencies),
+                       durations[self.successor_owners[positions]], durations[self.successors[positions]])
+
+    def ancestor_delays(self, positions, durations):
+        """
+        Computes the delays of some edges of the ancestors
+        :param positions: The positions of the edges, as returned by _gather
+        :param durations: The durations of the tasks, indexed by slot (with one column per scenario if there are many)
+        :return: The delays of the edges
+        """
+        if not self.typed:
+            return durations[self.ancestors[positions]]
+        return _delays(*(values[positions] for values in self.ancestor_dependencies),
+                       durations[self.ancestors[positions]], durations[self.ancestor_owners[positions]])
+
+
+def _compute_schedule_of(project):
+    """
+    Computes the earliest start, the latest start and the criticality of each task of the project, in O(V+E).
+    Every value of a level depends only on values of the levels before it (or after it for the latest start),
+    so each level is computed with a few vectorized operations.
+    :param project: The project
+    :return: The number of tasks that were scheduled
+    """
+    arena = project.arena
+    duration = _values(arena.duration)
+    earlier = _values(arena.earlier)
+    later = _values(arena.later)
+    graph = ScheduleGraph(project)
+    # The small levels are computed in Python, directly on the arrays of the arena
+    for level in graph.levels:
+        if isinstance(level, list):
+            for task in level:
+                earliest_start = 0
+                for ancestor, delay in graph.get_ancestor_delays(task, arena.duration):
+                    earliest_start = max(earliest_start, arena.earlier[ancestor] + delay)
+                arena.earlier[task] = earliest_start
+            continue
+        positions, firsts = _gather(graph.ancestor_pointers, level)
+        # Every task of a level after the first one has at least one upstream task, so no segment is empty
+        starts = np.maximum.reduceat(earlier[graph.ancestors[positions]] + graph.ancestor_delays(positions, duration),
+                                     firsts)
+        earlier[level] = np.maximum(starts, 0)
+    order = graph.order
+    # Some tasks may finish after the last task, so the project end is needed before the latest starts
+    project_end = int((earlier[order] + duration[order]).max())
+    arena.project_end[0] = project_end
+    for level in reversed(graph.levels):
+        if isinstance(level, list):
+            for task in level:
+                # No task can finish after the project
+                latest_start = project_end - arena.duration[task]
+                for successor, delay in graph.get_successor_delays(task, arena.duration):
+                    latest_start = min(latest_start, arena.later[successor] - delay)
+                arena.later[task] = latest_start
+            continue
+        later[level] = project_end - duration[level]
+        has_successors = graph.successor_pointers[level + 1] > graph.successor_pointers[level]
+        if np.any(has_successors):
+            positions, firsts = _gather(graph.successor_pointers, level[has_successors])
+            latest_starts = np.minimum.reduceat(later[graph.successors[positions]]
+                                                - graph.successor_delays(positions, duration), firsts)
+            later[level[has_successors]] = np.minimum(later[level[has_successors]], latest_starts)
+    _compute_times(arena, graph)
+    # We keep the order, so that the C backend can update the schedule later without sorting the tasks again
+    _values(arena.position)[order] = np.arange(order.size)
+    arena.set_scheduled(order.size)
+    return order.size
+
+
+def _compute_times(arena, graph):
+    """
+    Computes the values derived from the earliest and latest starts of the tasks : their earliest and latest finishes,
+    their total and free floats and their criticality
+    :param arena: The TaskArena of the project, whose earliest and latest starts and project end are up-to-date
+    :param graph: The ScheduleGraph of the project
+    :return: None
+    """
+    order = graph.order
+    duration = _values(arena.duration)
+    earlier = _values(arena.earlier)
+    later = _values(arena.later)
+    earlier_finish = _values(arena.earlier_finish)
+    earlier_finish[order] = earlier[order] + duration[order]
+    _values(arena.later_finish)[order] = later[order] + duration[order]
+    total_float = _values(arena.total_float)
+    total_float[order] = later[order] - earlier[order]
+    _values(arena.is_critical)[order] = total_float[order] == 0
+    # The last tasks can be delayed until the end of the project
+    free_float = _values(arena.free_float)
+    free_float[order] = arena.project_end[0] - earlier_finish[order]
+    counts = np.diff(graph.successor_pointers)
+    has_successors = order[counts[order] > 0]
+    if has_successors.size > 0:
+        positions, firsts = _gather(graph.successor_pointers, has_successors)
+        slacks = np.minimum.reduceat(earlier[graph.successors[positions]]
+                                     - graph.successor_delays(positions, duration), firsts) - earlier[has_successors]
+        free_float[has_successors] = np.minimum(free_float[has_successors], slacks)
+
+
+def compute_scenarios(graph, durations):
+    """
+    Computes the earliest and latest starts of every task for many sets of durations (called scenarios) at once.
+    This is the same computation as _compute_schedule_of, but each value is a row containing one value per scenario,
+    so every operation is vectorized over the scenarios. Nothing is written in the arena.
+    :param graph: The ScheduleGraph of the project
+    :param durations: The durations, as a NumPy array with one row per slot and one column per scenario
+    :return: A tuple. The first value contains the earliest starts, and the second value the latest starts.
+             They have the same shape as durations. The rows of the slots that are not scheduled contain zeros.
+             The third value contains the project end of each scenario
+    """
+    earlier = np.zeros(durations.shape, dtype=np.result_type(durations, np.int32))
+    later = np.zeros_like(earlier)
+    for level in graph.levels[1:]:
+        if isinstance(level, list):
+            for task in level:
+                ancestors = graph.get_ancestor_delays(task, durations)
+                if len(ancestors) == 1:
+                    np.add(earlier[ancestors[0][0]], ancestors[0][1], out=earlier[task])
+                else:
+                    np.max([earlier[ancestor] + delay for ancestor, delay in ancestors], axis=0, out=earlier[task])
+                np.maximum(earlier[task], 0, out=earlier[task])
+            continue
+        positions, firsts = _gather(graph.ancestor_pointers, level)
+        starts = np.maximum.reduceat(earlier[graph.ancestors[positions]] + graph.ancestor_delays(positions, durations),
+                                     firsts, axis=0)
+        earlier[level] = np.maximum(starts, 0)
+    project_end = (earlier[graph.order] + durations[graph.order]).max(axis=0)
+    for level in reversed(graph.levels):
+        if isinstance(level, list):
+            for task in level:
+                np.subtract(project_end, durations[task], out=later[task])
+                for successor, delay in graph.get_successor_delays(task, durations):
+                    np.minimum(later[task], later[successor] - delay, out=later[task])
+            continue
+        later[level] = project_end - durations[level]
+        has_successors = graph.successor_pointers[level + 1] > graph.successor_pointers[level]
+        if np.any(has_successors):
+            positions, firsts = _gather(graph.successor_pointers, level[has_successors])
+            latest_starts = np.minimum.reduceat(later[graph.successors[positions]]
+                                                - graph.successor_delays(positions, durations), firsts, axis=0)
+            later[level[has_successors]] = np.minimum(later[level[has_successors]], latest_starts)
+    return earlier, later, project_end
+
+
+def scenario_durations(project, delays):
+    """
+    Creates the durations of some scenarios in which some tasks are delayed
+    :param project: The project
+    :param delays: A list with one dictionary per scenario. Each dictionary associates a Task to its delay (in days)
+    :return: A NumPy array with one row per scenario and one column per task
+             (the column i is the Task at the position i of the tasks of the project)
+    """
+    durations = np.tile(_values(project.arena.duration)[[task.slot for task in project.tasks]], (len(delays), 1))
+    for scenario, scenario_delays in enumerate(delays):
+        for task, delay in scenario_delays.items():
+            durations[scenario, project.tasks.index(task)] += delay
+    return durations
+
+
+def evaluate_scenarios(project, durations):
+    """
+    Computes the schedule of the project for many scenarios at once
+    :param project: The project
+    :param durations: The durations of the tasks in each scenario. It is a matrix with one row per scenario
+                      and one column per task (the column i is the Task at the position i of the tasks of the project)
+    :return: The ScenarioSchedule containing the results
+    """
+    durations = np.asarray(durations)
+    if durations.ndim == 1:
+        durations = durations[np.newaxis]
+    if durations.shape[1] != project.tasks_count:
+        raise ValueError(f"There should be {project.tasks_count} durations per scenario, not {durations.shape[1]}")
+    slots = [task.slot for task in project.tasks]
+    # The computation is done with one row per slot, so that each row is contiguous
+    slot_durations = np.zeros((project.arena.capacity, durations.shape[0]), dtype=durations.dtype)
+    slot_durations[slots] = durations.T
+    graph = ScheduleGraph(project)
+    earlier, later, project_end = compute_scenarios(graph, slot_durations)
+    return ScenarioSchedule(list(project.tasks), durations, earlier[slots].T, later[slots].T, project_end)
+
+
+def _fill_indices(arena, first_slot, last_slot, indices):
+    """
+    Gives an index to each task between two tasks (included). This is the same algorithm as fill_indice in Core.c
+    :param arena: The TaskArena of the project
+    :param first_slot: The slot of the first task
+    :param last_slot: The slot of the last task
+    :param indices: A list containing the next index to give from the start, and the next one to give from the end
+    :return: None
+    """
+    counts = arena.successors.counts
+    arena.index[first_slot] = indices[0]
+    indices[0] += 1
+    while counts[first_slot] == 1 and first_slot != last_slot:
+        first_slot = arena.successors.edges[arena.successors.offsets[first_slot]]
+        arena.index[first_slot] = indices[0]
+        indices[0] += 1
+    if first_slot == last_slot:
+        return
+    arena.index[last_slot] = indices[1]
+    indices[1] -= 1
+    while arena.ancestors.counts[last_slot] == 1:
+        last_slot = arena.ancestors.edges[arena.ancestors.offsets[last_slot]]
+        arena.index[last_slot] = indices[1]
+        indices[1] -= 1
+    # Each branch of the intersection starts at a successor of first_slot and ends at an ancestor of last_slot
+    for successor, ancestor in zip(arena.successors.get(first_slot), arena.ancestors.get(last_slot)):
+        _fill_indices(arena, successor, ancestor, indices)
+
+
+def fix_indices(project):
+    """
+    Fixes indices of the tasks in the project
+    :param project: The project
+    :return: None
+    """
+    _fill_indices(project.arena, project.beginning_task.slot, project.project_task.slot, [1, project.tasks_count])
+
+
+def schedule(project):
+    """
+    Computes the index, the earliest_start, the latest_start and the value is_critical of each task of the project.
+    The results are written directly into the arrays of the arena, where the Tasks read them
+    :param project: The project
+    :return: None
+    """
+    fix_indices(project)
+    _compute_schedule_of(project)
+
+
+def update_schedule(project):
+    """
+    Updates the earliest_start, the latest_start, the value is_critical (and the values derived from them) of the tasks
+    of the project after some tasks were modified. A level by level computation is cheap enough,
+    so everything is computed again instead of only visiting the tasks affected by the modifications.
+    Indices are not updated
+    :param project: The project
+    :return: The number of tasks that were visited
+    """
+    return _compute_schedule_of(project)
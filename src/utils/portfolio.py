@@ -0,0 +1,152 @@
+"""
+This file contains the batch scheduling of all the projects (the portfolio), used to display the end and the critical
+tasks of every project in the list of the projects. Projects are only scheduled when they are opened, and scheduling
+thousands of them one after the other would take too long, so they are scheduled in a pool of worker processes.
+Each worker reads and schedules whole project files on its own, and only sends back a small ProjectSummary.
+The projects are independent and the workers share nothing, so they only wait for each other when there are
+less projects left than workers. The summaries are given as soon as they are computed, in the order in which the
+workers finish.
+The pool is created from a Python thread of the application, which already runs pygame, so the worker processes are
+spawned (started from a new interpreter) instead of forked : a forked copy of the application would inherit its
+window and the locks held by its other threads. The entry point of the application calls freeze_support, so that
+the spawned workers also start in the executable built by PyInstaller.
+"""
+
+import multiprocessing
+import os
+import threading
+
+from ProjectSummary import ProjectSummary
+
+# The number of chunks given to each worker process. Files are sent in chunks to reduce the communication between
+# the processes, but a few chunks per worker are kept so that the work stays balanced when some projects are bigger
+_CHUNKS_PER_PROCESS = 8
+
+
+def _summarize_file(project_file_name):
+    """
+    Loads and schedules a project, and summarizes its schedule. This is called in the worker processes
+    :param project_file_name: The name of the file of the project, in the data/projects directory
+    :return: The ProjectSummary. If the project cannot be loaded or scheduled, it contains the error
+    """
+    # We need to import it here to avoid circular imports
+    from Project import Project
+    try:
+        project = Project.load_project(project_file_name)
+        project.load()
+        return project.get_summary()
+    except Exception as e:
+        return ProjectSummary(project_file_name, error=str(e))
+
+
+def schedule_portfolio(file_names, process_count=None):
+    """
+    Schedules many projects in worker processes
+    :param file_names: The names of the files of the projects, in the data/projects directory
+    :param process_count: The number of worker processes. By default, there is one process per core
+    :return: A generator giving the ProjectSummary of each project as soon as it is computed
+    """
+    file_names = list(file_names)
+    if len(file_names) == 0:
+        return
+    if process_count is None:
+        process_count = os.cpu_count() or 1
+    process_count = max(1, min(process_count, len(file_names)))
+    chunk_size = max(1, len(file_names) // (process_count * _CHUNKS_PER_PROCESS))
+    with multiprocessing.get_context("spawn").Pool(process_count) as pool:
+        yield from pool.imap_unordered(_summarize_file, file_names, chunk_size)
+
+
+class PortfolioScheduling:
+
+    """
+    Represents the scheduling of many projects, running in the background. A Python thread receives the summaries
+    computed by the worker processes (see schedule_portfolio), so the application keeps running meanwhile.
+
+    These are the fields of a PortfolioScheduling :
+    - file_names : The names of the files of the projects to schedule.
+    - process_count : The number of worker processes. If it is None, there is one process per core.
+    - summaries : A dictionary associating the name of the file of each project to its ProjectSummary.
+                  It is filled while the summaries are received.
+    - cancelled : Whether the scheduling was asked to stop.
+    - thread : The Python thread receiving the summaries.
+    - done : Whether the scheduling is over.
+    """
+
+    def __init__(self, file_names, process_count=None):
+        """
+        Prepares the scheduling of many projects. It is started by start()
+        :param file_names: The names of the files of the projects, in the data/projects directory
+        :param process_count: The number of worker processes. By default, there is one process per core
+        """
+        self.file_names = list(file_names)
+        self.process_count = process_count
+        self.summaries = {}
+        self.cancelled = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.done = False
+
+    def start(self):
+        """
+        Starts the scheduling in the background
+        :return: None
+        """
+        self.thread.start()
+
+    def _run(self):
+        """
+        Receives the summaries. This is called in the thread of the scheduling
+        :return: None
+        """
+        try:
+            for summary in schedule_portfolio(self.file_names, self.process_count):
+                # A summary set with set_summary is more recent than the file
+                self.summaries.setdefault(summary.file, summary)
+                if self.cancelled:
+                    # Leaving the generator terminates the worker processes
+                    break
+        finally:
+            self.done = True
+
+    def get_progress(self):
+        """
+        :return: The fraction of the projects that are scheduled, between 0 and 1
+        """
+        return min(len(self.summaries) / len(self.file_names), 1) if len(self.file_names) != 0 else 1
+
+    def cancel(self):
+        """
+        Asks the scheduling to stop. The summaries already received are kept
+        :return: None
+        """
+        self.cancelled = True
+
+    def is_done(self):
+        """
+        :return: Whether the scheduling is over (because all the projects were scheduled, or because it was cancelled)
+        """
+        return self.done
+
+    def wait(self):
+        """
+        Waits until the scheduling is over
+        :return: The dictionary of the summaries
+        """
+        self.thread.join()
+        return self.summaries
+
+    def get_summary(self, file_name):
+        """
+        Gives the summary of a project
+        :param file_name: The name of the file of the project
+        :return: The ProjectSummary, or None if the project is not scheduled yet
+        """
+        return self.summaries.get(file_name)
+
+    def set_summary(self, summary):
+        """
+        Replaces the summary of a project, for example after it was modified in the application
+        :param summary: The new ProjectSummary
+        :return: None
+        """
+        self.summaries[summary.file] = summary
@@ -0,0 +1,136 @@
+"""
+This file contains the resource-constrained scheduling engine. The schedule computed by the scheduling backends
+assumes that there are always enough people to work on every task that can start. Here, each task needs some amount
+of the resources of the project, and a task can only start if there is enough of each resource left.
+
+This is a list scheduler (the parallel schedule generation scheme) : the time goes from one event to the next one,
+an event being the end of a task or the time at which a task is allowed to start.
+Like in the scheduling backends, every dependency is a minimum delay between the start of the upstream task and the
+start of the downstream task (see DependencyType.get_delay). When the last upstream task of a task starts, the task
+is put in a heap ordered by the time before which it cannot start. When this time comes, the task is ready, and
+the ready tasks are started by priority, as long as there are enough resources for them.
+A task never starts before its upstream tasks have started, so when a dependency has a negative delay (a task
+allowed to start before its upstream task), the task may start later than its earliest start even without resources.
+
+The running tasks are kept in a heap ordered by end. The ready tasks are kept in one heap per demand (the tasks
+needing exactly the same resources share a heap) ordered by priority : a task fits if and only if the other tasks
+of its heap fit, so the next task to start is the best top of the heaps that fit. The tops of the heaps are kept
+in a heap of candidates. A heap which does not fit is blocked : the resources left only decrease while tasks start,
+so it can only fit again once a task needing one of its resources ends. It is then checked again.
+With P different demands (P is the number of different combinations of resources needed by the tasks, which stays
+small in practice) and T events (at most 2 V), the schedule is computed in O((V+E) log V + T * P log P) in the worst
+case : finding the best task that fits several resources at once has no logarithmic structure, so a blocked heap may
+be checked again at each event. Only the heaps sharing a resource with the tasks that ended are checked again,
+so the second term is usually much smaller.
+"""
+
+import heapq
+
+# The priorities that can be used to choose which task starts first. The smallest value starts first.
+# They are computed by the scheduling backends, so the project must be loaded first
+PRIORITIES = ("latest_start", "total_float")
+
+
+def schedule_resources(project, priority="latest_start"):
+    """
+    Computes the leveled_start of each task of the project, the day at which it starts when resources are limited.
+    The project must be loaded, because the priorities of the tasks are computed by the scheduling backends
+    :param project: The project
+    :param priority: The field of the tasks used as priority, "latest_start" or "total_float".
+                     Ties are broken with the earliest_start, then the index of the tasks
+    :return: The number of days needed to complete the project with its resources
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority}. The priorities are {', '.join(PRIORITIES)}")
+    available = dict(project.resources)
+    for task in project.tasks:
+        for resource, demand in task.demands.items():
+            if resource not in available:
+                raise ValueError(f"The task {task.name} needs the resource {resource}, which does not exist")
+            if demand > available[resource]:
+                raise ValueError(f"The task {task.name} needs {demand} {resource}, "
+                                 f"but there are only {available[resource]}")
+    # remaining[task] is the number of upstream tasks of the task that are not started yet
+    remaining = {task: len(task.upstream_tasks) for task in project.tasks}
+    # not_before[task] is the time before which the task cannot start, given its upstream tasks started so far
+    not_before = dict.fromkeys(project.tasks, 0)
+    # waiting is the heap of the tasks whose upstream tasks are all started, ordered by not_before
+    waiting = [(0, task.index, task.id, task) for task, count in remaining.items() if count == 0]
+    heapq.heapify(waiting)
+    # ready[demand] is the heap of the tasks that can start, and that need exactly these resources
+    ready = {}
+    # candidates is the heap of the tops of the heaps of ready that may fit at this time
+    candidates = []
+    # blocked[resource] is the set of the demands needing this resource whose heap did not fit
+    blocked = {}
+    running = []
+    time = 0
+    leveled_end = 0
+
+    def fits(demand):
+        return all(amount <= available[resource] for resource, amount in demand)
+
+    def push_candidate(demand):
+        heap = ready[demand]
+        if len(heap) != 0:
+            heapq.heappush(candidates, (heap[0], demand))
+
+    def release_waiting():
+        # The tasks that may start now become ready. A new top of its heap is a new candidate
+        while len(waiting) != 0 and waiting[0][0] <= time:
+            task = heapq.heappop(waiting)[-1]
+            demand = tuple(sorted(task.demands.items()))
+            heap = ready.setdefault(demand, [])
+            entry = (getattr(task, priority), task.earliest_start, task.index, task.id, task)
+            heapq.heappush(heap, entry)
+            if heap[0] is entry:
+                heapq.heappush(candidates, (entry, demand))
+
+    def start(task):
+        nonlocal leveled_end
+        for resource, demand in task.demands.items():
+            available[resource] -= demand
+        task.leveled_start = time
+        leveled_end = max(leveled_end, time + task.estimated_time)
+        heapq.heappush(running, (time + task.estimated_time, task.id, task))
+        for downstream_task in task.downstream_tasks:
+            not_before[downstream_task] = max(not_before[downstream_task], time + downstream_task.get_delay(task))
+            remaining[downstream_task] -= 1
+            if remaining[downstream_task] == 0:
+                heapq.heappush(waiting, (not_before[downstream_task], downstream_task.index, downstream_task.id,
+                                         downstream_task))
+
+    while True:
+        release_waiting()
+        # We start the tasks by priority, as long as there are enough resources for them
+        while len(candidates) != 0:
+            entry, demand = heapq.heappop(candidates)
+            heap = ready[demand]
+            # The entry is outdated if the top of its heap changed since it was pushed
+            if len(heap) == 0 or heap[0] is not entry:
+                continue
+            if not fits(demand):
+                for resource, _ in demand:
+                    blocked.setdefault(resource, set()).add(demand)
+                continue
+            heapq.heappop(heap)
+            start(entry[-1])
+            push_candidate(demand)
+            # The tasks started may let other tasks start right now (with a START_TO_START dependency for example)
+            release_waiting()
+        if len(running) == 0 and len(waiting) == 0:
+            break
+        # We go to the next event, and release the resources of every task ending by that time
+        time = min(heap[0][0] for heap in (running, waiting) if len(heap) != 0)
+        unblocked = set()
+        while len(running) != 0 and running[0][0] <= time:
+            _, _, task = heapq.heappop(running)
+            for resource, demand in task.demands.items():
+                available[resource] += demand
+                unblocked.update(blocked.pop(resource, ()))
+        # The heaps needing a resource that was released may fit again
+        for demand in unblocked:
+            push_candidate(demand)
+    # Only the tasks started here are counted, the leveled_start of the other ones may be outdated
+    project.leveled_end = leveled_end
+    return project.leveled_end
@@ -0,0 +1,90 @@
+"""
+This file contains the validation of the structure of a project, before the project is created from its JSON file.
+The scheduling expects the tasks to form a directed acyclic graph starting at the beginning task : a cycle would
+make the recursive updates of the tasks loop forever, and a reference to a task that does not exist would only
+fail deep in the C functions. So the structure is checked first, in O(V + E) :
+- the beginning task and the project task (the two first tasks) should exist,
+- every upstream id should be the id of a task (an int, but not a bool),
+- there should be no cycle. It is checked with Kahn's algorithm : the tasks are removed one after the other,
+  once all their upstream tasks are removed. The tasks that are never removed are in a cycle, or after one.
+Kahn's algorithm is run by the C library when it is available, the Python version below is used otherwise.
+"""
+
+from itertools import chain
+
+from ProjectLoadError import ProjectLoadError
+from utils import c_functions
+
+
+def _remaining_upstream_counts(upstream):
+    """
+    Runs Kahn's algorithm on the tasks of a project that is not created yet
+    :param upstream: The list of the ids of the upstream tasks of each task. They should all be ids of tasks
+    :return: The number of upstream tasks of each task that could not be removed
+    """
+    downstream = [[] for _ in upstream]
+    for task_id, upstream_ids in enumerate(upstream):
+        for upstream_id in upstream_ids:
+            downstream[upstream_id].append(task_id)
+    remaining = list(map(len, upstream))
+    removed = [task_id for task_id, count in enumerate(remaining) if count == 0]
+    # The list grows while we go through it, like a queue
+    for task_id in removed:
+        for downstream_id in downstream[task_id]:
+            remaining[downstream_id] -= 1
+            if remaining[downstream_id] == 0:
+                removed.append(downstream_id)
+    return remaining
+
+
+def _find_cycle(upstream, remaining):
+    """
+    Finds a cycle among the tasks that Kahn's algorithm could not remove.
+    Each of these tasks has an upstream task that was not removed either, so going upstream from any of them
+    always ends up going around a cycle
+    :param upstream: The list of the ids of the upstream tasks of each task
+    :param remaining: The number of upstream tasks of each task that were not removed by Kahn's algorithm
+    :return: The ids of the tasks of the cycle, each task being an upstream task of the next one
+    """
+    current_id = next(task_id for task_id, count in enumerate(remaining) if count > 0)
+    positions = {}
+    path = []
+    while current_id not in positions:
+        positions[current_id] = len(path)
+        path.append(current_id)
+        current_id = next(upstream_id for upstream_id in upstream[current_id] if remaining[upstream_id] > 0)
+    # The path goes upstream, so it is reversed to give the cycle in the order of the dependencies
+    cycle = path[positions[current_id]:]
+    cycle.reverse()
+    return cycle
+
+
+def validate_structure(file, upstream):
+    """
+    Checks the structure of a project before it is created
+    :param file: The name of the file of the project, it is given to the error
+    :param upstream: The list of the ids of the upstream tasks of each task. The task i has the id i
+    :return: None. A ProjectLoadError containing all the errors found is raised if the structure is not valid
+    """
+    task_count = len(upstream)
+    missing_tasks = [task_name for task_id, task_name in enumerate(("beginning task", "project task"))
+                     if task_id >= task_count]
+    missing_ids = []
+    # The ids should be ints. A bool is an int for Python and for the arrays given to the C library, but it is
+    # not the id of a task : the types are checked before both paths, so that a project never loads only with one
+    ids_valid = set(map(type, chain.from_iterable(upstream))) <= {int}
+    remaining = c_functions.check_structure(upstream) if c_functions.available and ids_valid else None
+    # Without the C library, or if some ids are wrong, the ids are checked one by one
+    if remaining is None:
+        missing_ids = [(task_id, upstream_id) for task_id, upstream_ids in enumerate(upstream)
+                       for upstream_id in upstream_ids
+                       if type(upstream_id) is not int or not 0 <= upstream_id < task_count]
+        if len(missing_ids) != 0:
+            # The cycles are still looked for, without the references to tasks that do not exist
+            upstream = [[upstream_id for upstream_id in upstream_ids
+                         if type(upstream_id) is int and 0 <= upstream_id < task_count]
+                        for upstream_ids in upstream]
+        remaining = _remaining_upstream_counts(upstream)
+    cycle = _find_cycle(upstream, remaining) if any(remaining) else []
+    if len(missing_tasks) != 0 or len(missing_ids) != 0 or len(cycle) != 0:
+        raise ProjectLoadError(file, missing_tasks, missing_ids, cycle)
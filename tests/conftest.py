@@ -0,0 +1,139 @@
+"""
+The shared helpers of the tests of the scheduling engine. The modules of the application are in src, and the C library
+is loaded from the current directory (see utils/c_functions.py), so the tests are run from the root of the repository.
+"""
+
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+os.chdir(ROOT)
+
+from DependencyType import DependencyType
+from Project import Project
+from TaskStatus import TaskStatus
+
+
+def make_project(seed, size=80, typed=False):
+    """
+    Generates a project made of branches and intersections, like the ones created in the application.
+    A branch has at most one intersection, followed by a few tasks, because the indices do not support
+    two intersections in a row on the same branch
+    :param seed: The seed of the random generator
+    :param size: The approximate number of tasks
+    :param typed: Whether some dependencies have another type than finish to start, or a lag
+    :return: The Project, not loaded
+    """
+    rng = random.Random(seed)
+    estimated_times = [0, 0]
+    upstream = [[], []]
+    dependencies = [[], []]
+
+    def new_task(upstream_ids):
+        estimated_times.append(rng.randint(0, 20))
+        upstream.append(list(upstream_ids))
+        dependencies.append([[upstream_id, DependencyType(rng.randrange(4)), rng.randint(-3, 5)]
+                             for upstream_id in upstream_ids if typed and rng.random() < 0.4])
+        return len(upstream) - 1
+
+    def branch(previous, budget, depth):
+        forked = False
+        while budget > 0:
+            if not forked and depth < 4 and budget > 6 and rng.random() < 0.3:
+                forked = True
+                count = rng.randint(2, 3)
+                ends = [branch(new_task([previous]), rng.randint(0, budget // (count * 2)), depth + 1)
+                        for _ in range(count)]
+                previous = new_task([new_task(ends)])
+                budget -= count + 2
+            else:
+                previous = new_task([previous])
+                budget -= 1
+        return previous
+
+    upstream[1] = [branch(new_task([0]), size, 0)]
+    statuses = [TaskStatus.FINISHED] + [TaskStatus(rng.choice([0, 1, 4])) for _ in range(len(upstream) - 1)]
+    return Project.from_arrays(f"generated {seed}", f"generated_{seed}.json", "", estimated_times, upstream,
+                               names=[f"T{i}" for i in range(len(upstream))], statuses=statuses,
+                               dependencies=dependencies)
+
+
+def get_schedule(project):
+    """
+    Gives the values computed by the scheduling backends
+    :param project: The project
+    :return: A tuple containing the project end, and a dictionary associating the id of each task to its values
+    """
+    return project.get_project_end(), {task.id: (task.earliest_start, task.latest_start, task.is_critical,
+                                                 task.earliest_finish, task.latest_finish, task.total_float,
+                                                 task.free_float)
+                                       for task in project.tasks}
+
+
+def get_state(project):
+    """
+    Gives everything that a modification of the project can change : the structure, the values of the tasks
+    and the schedule. The slots of the arena are not included, since they may change when a task is added back
+    :param project: The project
+    :return: The state, which can be compared to another one
+    """
+    tasks = {task.id: (task.name, task.index, task.estimated_time, task.status, task.unfinished_upstream_tasks_count,
+                       [upstream_task.id for upstream_task in task.upstream_tasks],
+                       [downstream_task.id for downstream_task in task.downstream_tasks],
+                       sorted((upstream_task.id, dependency_type, lag)
+                              for upstream_task, (dependency_type, lag) in task.dependencies.items()))
+             for task in project.tasks}
+    return tasks, get_schedule(project)
+
+
+def check_arena(project):
+    """
+    Checks that the arena of the project contains the edges of the tasks, in the order of their TaskLists
+    :param project: The project
+    :return: None
+    """
+    arena = project.arena
+    assert sum(task is not None for task in arena.tasks) == len(project.tasks)
+    for task in project.tasks:
+        assert arena.tasks[task.slot] is task
+        assert list(arena.ancestors.get(task.slot)) == [upstream_task.slot for upstream_task in task.upstream_tasks]
+        assert list(arena.successors.get(task.slot)) == [downstream_task.slot
+                                                         for downstream_task in task.downstream_tasks]
+
+
+def modify(project, rng, update=True):
+    """
+    Makes a random modification of the project, that always changes something
+    :param project: The project
+    :param rng: The random generator
+    :param update: Whether the project is updated after the modification (it is not during a batch)
+    :return: None
+    """
+    tasks = [task for task in project.tasks if not task.is_beginning_task and not task.is_project_task]
+    # The tasks of a plain branch, that can be removed or followed by a new task without creating an intersection
+    chained_tasks = [task for task in tasks
+                     if len(task.upstream_tasks) == 1 and len(task.upstream_tasks[0].downstream_tasks) == 1
+                     and len(task.downstream_tasks) == 1 and len(task.downstream_tasks[0].upstream_tasks) == 1]
+    operation = rng.randrange(5)
+    if operation == 0 and len(chained_tasks) != 0:
+        project.add_task(f"N{project.next_task_id}", "", rng.randint(0, 20), {rng.choice(chained_tasks)}, False)
+        return
+    if operation == 1 and len(chained_tasks) > 10:
+        project.remove_task(rng.choice(chained_tasks))
+        return
+    # Like in the application, the status of a locked task cannot be changed
+    unlocked_tasks = [task for task in tasks if task.status != TaskStatus.LOCKED]
+    task = rng.choice(tasks)
+    if operation == 2:
+        upstream_task = rng.choice(list(task.upstream_tasks))
+        dependency_type, lag = task.get_dependency(upstream_task)
+        task.set_dependency(upstream_task, DependencyType((dependency_type + rng.randint(1, 3)) % 4), lag + 1)
+    elif operation == 3 and len(unlocked_tasks) != 0:
+        task = rng.choice(unlocked_tasks)
+        task.set_status(TaskStatus.FINISHED if task.status != TaskStatus.FINISHED else TaskStatus.IN_PROGRESS)
+    else:
+        task.estimated_time += rng.randint(1, 10) * rng.choice([-1, 1]) if task.estimated_time > 10 else 5
+    if update:
+        project.update_after_modifications()
@@ -0,0 +1,96 @@
+"""
+The tests of the registry of the scheduling backends, of the C backend against the NumPy one,
+and of the deprecated functions computing a single value.
+"""
+
+import random
+
+import pytest
+
+import conftest
+from Project import Project
+from utils import backends, c_functions, numpy_functions
+
+DEPRECATED = [backends.compute_earliest_start, backends.compute_latest_start, backends.identify_critical_tasks]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        backends.get_backend("fortran")
+
+
+def test_backend_selection(monkeypatch):
+    monkeypatch.setattr(backends, "default_backend", None)
+    monkeypatch.setattr(c_functions, "available", True)
+    monkeypatch.setattr(numpy_functions, "available", True)
+    assert backends.available_backends() == ["c", "numpy"]
+    assert backends.get_backend() is c_functions
+    assert backends.get_backend("numpy") is numpy_functions
+    # Without the C library, the NumPy backend is used, and the C one cannot be forced
+    monkeypatch.setattr(c_functions, "available", False)
+    assert backends.get_backend() is numpy_functions
+    with pytest.raises(ValueError):
+        backends.get_backend("c")
+    monkeypatch.setattr(numpy_functions, "available", False)
+    with pytest.raises(ValueError):
+        backends.get_backend()
+
+
+@pytest.mark.parametrize("backend", backends.available_backends())
+def test_schedule(backend):
+    # 0 -> 2 (3 days) -> 3 (4 days) or 4 (1 day) -> 5 (2 days) -> 1
+    project = Project.from_arrays("diamond", "diamond.json", "", [0, 0, 3, 4, 1, 2],
+                                  [[], [5], [0], [2], [2], [3, 4]])
+    project.load(backend)
+    tasks = project.tasks_by_id
+    assert project.get_project_end() == 9
+    assert [tasks[i].earliest_start for i in range(6)] == [0, 9, 0, 3, 3, 7]
+    assert [tasks[i].latest_start for i in range(6)] == [0, 9, 0, 3, 6, 7]
+    assert [tasks[i].is_critical for i in range(2, 6)] == [True, True, False, True]
+    assert (tasks[4].total_float, tasks[4].free_float) == (3, 3)
+
+
+@pytest.mark.skipif(not {"c", "numpy"} <= set(backends.available_backends()), reason="Both backends are needed")
+@pytest.mark.parametrize("typed", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_backends_parity(typed, seed):
+    project = conftest.make_project(seed, size=300, typed=typed)
+    project.load("c")
+    schedule = conftest.get_schedule(project)
+    project.load("numpy")
+    assert conftest.get_schedule(project) == schedule
+    rng = random.Random(seed)
+    for _ in range(10):
+        conftest.modify(project, rng)
+        schedule = conftest.get_schedule(project)
+        project.load("c")
+        assert conftest.get_schedule(project) == schedule
+        project.load("numpy")
+        assert conftest.get_schedule(project) == schedule
+
+
+@pytest.mark.parametrize("backend", backends.available_backends())
+@pytest.mark.parametrize("function", DEPRECATED)
+def test_deprecated_functions_update_an_outdated_schedule(backend, function):
+    project = conftest.make_project(0)
+    project.load(backend)
+    task = project.tasks_by_id[2]
+    task.estimated_time += 7
+    assert not project.arena.is_schedule_current()
+    with pytest.deprecated_call():
+        function(project)
+    assert project.arena.is_schedule_current()
+    schedule = conftest.get_schedule(project)
+    project.load()
+    assert conftest.get_schedule(project) == schedule
+
+
+@pytest.mark.parametrize("backend", backends.available_backends())
+def test_deprecated_functions_keep_a_current_schedule(backend, monkeypatch):
+    project = conftest.make_project(0)
+    project.load(backend)
+    # The schedule is current, so the backend must not be run again
+    monkeypatch.setattr(backends.get_backend(backend), "update_schedule", None)
+    for function in DEPRECATED:
+        with pytest.deprecated_call():
+            function(project)
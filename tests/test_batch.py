@@ -0,0 +1,98 @@
+"""
+The tests of the batches of modifications : a single update when the batch is left, and the rollback
+of every modification when it fails.
+"""
+
+import random
+
+import pytest
+
+from Project import Project
+from conftest import check_arena, get_schedule, get_state, make_project, modify
+from utils import backends
+
+BACKENDS = backends.available_backends()
+
+
+@pytest.fixture
+def chain():
+    """
+    A project made of one branch : 0 -> 2 (1 day) -> 3 (2 days) -> 4 (3 days) -> 1
+    """
+    project = Project.from_arrays("chain", "chain.json", "", [0, 0, 1, 2, 3], [[], [4], [0], [2], [3]],
+                                  names=[f"T{i}" for i in range(5)])
+    project.load()
+    return project
+
+
+def test_single_update(chain, monkeypatch):
+    updates = []
+    update_after_modifications = chain.update_after_modifications
+    monkeypatch.setattr(chain, "update_after_modifications", lambda: updates.append(update_after_modifications()))
+    tasks = chain.tasks_by_id
+    with chain.batch():
+        chain.add_task("N", "", 5, {tasks[3]}, False)
+        tasks[2].estimated_time = 4
+        with chain.batch():
+            chain.remove_task(tasks[4])
+        # Nothing is computed in the block, even when a nested batch is left
+        assert len(updates) == 0
+        assert not chain.arena.is_schedule_current()
+        assert chain.get_project_end() == 6
+    assert len(updates) == 1
+    assert [task.id for task in tasks[3].downstream_tasks] == [5]
+    assert (tasks[5].earliest_start, chain.get_project_end()) == (6, 11)
+    schedule = get_schedule(chain)
+    chain.load()
+    assert get_schedule(chain) == schedule
+    # The whole batch is a single step of the history
+    assert len(chain.undo_steps) == 1
+
+
+def test_rollback_of_added_and_removed_tasks(chain):
+    state = get_state(chain)
+    tasks = chain.tasks_by_id
+    removed_task = tasks[4]
+    with pytest.raises(RuntimeError):
+        with chain.batch():
+            chain.add_task("N", "", 5, {tasks[3]}, False)
+            added_task = tasks[5]
+            chain.remove_task(removed_task)
+            raise RuntimeError("rolled back")
+    assert get_state(chain) == state
+    assert chain.tasks_by_id[4] is removed_task and 5 not in chain.tasks_by_id
+    assert added_task.arena is None
+    assert chain.next_task_id == 5
+    assert len(chain.undo_steps) == 0
+    check_arena(chain)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_rollback(backend, seed):
+    project = make_project(seed, typed=True)
+    project.load(backend)
+    rng = random.Random(seed)
+    modify(project, rng)
+    state = get_state(project)
+    undo_steps_count = len(project.undo_steps)
+    with pytest.raises(RuntimeError):
+        with project.batch():
+            for _ in range(10):
+                modify(project, rng, update=False)
+            raise RuntimeError("rolled back")
+    assert get_state(project) == state
+    assert len(project.undo_steps) == undo_steps_count
+    check_arena(project)
+    # A cycle is only found when the batch is left
+    with pytest.raises(ValueError):
+        with project.batch():
+            modify(project, rng, update=False)
+            project.beginning_task.add_upstream_task(project.project_task)
+    assert get_state(project) == state
+    assert len(project.undo_steps) == undo_steps_count
+    check_arena(project)
+    # The project can still be modified after a rollback
+    with project.batch():
+        modify(project, rng, update=False)
+    assert len(project.undo_steps) == undo_steps_count + 1
@@ -0,0 +1,44 @@
+"""
+The tests of the Calendar converting the working days of a project to dates.
+"""
+
+import datetime
+
+import pytest
+
+import conftest  # noqa: F401, it makes the modules of src importable
+from Calendar import Calendar
+
+# A Monday
+START = datetime.date(2024, 1, 1)
+
+
+def test_weekends_and_holidays_are_skipped():
+    calendar = Calendar(START, holidays=[datetime.date(2024, 1, 3)])
+    assert [calendar.get_date(day) for day in range(5)] == [datetime.date(2024, 1, day) for day in (1, 2, 4, 5, 8)]
+    assert calendar.get_day(datetime.date(2024, 1, 6)) == 4
+    assert calendar.get_finish_date(5) == datetime.date(2024, 1, 8)
+
+
+def test_far_dates_extend_the_tables():
+    calendar = Calendar(START, working_days=(6,))
+    assert calendar.get_date(1000) == START + datetime.timedelta(days=6 + 7 * 1000)
+    assert calendar.get_day(calendar.get_date(1000)) == 1000
+
+
+def test_holidays_after_the_tables():
+    holidays = [START + datetime.timedelta(days=7 * week) for week in range(500)]
+    calendar = Calendar(START, working_days=(0,), holidays=holidays)
+    assert calendar.get_date(0) == START + datetime.timedelta(days=7 * 500)
+
+
+@pytest.mark.parametrize("working_days", [(), (7,), (-1,), (0, 9), (True,), ("0",), (1.0,)])
+def test_wrong_working_days(working_days):
+    with pytest.raises(ValueError):
+        Calendar(START, working_days)
+
+
+@pytest.mark.parametrize("holiday", ["2024-01-02", datetime.datetime(2024, 1, 2), None])
+def test_wrong_holidays(holiday):
+    with pytest.raises(ValueError):
+        Calendar(START, holidays=[holiday])
@@ -0,0 +1,73 @@
+"""
+The tests of the typed dependencies (finish to start, start to start, finish to finish and start to finish)
+and of their lags, with every scheduling backend.
+"""
+
+import os
+
+import pytest
+
+from DependencyType import DependencyType
+from Project import Project
+from utils import backends
+
+BACKENDS = backends.available_backends()
+
+
+def make_pair(dependency_type, lag):
+    """
+    Creates the project 0 -> A (5 days) -> B (4 days) -> 1, where B depends on A with the given dependency
+    :param dependency_type: The DependencyType of B on A
+    :param lag: The lag of the dependency
+    :return: The Project, not loaded
+    """
+    return Project.from_arrays("pair", "pair.json", "", [0, 0, 5, 4], [[], [3], [0], [2]], names=["", "", "A", "B"],
+                               dependencies=[[], [], [], [[2, dependency_type, lag]]])
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("dependency_type, lag, earliest_start, latest_start, project_end", [
+    (DependencyType.FINISH_TO_START, -2, 3, 3, 7),
+    (DependencyType.FINISH_TO_START, 3, 8, 8, 12),
+    (DependencyType.START_TO_START, 1, 1, 1, 5),
+    # B could start 2 days before A, but nothing starts before the beginning of the project
+    (DependencyType.START_TO_START, -2, 0, 1, 5),
+    # B finishes 1 day before A : it starts at 0, and A ends the project
+    (DependencyType.FINISH_TO_FINISH, -1, 0, 1, 5),
+    (DependencyType.START_TO_FINISH, 6, 2, 2, 6),
+])
+def test_dependency(backend, dependency_type, lag, earliest_start, latest_start, project_end):
+    project = make_pair(dependency_type, lag)
+    project.load(backend)
+    tasks = project.tasks_by_id
+    assert tasks[3].get_dependency(tasks[2]) == (dependency_type, lag)
+    assert (tasks[3].earliest_start, tasks[3].latest_start) == (earliest_start, latest_start)
+    assert project.get_project_end() == project_end
+    assert tasks[2].is_critical
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_set_dependency(backend):
+    project = make_pair(DependencyType.FINISH_TO_START, 0)
+    project.load(backend)
+    tasks = project.tasks_by_id
+    assert tasks[3].dependencies == {}
+    tasks[3].set_dependency(tasks[2], DependencyType.START_TO_START, -1)
+    project.update_after_modifications()
+    assert (tasks[3].earliest_start, project.get_project_end()) == (0, 5)
+    # Going back to finish to start without lag removes the dependency
+    tasks[3].set_dependency(tasks[2], DependencyType.FINISH_TO_START, 0)
+    project.update_after_modifications()
+    assert tasks[3].dependencies == {}
+    assert (tasks[3].earliest_start, project.get_project_end()) == (5, 9)
+    with pytest.raises(ValueError):
+        tasks[2].set_dependency(tasks[3], DependencyType.START_TO_START)
+
+
+def test_saved_dependencies(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data/projects")
+    project = make_pair(DependencyType.START_TO_FINISH, -3)
+    project.save()
+    tasks = Project.load_project("pair.json").tasks_by_id
+    assert tasks[3].dependencies == {tasks[2]: (DependencyType.START_TO_FINISH, -3)}
@@ -0,0 +1,111 @@
+"""
+The tests of the history of a project : the modifications undone and made again.
+"""
+
+import random
+
+import pytest
+
+from Project import Project
+from conftest import check_arena, get_schedule, get_state, make_project, modify
+from utils import backends
+
+BACKENDS = backends.available_backends()
+
+
+@pytest.fixture
+def chain():
+    """
+    A project made of one branch : 0 -> 2 (1 day) -> 3 (2 days) -> 4 (3 days) -> 1
+    """
+    project = Project.from_arrays("chain", "chain.json", "", [0, 0, 1, 2, 3], [[], [4], [0], [2], [3]],
+                                  names=[f"T{i}" for i in range(5)])
+    project.load()
+    return project
+
+
+def test_undo_add_task(chain):
+    tasks = chain.tasks_by_id
+    chain.add_task("N", "", 5, {tasks[3]}, False)
+    added_task = tasks[5]
+    assert chain.get_project_end() == 11
+    assert chain.undo()
+    assert 5 not in chain.tasks_by_id and added_task.arena is None
+    assert list(tasks[3].downstream_tasks) == [tasks[4]]
+    assert chain.get_project_end() == 6
+    assert chain.redo()
+    assert chain.tasks_by_id[5] is added_task
+    assert list(tasks[3].downstream_tasks) == [added_task] and list(added_task.downstream_tasks) == [tasks[4]]
+    assert chain.get_project_end() == 11
+    check_arena(chain)
+
+
+def test_compact_steps():
+    project = make_project(0, size=300)
+    project.load()
+    task = project.tasks_by_id[10]
+    estimated_time = task.estimated_time
+    task.estimated_time += 3
+    project.update_after_modifications()
+    # A step only contains the operations undoing the modification, not a copy of the project
+    assert project.undo_steps[-1] == [("set_estimated_time", task, estimated_time)]
+    project.add_task("N", "", 1, {project.tasks_by_id[10]}, False)
+    assert len(project.undo_steps[-1]) < 10
+
+
+def test_modification_clears_redo(chain):
+    tasks = chain.tasks_by_id
+    tasks[2].estimated_time = 5
+    chain.update_after_modifications()
+    tasks[3].estimated_time = 7
+    chain.update_after_modifications()
+    assert chain.undo()
+    assert (tasks[3].estimated_time, chain.get_project_end()) == (2, 10)
+    tasks[4].estimated_time = 1
+    chain.update_after_modifications()
+    assert not chain.redo()
+    assert chain.undo() and chain.undo()
+    assert [tasks[i].estimated_time for i in range(2, 5)] == [1, 2, 3]
+    assert not chain.undo()
+
+
+def test_undo_is_incremental(monkeypatch):
+    project = make_project(0, size=300)
+    project.load("c" if "c" in BACKENDS else None)
+    task = project.tasks_by_id[10]
+    task.estimated_time += 3
+    project.update_after_modifications()
+    visited_counts = []
+    update_schedule = project.update_schedule
+    monkeypatch.setattr(project, "update_schedule", lambda: visited_counts.append(update_schedule()))
+    assert project.undo()
+    assert len(visited_counts) == 1
+    schedule = get_schedule(project)
+    project.load()
+    assert get_schedule(project) == schedule
+    # The NumPy backend computes everything again (see numpy_functions.update_schedule)
+    if project.backend == "c":
+        assert visited_counts[0] < len(project.tasks) // 2
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("seed", range(5))
+def test_undo_redo_round_trip(backend, seed):
+    project = make_project(seed, typed=True)
+    project.load(backend)
+    rng = random.Random(seed)
+    states = [get_state(project)]
+    for _ in range(20):
+        modify(project, rng)
+        states.append(get_state(project))
+    assert len(project.undo_steps) == 20
+    for state in reversed(states[:-1]):
+        assert project.undo()
+        assert get_state(project) == state
+        check_arena(project)
+    assert not project.undo()
+    for state in states[1:]:
+        assert project.redo()
+        assert get_state(project) == state
+        check_arena(project)
+    assert not project.redo()
@@ -0,0 +1,141 @@
+"""
+The tests of the reachability index of the arena, which answers Task.is_upstream_of, against a search of the graph.
+"""
+
+import random
+
+import pytest
+
+from Project import Project
+from ReachabilityIndex import ReachabilityIndex
+from conftest import make_project, modify
+
+
+def get_reachable_ids(project):
+    """
+    Searches the tasks downstream of each task of the project
+    :param project: The project
+    :return: A dictionary associating the id of each task to the set of the ids of the tasks downstream of it
+    """
+    reachable_ids = {}
+    for task in project.tasks:
+        reachable = set()
+        stack = list(task.downstream_tasks)
+        while len(stack) != 0:
+            downstream_task = stack.pop()
+            if downstream_task.id not in reachable:
+                reachable.add(downstream_task.id)
+                stack.extend(downstream_task.downstream_tasks)
+        reachable_ids[task.id] = reachable
+    return reachable_ids
+
+
+def check_reachability(project):
+    """
+    Checks the answer of Task.is_upstream_of for every pair of tasks of the project
+    :param project: The project
+    :return: None
+    """
+    reachable_ids = get_reachable_ids(project)
+    for task in project.tasks:
+        assert {other_task.id for other_task in project.tasks if task.is_upstream_of(other_task)} == \
+            reachable_ids[task.id]
+
+
+@pytest.fixture
+def chain():
+    """
+    A project made of one branch : 0 -> 2 -> 3 -> 4 -> 5 -> 6 -> 1
+    """
+    project = Project.from_arrays("chain", "chain.json", "", [0, 0, 1, 2, 3, 4, 5],
+                                  [[], [6], [0], [2], [3], [4], [5]], names=[f"T{i}" for i in range(7)])
+    project.load()
+    return project
+
+
+@pytest.fixture
+def no_build(monkeypatch, chain):
+    """
+    Builds the index of the chain, then makes any later build fail, to check that the edits only update it
+    """
+    check_reachability(chain)
+
+    def build(index):
+        raise AssertionError("the index was built again")
+
+    monkeypatch.setattr(ReachabilityIndex, "_build", build)
+    return chain
+
+
+def test_chain(chain):
+    tasks = chain.tasks_by_id
+    assert tasks[2].is_upstream_of(tasks[6])
+    assert not tasks[6].is_upstream_of(tasks[2])
+    assert not tasks[3].is_upstream_of(tasks[3])
+    check_reachability(chain)
+
+
+def test_insert_in_chain(no_build):
+    tasks = no_build.tasks_by_id
+    no_build.add_task("N", "", 1, {tasks[3]}, False)
+    new_task = tasks[7]
+    assert tasks[2].is_upstream_of(new_task)
+    assert new_task.is_upstream_of(tasks[4])
+    assert not tasks[4].is_upstream_of(new_task)
+    check_reachability(no_build)
+
+
+def test_new_branch(no_build):
+    tasks = no_build.tasks_by_id
+    no_build.add_task("N", "", 1, {tasks[3]}, True)
+    new_task = tasks[7]
+    assert tasks[3].is_upstream_of(new_task)
+    assert not tasks[4].is_upstream_of(new_task)
+    assert not new_task.is_upstream_of(tasks[4])
+    assert new_task.is_upstream_of(no_build.project_task)
+    check_reachability(no_build)
+
+
+def test_remove_and_undo(no_build):
+    tasks = no_build.tasks_by_id
+    removed_task = tasks[4]
+    no_build.remove_task(removed_task)
+    assert tasks[3].is_upstream_of(tasks[5])
+    check_reachability(no_build)
+    assert no_build.undo()
+    assert tasks[4] is removed_task
+    assert tasks[3].is_upstream_of(removed_task)
+    assert removed_task.is_upstream_of(tasks[5])
+    check_reachability(no_build)
+
+
+def test_edges(chain):
+    tasks = chain.tasks_by_id
+    # The edges added go downstream, so the keys stay in a topological order and only the labels are updated
+    tasks[5].add_upstream_task(tasks[2])
+    tasks[6].add_upstream_task(tasks[0])
+    check_reachability(chain)
+    tasks[4].remove_upstream_task(tasks[3])
+    assert not tasks[3].is_upstream_of(tasks[4])
+    assert tasks[2].is_upstream_of(tasks[5])
+    check_reachability(chain)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_modifications(seed):
+    project = make_project(seed)
+    project.load()
+    rng = random.Random(seed)
+    check_reachability(project)
+    for _ in range(20):
+        modify(project, rng)
+        check_reachability(project)
+    for _ in range(5):
+        assert project.undo()
+        check_reachability(project)
+    with pytest.raises(RuntimeError):
+        with project.batch():
+            for _ in range(5):
+                modify(project, rng, update=False)
+            raise RuntimeError("rolled back")
+    check_reachability(project)
@@ -0,0 +1,68 @@
+"""
+The tests of the resource-constrained scheduling (see utils/resource_scheduling.py).
+"""
+
+import pytest
+
+import conftest  # noqa: F401, it makes the modules of src importable
+from Project import Project
+
+
+def make_project(resources, demands):
+    """
+    Creates the project 0 -> 2 -> (3, 4, 5) -> 6 -> 7 -> 1, and loads it
+    :param resources: The resources of the project
+    :param demands: A dictionary associating the id of some tasks to their demands
+    :return: The Project
+    """
+    project = Project.from_arrays("resources", "resources.json", "", [0, 0, 1, 4, 3, 2, 0, 1],
+                                  [[], [7], [0], [2], [2], [2], [3, 4, 5], [6]], resources=resources)
+    for task_id, task_demands in demands.items():
+        project.tasks_by_id[task_id].demands = task_demands
+    project.load()
+    return project
+
+
+def leveled_starts(project):
+    return {task.id: task.leveled_start for task in project.tasks}
+
+
+def test_without_resources_the_tasks_start_at_their_earliest_start():
+    project = make_project({}, {})
+    assert project.schedule_resources() == project.get_project_end() == 6
+    assert leveled_starts(project) == {task.id: task.earliest_start for task in project.tasks}
+
+
+@pytest.mark.parametrize("priority", ["latest_start", "total_float"])
+def test_capacity_conflict(priority):
+    # 3 and 5 fit together at the day 1, 4 needs both developers and waits for the end of 3
+    project = make_project({"dev": 2}, {3: {"dev": 1}, 4: {"dev": 2}, 5: {"dev": 1}})
+    assert project.schedule_resources(priority) == 9
+    assert project.leveled_end == 9
+    assert leveled_starts(project) == {0: 0, 2: 0, 3: 1, 5: 1, 4: 5, 6: 8, 7: 8, 1: 9}
+
+
+def test_priority_decides_who_waits():
+    # Only one of the three tasks can run at a time : the one with the least margin (3) goes first
+    project = make_project({"dev": 1}, {3: {"dev": 1}, 4: {"dev": 1}, 5: {"dev": 1}})
+    assert project.schedule_resources() == 11
+    assert [leveled_starts(project)[task_id] for task_id in (3, 4, 5)] == [1, 5, 8]
+
+
+def test_independent_resources_do_not_block_each_other():
+    # 4 is blocked on dev while 5 only needs qa, which is released at another time
+    project = make_project({"dev": 1, "qa": 1}, {3: {"dev": 1}, 4: {"dev": 1, "qa": 1}, 5: {"qa": 1}})
+    project.schedule_resources()
+    assert [leveled_starts(project)[task_id] for task_id in (3, 4, 5)] == [1, 5, 1]
+
+
+@pytest.mark.parametrize("resources, demands", [({"dev": 1}, {3: {"qa": 1}}), ({"dev": 1}, {3: {"dev": 2}})])
+def test_impossible_demands(resources, demands):
+    project = make_project(resources, demands)
+    with pytest.raises(ValueError):
+        project.schedule_resources()
+
+
+def test_unknown_priority():
+    with pytest.raises(ValueError):
+        make_project({}, {}).schedule_resources("earliest_start")
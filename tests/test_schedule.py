@@ -0,0 +1,56 @@
+"""
+The tests of the incremental updates of the schedule, against a full recompute.
+"""
+
+import random
+
+import pytest
+
+from Project import Project
+from conftest import check_arena, get_schedule, make_project, modify
+from utils import backends
+
+BACKENDS = backends.available_backends()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("typed", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_update_matches_full_schedule(backend, typed, seed):
+    project = make_project(seed, typed=typed)
+    project.load(backend)
+    rng = random.Random(seed)
+    for _ in range(30):
+        modify(project, rng)
+        check_arena(project)
+        schedule = get_schedule(project)
+        project.load()
+        assert get_schedule(project) == schedule
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_update_visits_affected_tasks(backend):
+    # A chain of 100 tasks, followed by an intersection with a long branch (10 days) and a short one (1 day)
+    upstream = [[], [105], [0]] + [[i] for i in range(2, 101)] + [[101], [101], [102, 103], [104]]
+    project = Project.from_arrays("chain", "chain.json", "", [0, 0] + [1] * 100 + [10, 1, 1, 1], upstream)
+    project.load(backend)
+    tasks = project.tasks_by_id
+    assert project.get_project_end() == 112
+    assert (tasks[103].earliest_start, tasks[103].latest_start, tasks[103].total_float) == (100, 109, 9)
+    # The short branch keeps some float : only the task and its neighbours are visited
+    tasks[103].estimated_time = 4
+    visited_count = project.update_schedule()
+    assert (tasks[103].latest_start, tasks[103].total_float, project.get_project_end()) == (106, 6, 112)
+    schedule = get_schedule(project)
+    project.load()
+    assert get_schedule(project) == schedule
+    # The long branch delays the end of the project, so every latest start changes
+    tasks[102].estimated_time = 12
+    project.update_schedule()
+    assert (tasks[101].latest_start, project.get_project_end()) == (99, 114)
+    schedule = get_schedule(project)
+    project.load()
+    assert get_schedule(project) == schedule
+    # The NumPy backend computes everything again (see numpy_functions.update_schedule)
+    if backend == "c":
+        assert visited_count <= 5
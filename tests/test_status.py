@@ -0,0 +1,93 @@
+"""
+The tests of the propagation of the statuses : the tasks are locked while they have unfinished upstream tasks,
+and only the downstream tasks of a task are visited when its status changes.
+"""
+
+import random
+
+import pytest
+
+from Project import Project
+from TaskStatus import TaskStatus
+from conftest import make_project, modify
+
+
+@pytest.fixture
+def intersection(monkeypatch):
+    """
+    The project 0 -> 2 -> (3, 4) -> 5 -> 6 -> 1, loaded. The whole project cannot be gone through afterwards
+    """
+    project = Project.from_arrays("intersection", "intersection.json", "", [0, 0, 1, 1, 1, 1, 1],
+                                  [[], [6], [0], [2], [2], [3, 4], [5]],
+                                  statuses=[TaskStatus.FINISHED] + [TaskStatus.NOT_STARTED] * 6)
+    project.load()
+
+    def sweep(*args):
+        raise AssertionError("the statuses of the whole project were computed again")
+
+    monkeypatch.setattr(Project, "update_status", sweep)
+    monkeypatch.setattr(Project, "count_unfinished_upstream_tasks", sweep)
+    return project
+
+
+def get_statuses(project):
+    """
+    Gives the status and the number of unfinished upstream tasks of the tasks 2 to 6
+    :param project: The project
+    :return: The list of the tuples (status, unfinished_upstream_tasks_count)
+    """
+    return [(project.tasks_by_id[i].status, project.tasks_by_id[i].unfinished_upstream_tasks_count)
+            for i in range(2, 7)]
+
+
+def test_unlock(intersection):
+    tasks = intersection.tasks_by_id
+    assert get_statuses(intersection) == [(TaskStatus.NOT_STARTED, 0), (TaskStatus.LOCKED, 1), (TaskStatus.LOCKED, 1),
+                                          (TaskStatus.LOCKED, 2), (TaskStatus.LOCKED, 1)]
+    tasks[2].set_status(TaskStatus.FINISHED)
+    assert get_statuses(intersection)[1:] == [(TaskStatus.NOT_STARTED, 0), (TaskStatus.NOT_STARTED, 0),
+                                              (TaskStatus.LOCKED, 2), (TaskStatus.LOCKED, 1)]
+    # The end of the intersection waits for both of its branches
+    tasks[3].set_status(TaskStatus.FINISHED)
+    assert tasks[5].status == TaskStatus.LOCKED and tasks[5].unfinished_upstream_tasks_count == 1
+    tasks[4].set_status(TaskStatus.IN_PROGRESS)
+    assert tasks[5].status == TaskStatus.LOCKED
+    tasks[4].update_status()
+    tasks[4].update_status()
+    assert tasks[4].status == TaskStatus.FINISHED
+    assert tasks[5].status == TaskStatus.NOT_STARTED and tasks[5].unfinished_upstream_tasks_count == 0
+    assert tasks[6].status == TaskStatus.LOCKED
+
+
+def test_lock_finished_tasks(intersection):
+    tasks = intersection.tasks_by_id
+    for i in range(2, 6):
+        tasks[i].set_status(TaskStatus.FINISHED)
+    assert tasks[6].status == TaskStatus.NOT_STARTED
+    # The finished tasks downstream are locked again, and they lock their own downstream tasks
+    tasks[2].set_status(TaskStatus.IN_PROGRESS)
+    assert get_statuses(intersection) == [(TaskStatus.IN_PROGRESS, 0), (TaskStatus.LOCKED, 1), (TaskStatus.LOCKED, 1),
+                                          (TaskStatus.LOCKED, 2), (TaskStatus.LOCKED, 1)]
+
+
+def test_lock_after_new_task(intersection):
+    tasks = intersection.tasks_by_id
+    for i in range(2, 6):
+        tasks[i].set_status(TaskStatus.FINISHED)
+    intersection.add_task("N", "", 1, {tasks[5]}, False)
+    assert tasks[7].status == TaskStatus.NOT_STARTED
+    assert tasks[6].status == TaskStatus.LOCKED and tasks[6].unfinished_upstream_tasks_count == 1
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_counts_match_full_count(seed):
+    project = make_project(seed)
+    project.load()
+    rng = random.Random(seed)
+    for _ in range(30):
+        modify(project, rng)
+        counts = {task: task.unfinished_upstream_tasks_count for task in project.tasks}
+        project.count_unfinished_upstream_tasks()
+        assert {task: task.unfinished_upstream_tasks_count for task in project.tasks} == counts
+        for task in project.tasks:
+            assert (task.status == TaskStatus.LOCKED) == (task.unfinished_upstream_tasks_count != 0)
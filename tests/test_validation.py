@@ -0,0 +1,45 @@
+"""
+The tests of the validation of the structure of a project, before it is created (see utils/validation.py).
+"""
+
+import pytest
+
+import conftest  # noqa: F401, it makes the modules of src importable
+from ProjectLoadError import ProjectLoadError
+from utils import c_functions, validation
+
+# The C library checks the structure when it is loaded, Python does otherwise. Both should give the same errors
+PATHS = [pytest.param(True, marks=pytest.mark.skipif(not c_functions.available, reason="Core.so is not loaded"),
+                      id="c"),
+         pytest.param(False, id="python")]
+
+
+@pytest.fixture(params=PATHS)
+def native(request, monkeypatch):
+    monkeypatch.setattr(c_functions, "available", request.param)
+    return request.param
+
+
+def test_valid_structure(native):
+    validation.validate_structure("valid.json", [[], [3, 4], [0], [2], [2]])
+
+
+@pytest.mark.parametrize("upstream_id", [True, False, 1.0, "0", None, 5, -1])
+def test_wrong_ids(native, upstream_id):
+    with pytest.raises(ProjectLoadError) as error:
+        validation.validate_structure("wrong.json", [[], [2], [upstream_id]])
+    assert error.value.missing_ids == [(2, upstream_id)]
+    assert error.value.cycle == []
+
+
+def test_cycle(native):
+    with pytest.raises(ProjectLoadError) as error:
+        validation.validate_structure("cycle.json", [[], [2], [0, 4], [2], [3]])
+    assert error.value.cycle == [3, 4, 2]
+    assert error.value.missing_ids == []
+
+
+def test_missing_tasks(native):
+    with pytest.raises(ProjectLoadError) as error:
+        validation.validate_structure("empty.json", [[]])
+    assert error.value.missing_tasks == ["project task"]